@@ -13,6 +13,7 @@ import base64
 import json
 import io
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -398,19 +399,30 @@ Reply with ONLY a JSON object — no markdown fences, no explanation.
 # API call functions
 # ---------------------------------------------------------------------------
 
+_JSON_DECODER = json.JSONDecoder()
+
+
 def _parse_json_response(text: str) -> dict:
-    """Parse JSON from LLM response, stripping markdown fences if present."""
-    text = text.strip()
-    # Strip ```json ... ``` or ``` ... ```
-    if text.startswith("```"):
-        lines = text.split("\n")
-        # Remove first line (```json or ```)
-        lines = lines[1:]
-        # Remove last line if it's ```
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        text = "\n".join(lines).strip()
-    return json.loads(text)
+    """Parse the JSON object in an LLM response.
+
+    Decodes from each ``{`` in turn until one starts a complete object
+    and stops where that object ends, so markdown fences and prose on
+    either side (braces included) are ignored without a line split.
+    """
+    start = text.find("{")
+    if start < 0:
+        return json.loads(text)  # no object: let json report the error
+    first_error = None
+    while start >= 0:
+        try:
+            obj = _JSON_DECODER.raw_decode(text, start)[0]
+        except json.JSONDecodeError as e:
+            first_error = first_error or e
+        else:
+            if isinstance(obj, dict):
+                return obj
+        start = text.find("{", start + 1)
+    raise first_error
 
 
 def _auto_install(package: str) -> None:
@@ -421,6 +433,16 @@ def _auto_install(package: str) -> None:
         [sys.executable, "-m", "pip", "install", "-q", package])
 
 
+@lru_cache(maxsize=4)
+def _api_client(factory, api_key: str):
+    """Return an SDK client for *api_key*, built once and reused.
+
+    Keeping the client alive keeps its HTTP connection pool warm, so
+    repeat extractions skip the connect/TLS handshake.
+    """
+    return factory(api_key=api_key)
+
+
 _ANTHROPIC_MODELS = [
     ("Claude Sonnet 4", "claude-sonnet-4-20250514"),
     ("Claude Haiku 3.5", "claude-haiku-4-5-20251001"),
@@ -452,7 +474,7 @@ def _call_anthropic(b64: str, media_type: str, api_key: str,
         _auto_install("anthropic")
         import anthropic
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _api_client(anthropic.Anthropic, api_key)
     message = client.messages.create(
         model=model,
         max_tokens=2048,
@@ -487,7 +509,7 @@ def _call_openai(b64: str, media_type: str, api_key: str,
         _auto_install("openai")
         import openai
 
-    client = openai.OpenAI(api_key=api_key)
+    client = _api_client(openai.OpenAI, api_key)
     response = client.chat.completions.create(
         model=model,
         max_completion_tokens=2048,
@@ -663,7 +685,9 @@ def _trigger_download(data: dict, filename: str, output_widget) -> None:
 def _load_profile_json(file_bytes) -> dict:
     """Parse uploaded .json profile file back to AI result dict."""
     if isinstance(file_bytes, memoryview):
-        file_bytes = bytes(file_bytes)
+        # Decode straight from the upload buffer rather than copying it
+        # into a bytes object first
+        return json.loads(str(file_bytes, "utf-8-sig"))
     return json.loads(file_bytes)
 
 
@@ -717,16 +741,14 @@ def apply_ai_style(ai_result: dict, global_panel, canvas,
 
 def _apply_series_styles(series: list[dict], panels: list, canvas) -> None:
     """Match series[i] -> panels[i] by index order."""
-    orig_redraw = canvas.redraw
-    canvas.redraw = lambda: None
-    try:
+    from ._profiles import _suppress_redraw
+
+    with _suppress_redraw(canvas):
         for i, s in enumerate(series):
             if i >= len(panels):
                 break
             panel = panels[i]
             _apply_one_series(s, panel)
-    finally:
-        canvas.redraw = orig_redraw
     canvas.force_redraw()
 
 
@@ -1,6 +1,9 @@
 """Undo/redo command system for figure modifications."""
 from __future__ import annotations
 
+import time
+from collections import deque
+from collections.abc import Hashable
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
@@ -52,15 +55,84 @@ class BatchCommand:
             cmd.undo()
 
 
+@dataclass
+class UniformBatchCommand:
+    """One property set to the same value on many artists, as one undo step.
+
+    Equivalent to a BatchCommand of per-artist Commands, but stores the old
+    values in a flat list instead of allocating a Command per artist.
+    """
+
+    artists: list[Any]
+    property_name: str
+    old_values: list[Any]
+    new_value: Any
+    description: str = ""
+
+    def execute(self) -> None:
+        name = f"set_{self.property_name}"
+        new = self.new_value
+        for artist in self.artists:
+            getattr(artist, name)(new)
+
+    def undo(self) -> None:
+        name = f"set_{self.property_name}"
+        for artist, old in zip(reversed(self.artists),
+                               reversed(self.old_values)):
+            getattr(artist, name)(old)
+
+    @classmethod
+    def capture(cls, artists, property_name: str, new_value: Any,
+                description: str = "") -> UniformBatchCommand:
+        """Build the command, reading each artist's current value as old."""
+        artists = list(artists)
+        getter = f"get_{property_name}"
+        return cls(artists, property_name,
+                   [getattr(a, getter)() for a in artists],
+                   new_value, description)
+
+
+@dataclass
+class _Coalesced:
+    """Consecutive commands on the same target collapsed into one undo step.
+
+    Undo replays the first command's undo (state before the drag), redo
+    the last command's execute (state at release).
+    """
+
+    first: Any
+    last: Any
+
+    @property
+    def description(self) -> str:
+        return self.last.description
+
+    def execute(self) -> None:
+        self.last.execute()
+
+    def undo(self) -> None:
+        self.first.undo()
+
+
 class CommandStack:
     """Manages undo/redo stacks with a maximum depth."""
 
+    # Commands sharing a merge_key within this many seconds of each other
+    # are one gesture (a slider drag) and share one undo entry
+    _MERGE_WINDOW_S = 1.0
+
     def __init__(self, max_depth: int = 100,
                  on_change: Callable[[], None] | None = None):
-        self._undo_stack: list[Command | BatchCommand] = []
-        self._redo_stack: list[Command | BatchCommand] = []
+        # Bounded ring buffer: once full, pushing drops the oldest entry in
+        # O(1) instead of shifting the whole list with pop(0)
+        self._undo_stack: deque[Command | BatchCommand | UniformBatchCommand] = \
+            deque(maxlen=max_depth)
+        self._redo_stack: list[Command | BatchCommand | UniformBatchCommand] = []
         self._max_depth = max_depth
         self._on_change = on_change
+        # merge_key of the top undo entry and when it was last extended
+        self._merge_key: Hashable | None = None
+        self._merge_time = 0.0
 
     @property
     def can_undo(self) -> bool:
@@ -71,24 +143,53 @@ class CommandStack:
         return len(self._redo_stack) > 0
 
     @property
-    def history(self) -> list[Command | BatchCommand]:
+    def history(self) -> list[Command | BatchCommand | UniformBatchCommand]:
         return list(self._undo_stack)
 
-    def execute(self, cmd: Command | BatchCommand) -> None:
-        """Execute a command and push it onto the undo stack."""
+    def execute(self, cmd: Command | BatchCommand | UniformBatchCommand,
+                merge_key: Hashable | None = None) -> None:
+        """Execute a command and push it onto the undo stack.
+
+        Pass a *merge_key* identifying the control and target for
+        continuous gestures: consecutive commands with the same key are
+        folded into the previous undo entry instead of adding one each.
+        """
         cmd.execute()
-        self._undo_stack.append(cmd)
-        if len(self._undo_stack) > self._max_depth:
-            self._undo_stack.pop(0)
+        if self.continues(merge_key):
+            top = self._undo_stack[-1]
+            if isinstance(top, _Coalesced):
+                top.last = cmd
+            else:
+                self._undo_stack[-1] = _Coalesced(top, cmd)
+        else:
+            self._undo_stack.append(cmd)
+        self._merge_key = merge_key
+        self._merge_time = time.monotonic()
         self._redo_stack.clear()
         if self._on_change:
             self._on_change()
 
+    def continues(self, merge_key: Hashable | None) -> bool:
+        """Whether a command with *merge_key* would fold into the top entry.
+
+        A folded command is only ever redone, never undone, so callers can
+        skip snapshotting expensive old values when this is True.
+        """
+        if (merge_key is None or merge_key != self._merge_key
+                or not self._undo_stack):
+            return False
+        now = time.monotonic()
+        if now - self._merge_time > self._MERGE_WINDOW_S:
+            return False
+        self._merge_time = now  # keep the answer valid until execute()
+        return True
+
     def undo(self) -> None:
         if not self._undo_stack:
             return
         cmd = self._undo_stack.pop()
         cmd.undo()
+        self._merge_key = None
         self._redo_stack.append(cmd)
         if self._on_change:
             self._on_change()
@@ -98,6 +199,7 @@ class CommandStack:
             return
         cmd = self._redo_stack.pop()
         cmd.execute()
+        self._merge_key = None
         self._undo_stack.append(cmd)
         if self._on_change:
             self._on_change()
@@ -105,5 +207,6 @@ class CommandStack:
     def clear(self) -> None:
         self._undo_stack.clear()
         self._redo_stack.clear()
+        self._merge_key = None
         if self._on_change:
             self._on_change()
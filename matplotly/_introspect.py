@@ -1,6 +1,7 @@
 """Figure introspection — detect and classify all artists in a matplotlib figure."""
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
 import matplotlib.pyplot as plt
@@ -13,13 +14,151 @@ from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
 from matplotlib.patches import PathPatch, Rectangle
 
-from ._types import ArtistGroup, PlotType
+from ._types import ArtistGroup, LazyMetadata, PlotType
+
+try:  # optional: pip install "matplotly[fast]"
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+
+# ---------------------------------------------------------------------------
+# Color helpers
+# ---------------------------------------------------------------------------
+
+def _as_hex(color) -> str:
+    """``to_hex`` with a fast path for colors already stored as ``#rrggbb``."""
+    if isinstance(color, str) and len(color) == 7 and color[0] == "#":
+        return color.lower()
+    return to_hex(color)
+
+
+# ---------------------------------------------------------------------------
+# Artist classification
+# ---------------------------------------------------------------------------
+
+# Exact-type dispatch for containers and collections.  Subclasses (e.g.
+# FillBetweenPolyCollection) are resolved once via issubclass and cached,
+# so classifying an artist costs a single dict lookup.
+_KIND_BY_TYPE: dict[type, str | None] = {
+    BarContainer: "bar",
+    ErrorbarContainer: "errorbar",
+    PathCollection: "scatter",
+    PolyCollection: "poly",
+    LineCollection: "line",
+    QuadMesh: "quadmesh",
+}
+_KIND_BASES = tuple(_KIND_BY_TYPE.items())
+
+# Patch types that can form a patch_artist boxplot box
+_BOX_PATCH_TYPES = (Rectangle, PathPatch)
+
+
+def _artist_kind(obj) -> str | None:
+    """Return the detector kind for *obj*, or None if no detector wants it."""
+    t = type(obj)
+    if t in _KIND_BY_TYPE:
+        return _KIND_BY_TYPE[t]
+    kind = next((k for base, k in _KIND_BASES if issubclass(t, base)), None)
+    _KIND_BY_TYPE[t] = kind
+    return kind
+
+
+def _bucket_by_kind(*seqs) -> dict[str, list]:
+    """Split artists into per-kind lists in one pass, preserving order."""
+    buckets: dict[str, list] = {}
+    kind_of, bucket = _artist_kind, buckets.setdefault
+    for seq in seqs:
+        for obj in seq:
+            kind = kind_of(obj)
+            if kind is not None:
+                bucket(kind, []).append(obj)
+    return buckets
+
+
+# ---------------------------------------------------------------------------
+# Histogram bin check
+# ---------------------------------------------------------------------------
+
+def _hist_bins_loop(xs, widths):
+    """Scalar-loop bin check, compiled with numba when it is installed.
+
+    ``xs``/``widths`` are x-sorted float arrays (len >= 1).  Bins pass when
+    there are at most two distinct widths (rounded to 6 dp) and every gap
+    between neighbours is under 10% of the first width.
+    """
+    n = xs.shape[0]
+    w0 = round(widths[0], 6)
+    w1 = w0
+    for i in range(1, n):
+        w = round(widths[i], 6)
+        if w != w0 and w != w1:
+            if w1 != w0:
+                return False
+            w1 = w
+    tol = widths[0] * 0.1
+    for i in range(n - 1):
+        # Written as not(<) so a NaN gap fails, as in the NumPy version
+        if not (abs(xs[i + 1] - (xs[i] + widths[i])) < tol):
+            return False
+    return True
+
+
+def _hist_bins_numpy(xs, widths):
+    """Vectorized equivalent of _hist_bins_loop."""
+    # All bins should be roughly the same width
+    if len(np.unique(np.round(widths, 6))) > 2:
+        return False
+    # Bins should be contiguous (no gaps)
+    gaps = xs[1:] - (xs[:-1] + widths[:-1])
+    return bool(np.all(np.abs(gaps) < widths[0] * 0.1))
+
+
+_hist_bins_ok = (_njit(cache=True)(_hist_bins_loop) if _njit is not None
+                 else _hist_bins_numpy)
+
+
+# ---------------------------------------------------------------------------
+# Errorbar style helpers (evaluated lazily via LazyMetadata)
+# ---------------------------------------------------------------------------
+
+_LS_NAMES = {"solid": "-", "dashed": "--", "dotted": ":", "dashdot": "-."}
+
+
+def _line_width(line) -> float:
+    return float(line.get_linewidth())
+
+
+def _line_style(line) -> str:
+    ls = line.get_linestyle()
+    return _LS_NAMES.get(ls, ls)
+
+
+def _errorbar_line_width(barlinecols) -> float:
+    """Error bar line width from the first barline collection."""
+    if not barlinecols:
+        return 1.5
+    try:
+        lws = barlinecols[0].get_linewidths()
+        return float(lws[0]) if len(lws) > 0 else 1.5
+    except Exception:
+        return 1.5
+
+
+def _errorbar_cap_size(caplines) -> float:
+    if not caplines:
+        return 0.0
+    try:
+        return float(caplines[0].get_markersize())
+    except Exception:
+        return 3.0
 
 
 # ---------------------------------------------------------------------------
 # Boxplot helpers
 # ---------------------------------------------------------------------------
 
+
 def _get_patch_data_bounds(patch):
     """Get patch bounds in data coordinates."""
     path = patch.get_path()
@@ -469,13 +608,25 @@ class FigureIntrospector:
 
     def __init__(self, fig: Figure):
         self._fig = fig
-        self._claimed: set[int] = set()  # id() of already-classified artists
+        # Claimed (already-classified) artists are tagged with an attribute
+        # namespaced to this introspector; introspect() removes the tags.
+        self._claim_attr = f"_matplotly_claim_{id(self):x}"
+        self._tagged: list = []
 
     def _claim(self, artist: Any) -> None:
-        self._claimed.add(id(artist))
+        if not getattr(artist, self._claim_attr, False):
+            setattr(artist, self._claim_attr, True)
+            self._tagged.append(artist)
 
     def _is_claimed(self, artist: Any) -> bool:
-        return id(artist) in self._claimed
+        return getattr(artist, self._claim_attr, False)
+
+    def _release_claims(self) -> None:
+        """Strip claim tags so user figures are left untouched."""
+        attr = self._claim_attr
+        for artist in self._tagged:
+            artist.__dict__.pop(attr, None)
+        self._tagged.clear()
 
     def introspect(self) -> list[ArtistGroup]:
         groups: list[ArtistGroup] = []
@@ -485,23 +636,34 @@ class FigureIntrospector:
                      and not hasattr(a, '_colorbar')]
         nrows, ncols = self._grid_shape(axes_list)
 
-        for idx, ax in enumerate(axes_list):
-            row, col = divmod(idx, max(ncols, 1))
-            subplot_index = (row, col)
-
-            # Detection order matters — earlier detectors claim artists.
-            # Errorbars before boxplots: errorbar uses precise container
-            # matching; boxplot uses line-count heuristics that can
-            # misfire on unclaimed errorbar cap/data lines.
-            groups.extend(self._detect_heatmaps(ax, subplot_index))
-            groups.extend(self._detect_errorbars(ax, subplot_index))
-            groups.extend(self._detect_boxplots(ax, subplot_index))
-            groups.extend(self._detect_lines(ax, subplot_index))
-            groups.extend(self._detect_bars(ax, subplot_index))
-            groups.extend(self._detect_scatter(ax, subplot_index))
-            groups.extend(self._detect_violins(ax, subplot_index))
-            groups.extend(self._detect_fill(ax, subplot_index))
+        try:
+            for idx, ax in enumerate(axes_list):
+                row, col = divmod(idx, max(ncols, 1))
+                subplot_index = (row, col)
+
+                # Nothing any detector looks at — skip the whole pass.
+                containers = getattr(ax, "containers", ())
+                if not (ax.lines or ax.collections or containers
+                        or ax.images):
+                    continue
 
+                # Classify containers/collections once; detectors read their
+                # own bucket instead of rescanning the axes.
+                kinds = _bucket_by_kind(containers, ax.collections)
+
+                # Detection order matters — earlier detectors claim artists.
+                # Errorbars before boxplots: errorbar uses precise container
+                # matching; boxplot uses line-count heuristics that can
+                # misfire on unclaimed errorbar cap/data lines.
+                groups.extend(self._detect_heatmaps(ax, subplot_index, kinds))
+                groups.extend(self._detect_errorbars(ax, subplot_index, kinds))
+                groups.extend(self._detect_boxplots(ax, subplot_index))
+                groups.extend(self._detect_lines(ax, subplot_index))
+                groups.extend(self._detect_bars(ax, subplot_index, kinds))
+                groups.extend(
+                    self._detect_collections(ax, subplot_index, kinds))
+        finally:
+            self._release_claims()
         return groups
 
     # ------------------------------------------------------------------
@@ -529,7 +691,7 @@ class FigureIntrospector:
     # Detectors
     # ------------------------------------------------------------------
 
-    def _detect_heatmaps(self, ax, subplot_index) -> list[ArtistGroup]:
+    def _detect_heatmaps(self, ax, subplot_index, kinds) -> list[ArtistGroup]:
         """Detect heatmaps from imshow (AxesImage) and pcolormesh (QuadMesh)."""
         groups: list[ArtistGroup] = []
 
@@ -591,11 +753,9 @@ class FigureIntrospector:
                 subplot_index=subplot_index, metadata=metadata))
 
         # pcolormesh → QuadMesh
-        for coll in ax.collections:
+        for coll in kinds.get("quadmesh", ()):
             if self._is_claimed(coll):
                 continue
-            if not isinstance(coll, QuadMesh):
-                continue
             self._claim(coll)
             data = coll.get_array()
             if data is not None:
@@ -661,9 +821,10 @@ class FigureIntrospector:
         groups: list[ArtistGroup] = []
 
         # Collect all _-prefixed Line2D (internal lines)
+        is_claimed = self._is_claimed
         internal_lines = [l for l in ax.lines
-                          if l.get_label().startswith("_")
-                          and not self._is_claimed(l)]
+                          if not is_claimed(l)
+                          and l.get_label().startswith("_")]
         if len(internal_lines) < 5:
             return groups
 
@@ -672,9 +833,9 @@ class FigureIntrospector:
         # These have empty labels or '_'-prefixed labels, and non-zero extents.
         box_patches = []
         for p in ax.patches:
-            if self._is_claimed(p):
+            if is_claimed(p):
                 continue
-            if not isinstance(p, (Rectangle, PathPatch)):
+            if not isinstance(p, _BOX_PATCH_TYPES):
                 continue
             lbl = p.get_label()
             if lbl and not lbl.startswith("_"):
@@ -793,166 +954,151 @@ class FigureIntrospector:
         if not segs or len(segs) != len(x_data):
             return None
 
-        err_lo = np.empty(len(segs))
-        err_hi = np.empty(len(segs))
-        for i, seg in enumerate(segs):
-            if len(seg) < 2:
-                err_lo[i] = err_hi[i] = 0.0
-                continue
-            if axis == 'y':
-                centre = float(y_data[i])
-                err_lo[i] = centre - float(seg[0, 1])
-                err_hi[i] = float(seg[1, 1]) - centre
-            else:
-                centre = float(x_data[i])
-                err_lo[i] = centre - float(seg[0, 0])
-                err_hi[i] = float(seg[1, 0]) - centre
+        col = 1 if axis == 'y' else 0
+        centres = np.asarray(y_data if axis == 'y' else x_data, dtype=float)
+        try:
+            arr = np.asarray(segs, dtype=float)
+        except ValueError:
+            arr = None  # ragged segment list
+
+        if arr is not None and arr.ndim == 3 and arr.shape[1] >= 2:
+            # Uniform (N, 2, 2) segments: one vectorized subtract
+            err_lo = centres - arr[:, 0, col]
+            err_hi = arr[:, 1, col] - centres
+        else:
+            err_lo = np.empty(len(segs))
+            err_hi = np.empty(len(segs))
+            for i, seg in enumerate(segs):
+                if len(seg) < 2:
+                    err_lo[i] = err_hi[i] = 0.0
+                    continue
+                err_lo[i] = centres[i] - float(seg[0][col])
+                err_hi[i] = float(seg[1][col]) - centres[i]
 
         # Symmetric when lo ≈ hi everywhere
         if np.allclose(err_lo, err_hi, atol=1e-10):
             return err_hi  # 1-D
         return np.array([err_lo, err_hi])  # 2×N
 
-    def _detect_errorbars(self, ax, subplot_index) -> list[ArtistGroup]:
+    def _detect_errorbars(self, ax, subplot_index, kinds) -> list[ArtistGroup]:
         groups: list[ArtistGroup] = []
 
         # Identify ErrorbarContainers owned by BarContainers (from yerr/xerr)
         # These are managed by BarPanel, not ErrorbarPanel.
         bar_owned_ebs: set[int] = set()
-        for c in getattr(ax, "containers", []):
-            if isinstance(c, BarContainer):
-                eb = getattr(c, 'errorbar', None)
-                if eb is not None:
-                    bar_owned_ebs.add(id(eb))
-                    # Claim errorbar artists so they don't appear in other panels
-                    if eb[0] is not None:
-                        self._claim(eb[0])
-                    for cap in eb[1]:
-                        self._claim(cap)
-                    for barcol in eb[2]:
-                        self._claim(barcol)
-
-        for container in getattr(ax, "containers", []):
-            if isinstance(container, ErrorbarContainer):
-                if id(container) in bar_owned_ebs:
-                    continue  # Skip bar-owned error bars
-                artists = []
-                data_line = container[0]
-                if data_line is not None:
-                    artists.append(data_line)
-                    self._claim(data_line)
-                caplines = list(container[1])
-                barlinecols = list(container[2])
-                for cap in caplines:
-                    artists.append(cap)
+        for c in kinds.get("bar", ()):
+            eb = getattr(c, 'errorbar', None)
+            if eb is not None:
+                bar_owned_ebs.add(id(eb))
+                # Claim errorbar artists so they don't appear in other panels
+                if eb[0] is not None:
+                    self._claim(eb[0])
+                for cap in eb[1]:
                     self._claim(cap)
-                for barcol in barlinecols:
-                    artists.append(barcol)
+                for barcol in eb[2]:
                     self._claim(barcol)
 
-                # Container holds the user-visible label; data_line is
-                # typically "_nolegend_".
-                label = container.get_label() if hasattr(
-                    container, 'get_label') else None
-                if not label or label.startswith("_"):
-                    label = (data_line.get_label()
-                             if data_line else "Error bars")
-                if label.startswith("_"):
-                    label = "Error bars"
-
-                # --- Enrich metadata for panel + code gen ---
-                metadata: dict = {"container": container}
-
-                if data_line is not None:
-                    x_data = np.asarray(data_line.get_xdata(), dtype=float)
-                    y_data = np.asarray(data_line.get_ydata(), dtype=float)
-                    metadata["x_data"] = x_data
-                    metadata["y_data"] = y_data
-
-                    # Data line style
-                    try:
-                        metadata["color"] = to_hex(data_line.get_color())
-                    except Exception:
-                        metadata["color"] = "#1f77b4"
-                    metadata["line_width"] = float(data_line.get_linewidth())
-                    ls = data_line.get_linestyle()
-                    _ls_map = {
-                        "solid": "-", "dashed": "--",
-                        "dotted": ":", "dashdot": "-.",
-                    }
-                    metadata["line_style"] = _ls_map.get(ls, ls)
-                    metadata["marker"] = data_line.get_marker() or ""
-                    if metadata["marker"] in ("None", "none"):
-                        metadata["marker"] = ""
-                    metadata["marker_size"] = float(
-                        data_line.get_markersize())
-                    metadata["alpha"] = (
-                        data_line.get_alpha()
-                        if data_line.get_alpha() is not None else 1.0)
-
-                    # Error bar line width (from barlinecols)
-                    if barlinecols:
-                        try:
-                            lws = barlinecols[0].get_linewidths()
-                            metadata["bar_lw"] = float(lws[0]) if len(
-                                lws) > 0 else 1.5
-                        except Exception:
-                            metadata["bar_lw"] = 1.5
-                    else:
-                        metadata["bar_lw"] = 1.5
-
-                    # Cap size
-                    if caplines:
-                        try:
-                            metadata["cap_size"] = float(
-                                caplines[0].get_markersize())
-                        except Exception:
-                            metadata["cap_size"] = 3.0
-                    else:
-                        metadata["cap_size"] = 0.0
-
-                    # Extract error magnitudes
-                    # Separate y-error and x-error barlinecols
-                    has_yerr = container.has_yerr if hasattr(
-                        container, 'has_yerr') else bool(barlinecols)
-                    has_xerr = container.has_xerr if hasattr(
-                        container, 'has_xerr') else False
-
-                    metadata["has_yerr"] = has_yerr
-                    metadata["has_xerr"] = has_xerr
-
-                    if has_yerr:
-                        # y-error bars are the first barlinecol
-                        yerr = self._extract_error_from_segments(
-                            barlinecols[:1], x_data, y_data, axis='y')
-                        metadata["yerr"] = yerr
-                    if has_xerr:
-                        # x-error bars may be second barlinecol
-                        xerr_cols = barlinecols[1:2] if has_yerr else barlinecols[:1]
-                        xerr = self._extract_error_from_segments(
-                            xerr_cols, x_data, y_data, axis='x')
-                        metadata["xerr"] = xerr
-
-                groups.append(ArtistGroup(
-                    plot_type=PlotType.ERRORBAR,
-                    axes=ax,
-                    artists=artists,
-                    label=f"Errorbar: {label}",
-                    subplot_index=subplot_index,
-                    metadata=metadata,
-                ))
+        for container in kinds.get("errorbar", ()):
+            if id(container) in bar_owned_ebs:
+                continue  # Skip bar-owned error bars
+            artists = []
+            data_line = container[0]
+            if data_line is not None:
+                artists.append(data_line)
+                self._claim(data_line)
+            caplines = list(container[1])
+            barlinecols = list(container[2])
+            for cap in caplines:
+                artists.append(cap)
+                self._claim(cap)
+            for barcol in barlinecols:
+                artists.append(barcol)
+                self._claim(barcol)
+
+            # Container holds the user-visible label; data_line is
+            # typically "_nolegend_".
+            label = container.get_label() if hasattr(
+                container, 'get_label') else None
+            if not label or label.startswith("_"):
+                label = (data_line.get_label()
+                         if data_line else "Error bars")
+            if label.startswith("_"):
+                label = "Error bars"
+
+            # --- Enrich metadata for panel + code gen ---
+            metadata: dict = {"container": container}
+
+            if data_line is not None:
+                x_data = np.asarray(data_line.get_xdata(), dtype=float)
+                y_data = np.asarray(data_line.get_ydata(), dtype=float)
+                metadata["x_data"] = x_data
+                metadata["y_data"] = y_data
+
+                # Data line style
+                try:
+                    metadata["color"] = _as_hex(data_line.get_color())
+                except Exception:
+                    metadata["color"] = "#1f77b4"
+                metadata["marker"] = data_line.get_marker() or ""
+                if metadata["marker"] in ("None", "none"):
+                    metadata["marker"] = ""
+                metadata["marker_size"] = float(
+                    data_line.get_markersize())
+                metadata["alpha"] = (
+                    data_line.get_alpha()
+                    if data_line.get_alpha() is not None else 1.0)
+
+                # Separate y-error and x-error barlinecols
+                has_yerr = container.has_yerr if hasattr(
+                    container, 'has_yerr') else bool(barlinecols)
+                has_xerr = container.has_xerr if hasattr(
+                    container, 'has_xerr') else False
+
+                metadata["has_yerr"] = has_yerr
+                metadata["has_xerr"] = has_xerr
+
+                # Style lookups and error extraction are deferred until
+                # a panel actually reads them.
+                lazy = {
+                    "line_width": partial(_line_width, data_line),
+                    "line_style": partial(_line_style, data_line),
+                    "bar_lw": partial(_errorbar_line_width, barlinecols),
+                    "cap_size": partial(_errorbar_cap_size, caplines),
+                }
+                if has_yerr:
+                    # y-error bars are the first barlinecol
+                    lazy["yerr"] = partial(
+                        self._extract_error_from_segments,
+                        barlinecols[:1], x_data, y_data, axis='y')
+                if has_xerr:
+                    # x-error bars may be second barlinecol
+                    xerr_cols = barlinecols[1:2] if has_yerr else barlinecols[:1]
+                    lazy["xerr"] = partial(
+                        self._extract_error_from_segments,
+                        xerr_cols, x_data, y_data, axis='x')
+                metadata = LazyMetadata(metadata, lazy=lazy)
+
+            groups.append(ArtistGroup(
+                plot_type=PlotType.ERRORBAR,
+                axes=ax,
+                artists=artists,
+                label=f"Errorbar: {label}",
+                subplot_index=subplot_index,
+                metadata=metadata,
+            ))
         return groups
 
     def _detect_lines(self, ax, subplot_index) -> list[ArtistGroup]:
         groups: list[ArtistGroup] = []
+        is_claimed, claim = self._is_claimed, self._claim
         for line in ax.lines:
-            if self._is_claimed(line):
+            if is_claimed(line):
                 continue
             label = line.get_label()
             if label.startswith("_"):
                 # skip internal matplotlib lines
                 continue
-            self._claim(line)
+            claim(line)
             groups.append(ArtistGroup(
                 plot_type=PlotType.LINE,
                 axes=ax,
@@ -963,42 +1109,59 @@ class FigureIntrospector:
         return groups
 
     @staticmethod
-    def _is_histogram_container(container: BarContainer) -> bool:
-        """Check if a BarContainer looks like a histogram (contiguous equal-width bins)."""
+    def _sorted_bin_geometry(container: BarContainer):
+        """Return ``(patches, xs, widths)`` for a container, sorted by x.
+
+        Only Rectangle patches are included; ``xs``/``widths`` are float
+        arrays aligned with the sorted patch list.
+        """
         patches = [p for p in container.patches if isinstance(p, Rectangle)]
-        if len(patches) < 5:
+        n = len(patches)
+        xs = np.fromiter((p.get_x() for p in patches), dtype=float, count=n)
+        widths = np.fromiter((p.get_width() for p in patches),
+                             dtype=float, count=n)
+        order = np.argsort(xs, kind="stable")
+        return [patches[i] for i in order], xs[order], widths[order]
+
+    @staticmethod
+    def _is_histogram_geometry(xs: np.ndarray, widths: np.ndarray) -> bool:
+        """Contiguous, (near) equal-width bins — see _sorted_bin_geometry."""
+        if len(xs) < 5:
             return False
-        patches_sorted = sorted(patches, key=lambda r: r.get_x())
-        widths = [r.get_width() for r in patches_sorted]
-        # All bins should be roughly the same width
-        if len(set(round(w, 6) for w in widths)) > 2:
+        return bool(_hist_bins_ok(xs, widths))
+
+    @staticmethod
+    def _is_histogram_container(container: BarContainer) -> bool:
+        """Check if a BarContainer looks like a histogram (contiguous equal-width bins)."""
+        if len(container.patches) < 5:
             return False
-        # Bins should be contiguous (no gaps)
-        xs = [r.get_x() for r in patches_sorted]
-        gaps = [xs[i + 1] - (xs[i] + widths[i]) for i in range(len(xs) - 1)]
-        return all(abs(g) < widths[0] * 0.1 for g in gaps)
+        _, xs, widths = FigureIntrospector._sorted_bin_geometry(container)
+        return FigureIntrospector._is_histogram_geometry(xs, widths)
 
-    def _detect_bars(self, ax, subplot_index) -> list[ArtistGroup]:
+    def _detect_bars(self, ax, subplot_index, kinds) -> list[ArtistGroup]:
         groups: list[ArtistGroup] = []
-        bar_containers = [c for c in getattr(ax, "containers", [])
-                          if isinstance(c, BarContainer)]
+        bar_containers = kinds.get("bar", ())
         non_hist_containers = []
+        is_claimed, claim = self._is_claimed, self._claim
 
         # First pass: detect histograms
         for container in bar_containers:
-            if self._is_histogram_container(container):
-                artists = []
-                for patch in container.patches:
-                    if not self._is_claimed(patch):
-                        artists.append(patch)
-                        self._claim(patch)
-                if artists:
-                    sorted_artists = sorted(artists, key=lambda r: r.get_x())
-
-                    # Build bin edges and heights
-                    bin_edges = ([r.get_x() for r in sorted_artists]
-                                 + [sorted_artists[-1].get_x()
-                                    + sorted_artists[-1].get_width()])
+            rects, xs, widths = self._sorted_bin_geometry(container)
+            if self._is_histogram_geometry(xs, widths):
+                # Reuse the x-sorted order from the histogram check
+                sorted_artists = []
+                for patch in rects:
+                    if not is_claimed(patch):
+                        sorted_artists.append(patch)
+                        claim(patch)
+                if sorted_artists:
+                    # Build bin edges and heights, reusing the arrays from
+                    # the histogram check when no patch was pre-claimed
+                    if len(sorted_artists) != len(rects):
+                        xs = np.array([r.get_x() for r in sorted_artists])
+                        widths = np.array(
+                            [r.get_width() for r in sorted_artists])
+                    bin_edges = xs.tolist() + [float(xs[-1] + widths[-1])]
                     bin_heights = [r.get_height() for r in sorted_artists]
 
                     # Reconstruct approximate raw data from bin geometry
@@ -1021,10 +1184,8 @@ class FigureIntrospector:
                     # Detect orientation: vertical bars have varying height,
                     # horizontal bars have varying width
                     orientation = "vertical"
-                    widths = [r.get_width() for r in sorted_artists]
-                    heights = [r.get_height() for r in sorted_artists]
-                    if (len(set(round(h, 6) for h in heights)) <= 2
-                            and len(set(round(w, 6) for w in widths)) > 2):
+                    if (len(set(round(h, 6) for h in bin_heights)) <= 2
+                            and len(np.unique(np.round(widths, 6))) > 2):
                         orientation = "horizontal"
 
                     zorder = sorted_artists[0].get_zorder()
@@ -1052,9 +1213,9 @@ class FigureIntrospector:
         for container in non_hist_containers:
             artists = []
             for patch in container.patches:
-                if not self._is_claimed(patch):
+                if not is_claimed(patch):
                     artists.append(patch)
-                    self._claim(patch)
+                    claim(patch)
             if not artists:
                 continue
 
@@ -1062,28 +1223,29 @@ class FigureIntrospector:
             if label.startswith("_"):
                 label = "bars"
 
-            # Extract bar geometry
-            sorted_patches = sorted(artists, key=lambda r: r.get_x())
-            widths = [r.get_width() for r in sorted_patches]
-            heights = [r.get_height() for r in sorted_patches]
+            # Extract bar geometry: one getter call per patch and field,
+            # then sort/derive column-wise in numpy
+            x, y, w, h = np.array(
+                [(r.get_x(), r.get_y(), r.get_width(), r.get_height())
+                 for r in artists], dtype=float).reshape(-1, 4).T
 
             # Detect orientation: consistent heights + varying widths = horizontal
-            if (len(set(round(h, 6) for h in heights)) <= 1
-                    and len(set(round(w, 6) for w in widths)) > 1):
+            if (len(np.unique(h.round(6))) <= 1
+                    and len(np.unique(w.round(6))) > 1):
                 orientation = "horizontal"
-                sorted_patches = sorted(artists, key=lambda r: r.get_y())
-                positions = [r.get_y() + r.get_height() / 2
-                             for r in sorted_patches]
-                values = [r.get_width() for r in sorted_patches]
-                bottoms = [r.get_x() for r in sorted_patches]
-                bar_width = sorted_patches[0].get_height()
+                order = np.argsort(y, kind="stable")
+                positions = (y + h / 2)[order].tolist()
+                values = w[order].tolist()
+                bottoms = x[order].tolist()
+                bar_width = float(h[order[0]])
             else:
                 orientation = "vertical"
-                positions = [r.get_x() + r.get_width() / 2
-                             for r in sorted_patches]
-                values = [r.get_height() for r in sorted_patches]
-                bottoms = [r.get_y() for r in sorted_patches]
-                bar_width = sorted_patches[0].get_width()
+                order = np.argsort(x, kind="stable")
+                positions = (x + w / 2)[order].tolist()
+                values = h[order].tolist()
+                bottoms = y[order].tolist()
+                bar_width = float(w[order[0]])
+            sorted_patches = [artists[i] for i in order.tolist()]
 
             metadata = {
                 "container": container,
@@ -1131,7 +1293,7 @@ class FigureIntrospector:
                     try:
                         colors = barlinecols[0].get_colors()
                         if len(colors) > 0:
-                            metadata["errbar_color"] = to_hex(colors[0])
+                            metadata["errbar_color"] = _as_hex(colors[0])
                     except Exception:
                         pass
                     try:
@@ -1152,39 +1314,62 @@ class FigureIntrospector:
             ))
         return groups
 
-    def _detect_scatter(self, ax, subplot_index) -> list[ArtistGroup]:
-        groups: list[ArtistGroup] = []
-        for coll in ax.collections:
+    def _detect_collections(self, ax, subplot_index,
+                            kinds) -> list[ArtistGroup]:
+        """Detect scatter, violin and fill groups in one pass.
+
+        PathCollections become scatter groups, filled PolyCollections are
+        grouped into a single violin group, and any PolyCollection left
+        unclaimed afterwards is a fill_between area.
+        """
+        scatter_groups: list[ArtistGroup] = []
+        for coll in kinds.get("scatter", ()):
             if self._is_claimed(coll):
                 continue
-            if isinstance(coll, PathCollection):
-                self._claim(coll)
-                label = coll.get_label()
-                if label.startswith("_"):
-                    label = "scatter"
-                groups.append(ArtistGroup(
-                    plot_type=PlotType.SCATTER,
-                    axes=ax,
-                    artists=[coll],
-                    label=f"Scatter: {label}",
-                    subplot_index=subplot_index,
-                ))
-        return groups
-
-    def _detect_violins(self, ax, subplot_index) -> list[ArtistGroup]:
-        """Detect violin plots: group all violin bodies + stat lines together."""
-        groups: list[ArtistGroup] = []
+            self._claim(coll)
+            label = coll.get_label()
+            if label.startswith("_"):
+                label = "scatter"
+            scatter_groups.append(ArtistGroup(
+                plot_type=PlotType.SCATTER,
+                axes=ax,
+                artists=[coll],
+                label=f"Scatter: {label}",
+                subplot_index=subplot_index,
+            ))
 
-        # Collect all unclaimed PolyCollections with fill (violin bodies)
+        polys = []
         violin_bodies = []
-        for coll in ax.collections:
+        for coll in kinds.get("poly", ()):
             if self._is_claimed(coll):
                 continue
-            if isinstance(coll, PolyCollection):
-                fc = coll.get_facecolor()
-                if fc is not None and len(fc) > 0 and fc[0][3] > 0:
-                    violin_bodies.append(coll)
+            polys.append(coll)
+            fc = coll.get_facecolor()
+            if fc is not None and len(fc) > 0 and fc[0][3] > 0:
+                violin_bodies.append(coll)
+
+        violin_groups = self._violin_groups(
+            ax, subplot_index, violin_bodies, kinds.get("line", ()))
+
+        fill_groups: list[ArtistGroup] = []
+        for coll in polys:
+            if self._is_claimed(coll):
+                continue
+            self._claim(coll)
+            fill_groups.append(ArtistGroup(
+                plot_type=PlotType.FILL_BETWEEN,
+                axes=ax,
+                artists=[coll],
+                label="Fill",
+                subplot_index=subplot_index,
+            ))
 
+        return scatter_groups + violin_groups + fill_groups
+
+    def _violin_groups(self, ax, subplot_index, violin_bodies,
+                       line_colls) -> list[ArtistGroup]:
+        """Group all violin bodies + stat lines together."""
+        groups: list[ArtistGroup] = []
         if not violin_bodies:
             return groups
 
@@ -1210,20 +1395,19 @@ class FigureIntrospector:
 
         # Find associated stat lines (LineCollections from violinplot)
         stat_lines = []
-        for coll in ax.collections:
+        for coll in line_colls:
             if self._is_claimed(coll):
                 continue
-            if isinstance(coll, LineCollection):
-                # Check if it aligns with violin positions
-                try:
-                    segs = coll.get_segments()
-                    if segs:
-                        seg_x = float(np.mean([s[:, 0].mean() for s in segs]))
-                        if any(abs(seg_x - p) < 1.0 for p in positions):
-                            stat_lines.append(coll)
-                            self._claim(coll)
-                except Exception:
-                    pass
+            # Check if it aligns with violin positions
+            try:
+                segs = coll.get_segments()
+                if segs:
+                    seg_x = float(np.mean([s[:, 0].mean() for s in segs]))
+                    if any(abs(seg_x - p) < 1.0 for p in positions):
+                        stat_lines.append(coll)
+                        self._claim(coll)
+            except Exception:
+                pass
 
         # Detect orientation
         orientation = "vertical"
@@ -1244,19 +1428,3 @@ class FigureIntrospector:
             label=f"Violin ({n_violins} violins)",
             subplot_index=subplot_index, metadata=metadata))
         return groups
-
-    def _detect_fill(self, ax, subplot_index) -> list[ArtistGroup]:
-        groups: list[ArtistGroup] = []
-        for coll in ax.collections:
-            if self._is_claimed(coll):
-                continue
-            if isinstance(coll, PolyCollection):
-                self._claim(coll)
-                groups.append(ArtistGroup(
-                    plot_type=PlotType.FILL_BETWEEN,
-                    axes=ax,
-                    artists=[coll],
-                    label="Fill",
-                    subplot_index=subplot_index,
-                ))
-        return groups
@@ -2,34 +2,108 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+from contextlib import ExitStack, contextmanager, suppress
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import ipywidgets as widgets
+from matplotlib.colors import to_hex
 from matplotlib.figure import Figure
+from matplotlib.font_manager import weight_dict
+
+try:  # optional: pip install "matplotly[fast]"
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 PROFILES_DIR = Path.home() / ".matplotly" / "profiles"
 
+# (PROFILES_DIR mtime_ns, sorted names) from the last _list_profiles scan
+_LIST_CACHE: tuple[int, list[str]] | None = None
+
 
 def _ensure_dir() -> None:
     PROFILES_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def _list_profiles() -> list[str]:
-    """Return sorted list of saved profile names (without .json)."""
-    _ensure_dir()
-    return sorted(p.stem for p in PROFILES_DIR.glob("*.json"))
+    """Return sorted list of saved profile names (without .json).
+
+    The scan is cached until the directory's mtime changes; our own
+    save/delete helpers also invalidate it.
+    """
+    global _LIST_CACHE
+    try:
+        mtime = os.stat(PROFILES_DIR).st_mtime_ns
+    except FileNotFoundError:
+        _ensure_dir()
+        mtime = os.stat(PROFILES_DIR).st_mtime_ns
+    if _LIST_CACHE is not None and _LIST_CACHE[0] == mtime:
+        return list(_LIST_CACHE[1])
+    with os.scandir(PROFILES_DIR) as it:
+        names = [e.name[:-5] for e in it
+                 if e.name.endswith(".json") and e.is_file()]
+    names.sort()
+    _LIST_CACHE = (mtime, names)
+    return list(names)
+
+
+def _dumps(data: dict) -> bytes:
+    """Encode a profile as indented UTF-8 JSON.
+
+    Both encoders decode back to the same profile data, but the bytes
+    are not guaranteed identical (orjson formats some floats
+    differently), so a file written by the other encoder is rewritten
+    on the next save.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2)
+    # Raw UTF-8 for non-ASCII (e.g. font names), as orjson writes it
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(blob: bytes) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(blob)
+    return json.loads(blob)
 
 
 def _read_profile(name: str) -> dict:
     path = PROFILES_DIR / f"{name}.json"
-    return json.loads(path.read_text())
+    return _loads(path.read_bytes())
 
 
 def _save_profile(name: str, data: dict) -> Path:
+    """Write a profile atomically.
+
+    The write is skipped only if the file on disk already holds exactly
+    these bytes, so edits made outside this kernel are overwritten.
+    """
     _ensure_dir()
     path = PROFILES_DIR / f"{name}.json"
-    path.write_text(json.dumps(data, indent=2))
+    blob = _dumps(data)
+    try:
+        if path.read_bytes() == blob:
+            return path
+    except FileNotFoundError:
+        pass
+    # Unique temp name so kernels saving the same profile don't collide;
+    # mkstemp opens in binary mode, so no CRLF translation on Windows
+    fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp",
+                               dir=PROFILES_DIR)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+    _invalidate_list_cache()
     return path
 
 
@@ -37,182 +111,191 @@ def _delete_profile(name: str) -> None:
     path = PROFILES_DIR / f"{name}.json"
     if path.exists():
         path.unlink()
+    _invalidate_list_cache()
+
+
+def _invalidate_list_cache() -> None:
+    global _LIST_CACHE
+    _LIST_CACHE = None
+
+
+# (profile key, GlobalPanel widget attribute, digits to round to or None).
+# Widgets that don't exist on a given GlobalPanel (e.g. spines/ticks in
+# multi-subplot mode) are skipped by both snapshot and apply.
+_FIELDS: tuple[tuple[str, str, int | None], ...] = (
+    # Font
+    ("font_family", "_font_dd", None),
+    ("title_size", "_title_size_sl", 1),
+    ("label_size", "_label_size_sl", 1),
+    ("tick_size", "_tick_size_sl", 1),
+    # Title / label padding
+    ("title_pad", "_title_pad_sl", 1),
+    ("xlabel_pad", "_xlabel_pad_sl", 1),
+    ("ylabel_pad", "_ylabel_pad_sl", 1),
+    # Spines
+    ("spine_top", "_spine_top_cb", None),
+    ("spine_right", "_spine_right_cb", None),
+    ("spine_bottom", "_spine_bottom_cb", None),
+    ("spine_left", "_spine_left_cb", None),
+    ("spine_width", "_spine_width_sl", 1),
+    # Ticks (spacing 0 = auto)
+    ("tick_direction", "_tick_dir_dd", None),
+    ("tick_length", "_tick_len_sl", 1),
+    ("tick_width", "_tick_width_sl", 1),
+    ("x_tick_step", "_x_step", 4),
+    ("y_tick_step", "_y_step", 4),
+    # Axis scale
+    ("x_scale", "_xscale_dd", None),
+    ("y_scale", "_yscale_dd", None),
+    # Grid
+    ("grid_on", "_grid_toggle", None),
+    ("grid_alpha", "_grid_alpha_sl", 2),
+    ("grid_width", "_grid_width_sl", 1),
+    ("grid_style", "_grid_style_dd", None),
+    # Legend
+    ("legend_show", "_legend_toggle", None),
+    ("legend_frame", "_frame_toggle", None),
+    ("legend_fontsize", "_legend_fontsize_sl", 1),
+    ("legend_position", "_legend_pos_dd", None),
+    ("legend_columns", "_legend_ncol", None),
+)
+
+_SCALES = ("linear", "log", "symlog")
+
+# Extra validation for profile values before they reach a widget.
+_CHECKS: dict[str, Callable[[Any, Any], bool]] = {
+    "x_scale": lambda w, v: v in _SCALES,
+    "y_scale": lambda w, v: v in _SCALES,
+    "legend_position": lambda w, v: v in [val for _, val in w.options],
+    "legend_columns": lambda w, v: isinstance(v, int) and 1 <= v <= 6,
+}
+
+# _FIELDS flattened for apply_profile: (key, widget attr, check or None)
+_APPLY = tuple((key, attr, _CHECKS.get(key)) for key, attr, _ in _FIELDS)
+
+
+def _NOOP(*args, **kwargs) -> None:
+    pass
+
+
+@contextmanager
+def _suppress_redraw(canvas):
+    """Make ``canvas.redraw`` a no-op until exit (force_redraw still works)."""
+    orig = canvas.redraw
+    canvas.redraw = _NOOP
+    try:
+        yield
+    finally:
+        canvas.redraw = orig
+
+
+@contextmanager
+def _batch_widgets(ws):
+    """Hold trait notifications on every widget in *ws* until exit."""
+    with ExitStack() as stack:
+        for w in ws:
+            stack.enter_context(w.hold_trait_notifications())
+        yield
+
+
+@dataclass(frozen=True)
+class _StyleContext:
+    """The figure artists profiles style directly, gathered in one pass."""
+
+    fig: Figure
+    axes: tuple
+    titles: tuple
+    labels: tuple  # x and y axis labels of every axes
+
+    @classmethod
+    def of(cls, fig: Figure) -> _StyleContext:
+        axes = tuple(fig.get_axes())
+        return cls(
+            fig=fig,
+            axes=axes,
+            titles=tuple(ax.title for ax in axes),
+            labels=tuple(lbl for ax in axes
+                         for lbl in (ax.xaxis.label, ax.yaxis.label)),
+        )
 
 
 def snapshot_from_global(global_panel) -> dict:
     """Read current style values from GlobalPanel widgets."""
     gp = global_panel
     data: dict[str, Any] = {}
-    # Font
-    data["font_family"] = gp._font_dd.value
-    data["title_size"] = round(gp._title_size_sl.value, 1)
-    data["label_size"] = round(gp._label_size_sl.value, 1)
-    data["tick_size"] = round(gp._tick_size_sl.value, 1)
-    # Title / label padding
-    if hasattr(gp, '_title_pad_sl'):
-        data["title_pad"] = round(gp._title_pad_sl.value, 1)
-    if hasattr(gp, '_xlabel_pad_sl'):
-        data["xlabel_pad"] = round(gp._xlabel_pad_sl.value, 1)
-    if hasattr(gp, '_ylabel_pad_sl'):
-        data["ylabel_pad"] = round(gp._ylabel_pad_sl.value, 1)
-    # Spines (may not exist in multi-subplot mode)
-    if hasattr(gp, '_spine_top_cb'):
-        data["spine_top"] = gp._spine_top_cb.value
-        data["spine_right"] = gp._spine_right_cb.value
-        data["spine_bottom"] = gp._spine_bottom_cb.value
-        data["spine_left"] = gp._spine_left_cb.value
-    if hasattr(gp, '_spine_width_sl'):
-        data["spine_width"] = round(gp._spine_width_sl.value, 1)
-    # Ticks (may not exist in multi-subplot mode)
-    if hasattr(gp, '_tick_dir_dd'):
-        data["tick_direction"] = gp._tick_dir_dd.value
-        data["tick_length"] = round(gp._tick_len_sl.value, 1)
-        data["tick_width"] = round(gp._tick_width_sl.value, 1)
-    if hasattr(gp, '_x_step'):
-        data["x_tick_step"] = round(gp._x_step.value, 4)
-    if hasattr(gp, '_y_step'):
-        data["y_tick_step"] = round(gp._y_step.value, 4)
-    # Axis scale
-    if hasattr(gp, '_xscale_dd'):
-        data["x_scale"] = gp._xscale_dd.value
-    if hasattr(gp, '_yscale_dd'):
-        data["y_scale"] = gp._yscale_dd.value
-    # Grid (may not exist in multi-subplot mode)
-    if hasattr(gp, '_grid_toggle'):
-        data["grid_on"] = gp._grid_toggle.value
-        data["grid_alpha"] = round(gp._grid_alpha_sl.value, 2)
-        data["grid_width"] = round(gp._grid_width_sl.value, 1)
-        data["grid_style"] = gp._grid_style_dd.value
-    # Legend (may not exist in multi-subplot mode)
-    if hasattr(gp, '_legend_toggle'):
-        data["legend_show"] = gp._legend_toggle.value
-        data["legend_frame"] = gp._frame_toggle.value
-        data["legend_fontsize"] = round(gp._legend_fontsize_sl.value, 1)
-    if hasattr(gp, '_legend_pos_dd'):
-        data["legend_position"] = gp._legend_pos_dd.value
-    if hasattr(gp, '_legend_ncol'):
-        data["legend_columns"] = gp._legend_ncol.value
+    for key, attr, digits in _FIELDS:
+        w = getattr(gp, attr, None)
+        if w is None:
+            continue
+        data[key] = w.value if digits is None else round(w.value, digits)
     # Colormap
     if gp._cmap_panel is not None:
         data["colormap"] = gp._cmap_panel._selected
+    # Keys apply_profile sets on the figure directly rather than via widgets
+    fig = getattr(gp, "_fig", None)
+    if fig is not None:
+        ctx = _StyleContext.of(fig)
+        if ctx.axes:
+            data["title_bold"] = _is_bold(ctx.titles[0].get_fontweight())
+            data["label_bold"] = _is_bold(ctx.labels[0].get_fontweight())
+        fc = fig.get_facecolor()
+        data["background_color"] = "none" if fc[3] == 0 else to_hex(fc)
     return data
 
 
+def _is_bold(weight) -> bool:
+    return weight_dict.get(weight, weight) >= 700
+
+
 def apply_profile(data: dict, global_panel, canvas) -> None:
     """Apply a profile dict by setting GlobalPanel widget values.
 
-    Suppresses intermediate redraws and does one force_redraw at the end.
+    Widget observers are held until every value has been assigned, so each
+    fires once with its final value.  Intermediate redraws are suppressed
+    and one force_redraw happens at the end.
     """
     gp = global_panel
-    orig_redraw = canvas.redraw
-    canvas.redraw = lambda: None
-    try:
-        # Helper: get value if key exists and value is not None
-        def _v(key):
-            val = data.get(key)
-            return val  # returns None if missing or explicitly null
-
-        # Font
-        if _v("font_family") is not None:
-            # Add to dropdown if not present
-            opts = list(gp._font_dd.options)
-            if data["font_family"] not in opts:
-                opts.insert(0, data["font_family"])
-                gp._font_dd.options = opts
-            gp._font_dd.value = data["font_family"]
-        if _v("title_size") is not None:
-            gp._title_size_sl.value = data["title_size"]
-        if _v("label_size") is not None:
-            gp._label_size_sl.value = data["label_size"]
-        if _v("tick_size") is not None:
-            gp._tick_size_sl.value = data["tick_size"]
-        # Title / label padding
-        if _v("title_pad") is not None and hasattr(gp, '_title_pad_sl'):
-            gp._title_pad_sl.value = data["title_pad"]
-        if _v("xlabel_pad") is not None and hasattr(gp, '_xlabel_pad_sl'):
-            gp._xlabel_pad_sl.value = data["xlabel_pad"]
-        if _v("ylabel_pad") is not None and hasattr(gp, '_ylabel_pad_sl'):
-            gp._ylabel_pad_sl.value = data["ylabel_pad"]
+    updates = []
+    for key, attr, check in _APPLY:
+        val = data.get(key)
+        if val is None:
+            continue
+        w = getattr(gp, attr, None)
+        if w is None:
+            continue
+        if check is not None and not check(w, val):
+            continue
+        updates.append((w, val))
+
+    with _suppress_redraw(canvas):
+        # Font: add to dropdown if not present.  Done before holding
+        # notifications so the dropdown has re-indexed its options.
+        font = data.get("font_family")
+        if font is not None and font not in gp._font_dd.options:
+            gp._font_dd.options = [font] + list(gp._font_dd.options)
+        with _batch_widgets(w for w, _ in updates):
+            for w, val in updates:
+                w.value = val
+
         # Title / label bold (applied directly to figure)
-        if _v("title_bold") is not None:
-            fig = gp._fig
+        ctx = _StyleContext.of(gp._fig)
+        if data.get("title_bold") is not None:
             w = "bold" if data["title_bold"] else "normal"
-            for ax in fig.get_axes():
-                ax.title.set_fontweight(w)
-        if _v("label_bold") is not None:
-            fig = gp._fig
+            for t in ctx.titles:
+                t.set_fontweight(w)
+        if data.get("label_bold") is not None:
             w = "bold" if data["label_bold"] else "normal"
-            for ax in fig.get_axes():
-                ax.xaxis.label.set_fontweight(w)
-                ax.yaxis.label.set_fontweight(w)
-        # Spines (may not exist in multi-subplot mode)
-        if _v("spine_top") is not None and hasattr(gp, '_spine_top_cb'):
-            gp._spine_top_cb.value = data["spine_top"]
-        if _v("spine_right") is not None and hasattr(gp, '_spine_right_cb'):
-            gp._spine_right_cb.value = data["spine_right"]
-        if _v("spine_bottom") is not None and hasattr(gp, '_spine_bottom_cb'):
-            gp._spine_bottom_cb.value = data["spine_bottom"]
-        if _v("spine_left") is not None and hasattr(gp, '_spine_left_cb'):
-            gp._spine_left_cb.value = data["spine_left"]
-        if _v("spine_width") is not None and hasattr(gp, '_spine_width_sl'):
-            gp._spine_width_sl.value = data["spine_width"]
-        # Ticks (may not exist in multi-subplot mode)
-        if _v("tick_direction") is not None and hasattr(gp, '_tick_dir_dd'):
-            gp._tick_dir_dd.value = data["tick_direction"]
-        if _v("tick_length") is not None and hasattr(gp, '_tick_len_sl'):
-            gp._tick_len_sl.value = data["tick_length"]
-        if _v("tick_width") is not None and hasattr(gp, '_tick_width_sl'):
-            gp._tick_width_sl.value = data["tick_width"]
-        # Tick spacing (0 = auto)
-        if _v("x_tick_step") is not None and hasattr(gp, '_x_step'):
-            gp._x_step.value = data["x_tick_step"]
-        if _v("y_tick_step") is not None and hasattr(gp, '_y_step'):
-            gp._y_step.value = data["y_tick_step"]
-        # Axis scale
-        if _v("x_scale") is not None and hasattr(gp, '_xscale_dd'):
-            if data["x_scale"] in ("linear", "log", "symlog"):
-                gp._xscale_dd.value = data["x_scale"]
-        if _v("y_scale") is not None and hasattr(gp, '_yscale_dd'):
-            if data["y_scale"] in ("linear", "log", "symlog"):
-                gp._yscale_dd.value = data["y_scale"]
-        # Grid (may not exist in multi-subplot mode)
-        if _v("grid_on") is not None and hasattr(gp, '_grid_toggle'):
-            gp._grid_toggle.value = data["grid_on"]
-        if _v("grid_alpha") is not None and hasattr(gp, '_grid_alpha_sl'):
-            gp._grid_alpha_sl.value = data["grid_alpha"]
-        if _v("grid_width") is not None and hasattr(gp, '_grid_width_sl'):
-            gp._grid_width_sl.value = data["grid_width"]
-        if _v("grid_style") is not None and hasattr(gp, '_grid_style_dd'):
-            gp._grid_style_dd.value = data["grid_style"]
-        # Legend (may not exist in multi-subplot mode)
-        if _v("legend_show") is not None and hasattr(gp, '_legend_toggle'):
-            gp._legend_toggle.value = data["legend_show"]
-        if _v("legend_frame") is not None and hasattr(gp, '_frame_toggle'):
-            gp._frame_toggle.value = data["legend_frame"]
-        if _v("legend_fontsize") is not None and hasattr(gp, '_legend_fontsize_sl'):
-            gp._legend_fontsize_sl.value = data["legend_fontsize"]
-        # Legend position and columns
-        if _v("legend_position") is not None and hasattr(gp, '_legend_pos_dd'):
-            pos = data["legend_position"]
-            valid = [v for _, v in gp._legend_pos_dd.options]
-            if pos in valid:
-                gp._legend_pos_dd.value = pos
-        if _v("legend_columns") is not None and hasattr(gp, '_legend_ncol'):
-            ncol = data["legend_columns"]
-            if isinstance(ncol, int) and 1 <= ncol <= 6:
-                gp._legend_ncol.value = ncol
+            for t in ctx.labels:
+                t.set_fontweight(w)
         # Colormap
-        if _v("colormap") is not None and gp._cmap_panel is not None:
+        if data.get("colormap") is not None and gp._cmap_panel is not None:
             gp._cmap_panel.apply(data["colormap"])
         # Background color
-        if _v("background_color") is not None:
+        if data.get("background_color") is not None:
             bg = data["background_color"]
-            fig = gp._fig
-            fig.set_facecolor(bg)
-            for ax in fig.get_axes():
+            ctx.fig.set_facecolor(bg)
+            for ax in ctx.axes:
                 ax.set_facecolor(bg)
-    finally:
-        canvas.redraw = orig_redraw
     canvas.force_redraw()
 
 
@@ -1,8 +1,11 @@
 """Canvas management — renders figure as PNG in an Output widget."""
 from __future__ import annotations
 
+import asyncio
 import io
 import time
+from contextlib import contextmanager
+from types import MappingProxyType
 
 import ipywidgets as widgets
 from matplotlib.figure import Figure
@@ -14,15 +17,47 @@ class CanvasManager:
     Always renders as a PNG inside an ipywidgets.Output widget.
     This avoids duplicate-figure issues with the ipympl widget backend
     (which auto-displays the canvas when plt.subplots() is called).
+
+    Every render is a full savefig; there is no blitted partial repaint.
+    A cached background would still contain the artists being restyled
+    (an alpha drop would show the old patch through), anything stacked
+    above them would need repainting too, and the frontend receives a
+    whole PNG either way.  Style-only changes instead pass
+    ``layout=False`` to skip tight_layout and the bbox dry run.
     """
 
     _MIN_DRAW_INTERVAL_S = 0.08  # 80ms throttle
+    # The preview PNG goes straight to the frontend and is never stored, so
+    # favour encode speed over size (zlib level 1 vs PIL's default 6)
+    _PNG_OPTIONS = MappingProxyType({"compress_level": 1})
+    _RENDER_DPI = 100
 
     def __init__(self, fig: Figure):
         self._fig = fig
         self._last_draw = 0.0
+        # Trailing-edge render scheduled by a throttled redraw()
+        self._pending: asyncio.TimerHandle | None = None
+        # Bytes of the PNG currently shown in the Output widget
+        self._last_png: bytes | None = None
+        # Whether tight_layout must run before the next render
+        self._layout_dirty = True
+        # Padded tight bbox (inches) from the last layout pass
+        self._bbox = None
+        # Nesting depth of hold(); while >0 redraws are only recorded
+        self._hold_depth = 0
+        # Strongest redraw requested while held: None, False (throttled)
+        # or True (forced)
+        self._held: bool | None = None
         self._output = widgets.Output()
         self._widget = self._output
+        # Count frontend views of the output (ipywidgets tracks them once
+        # the trait is non-None).  Renders are skipped only after a view
+        # was seen and all have closed, so frontends that never report
+        # views keep rendering as before.
+        self._views_seen = False
+        self._render_skipped = False
+        self._output._view_count = 0
+        self._output.observe(self._on_view_count, names="_view_count")
         self._render()
 
     @property
@@ -30,50 +65,155 @@ class CanvasManager:
         return self._widget
 
     def _render(self) -> None:
-        """Render figure as PNG inside the Output widget."""
-        self._output.clear_output(wait=True)
+        """Render figure as PNG inside the Output widget.
+
+        The output is only replaced when the PNG differs from the one on
+        screen, so no-op redraws don't resend the image to the frontend.
+        Nothing is drawn while no view is open; the next view to appear
+        triggers the skipped render.
+        """
+        if self._views_seen and not self._output._view_count:
+            self._render_skipped = True
+            return
         with self._output:
             from IPython.display import display as ipy_display, Image
-            # Ensure labels/ticks/titles fit within the figure
-            import warnings
-            try:
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    self._fig.tight_layout()
-            except Exception:
-                pass
-            # Re-apply custom subplot spacing (tight_layout resets it)
-            spacing = getattr(self._fig, '_matplotly_spacing', None)
-            if spacing:
-                self._fig.subplots_adjust(**spacing)
-            # Reposition marginal histograms after layout change
-            for mgr in getattr(self._fig, '_matplotly_marginal_managers', []):
-                mgr._rebuild()
+            if self._layout_dirty:
+                self._layout()
             # Collect extra artists (like outside legends) for tight bbox
             extra = []
             for ax in self._fig.get_axes():
                 leg = ax.get_legend()
                 if leg is not None:
                     extra.append(leg)
+            bbox = self._bbox or self._tight_bbox(extra)
             buf = io.BytesIO()
             self._fig.savefig(
-                buf, format='png', bbox_inches='tight',
+                buf, format='png', bbox_inches=bbox,
                 bbox_extra_artists=extra or None,
                 pad_inches=0.15,
                 facecolor=self._fig.get_facecolor(),
-                edgecolor='none', dpi=100)
-            buf.seek(0)
-            ipy_display(Image(data=buf.read()))
+                edgecolor='none', dpi=self._RENDER_DPI,
+                pil_kwargs=dict(self._PNG_OPTIONS))
+            png = buf.getvalue()
+            if png == self._last_png:
+                return
+            self._last_png = png
+            self._output.clear_output(wait=True)
+            ipy_display(Image(data=png, format='png'))
+
+    def _on_view_count(self, change) -> None:
+        if not change["new"]:
+            return
+        self._views_seen = True
+        if self._render_skipped:
+            self._render_skipped = False
+            self._render()
 
-    def redraw(self) -> None:
-        """Request a canvas redraw, throttled to avoid excess repaints."""
+    def _layout(self) -> None:
+        """Run tight_layout and re-apply spacing/marginals that it resets."""
+        # Ensure labels/ticks/titles fit within the figure
+        import warnings
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                self._fig.tight_layout()
+        except Exception:
+            pass
+        # Re-apply custom subplot spacing (tight_layout resets it)
+        spacing = getattr(self._fig, '_matplotly_spacing', None)
+        if spacing:
+            self._fig.subplots_adjust(**spacing)
+        # Reposition marginal histograms after layout change
+        for mgr in getattr(self._fig, '_matplotly_marginal_managers', []):
+            mgr._rebuild()
+        self._layout_dirty = False
+        self._bbox = None
+
+    def _tight_bbox(self, extra):
+        """Compute (and cache) the padded tight bbox savefig would use.
+
+        savefig(bbox_inches='tight') does a dry-run draw on every call to
+        find this; it can only change after a layout pass, so reuse it.
+        """
+        fig = self._fig
+        get_renderer = getattr(fig.canvas, "get_renderer", None)
+        if get_renderer is None:
+            return 'tight'
+        # Measure at the dpi savefig renders at: text extents snap to
+        # pixels, so a bbox taken at fig.dpi can be a pixel off
+        fig_dpi = fig.dpi
+        fig.dpi = self._RENDER_DPI
+        try:
+            fig.draw_without_rendering()
+            self._bbox = fig.get_tightbbox(
+                get_renderer(), bbox_extra_artists=extra or None
+            ).padded(0.15)
+        finally:
+            fig.dpi = fig_dpi
+        return self._bbox
+
+    def redraw(self, layout: bool = True) -> None:
+        """Request a canvas redraw, throttled to avoid excess repaints.
+
+        A request inside the throttle window schedules one trailing render
+        at the end of the window, so the final state is always shown.
+        Pass ``layout=False`` for changes that cannot move anything (colors,
+        alpha, hatches); the previous tight_layout is then reused.
+        """
+        self._layout_dirty |= layout
+        if self._hold_depth:
+            self._held = bool(self._held)
+            return
         now = time.monotonic()
-        if now - self._last_draw < self._MIN_DRAW_INTERVAL_S:
+        wait = self._MIN_DRAW_INTERVAL_S - (now - self._last_draw)
+        if wait <= 0:
+            self._cancel_pending()
+            self._last_draw = now
+            self._render()
             return
-        self._last_draw = now
-        self._render()
+        if self._pending is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no event loop (plain script): drop, as before
+        self._pending = loop.call_later(wait, self._deferred_render)
 
-    def force_redraw(self) -> None:
+    def force_redraw(self, layout: bool = True) -> None:
         """Redraw immediately, bypassing the throttle."""
+        self._layout_dirty |= layout
+        if self._hold_depth:
+            self._held = True
+            return
+        self._cancel_pending()
         self._last_draw = time.monotonic()
         self._render()
+
+    @contextmanager
+    def hold(self):
+        """Collapse every redraw requested inside the block into one.
+
+        Holds nest; the render happens when the outermost block exits, and
+        only if something inside asked for one.
+        """
+        self._hold_depth += 1
+        try:
+            yield
+        finally:
+            self._hold_depth -= 1
+            if not self._hold_depth and self._held is not None:
+                forced, self._held = self._held, None
+                if forced:
+                    self.force_redraw(layout=False)
+                else:
+                    self.redraw(layout=False)
+
+    def _deferred_render(self) -> None:
+        self._pending = None
+        self._last_draw = time.monotonic()
+        self._render()
+
+    def _cancel_pending(self) -> None:
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
@@ -1,12 +1,14 @@
 """Plot type classification enums and data structures."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Any
+from enum import IntEnum, auto
+from typing import Any, Callable
 
 
-class PlotType(Enum):
+class PlotType(IntEnum):
+    # IntEnum so members hash and compare as plain ints (dict keys, ==)
     LINE = auto()
     BAR = auto()
     GROUPED_BAR = auto()
@@ -19,7 +21,11 @@ class PlotType(Enum):
     HEATMAP = auto()
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10; 3.9 falls back to a __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ArtistGroup:
     """A group of related matplotlib artists sharing a plot type."""
 
@@ -29,3 +35,87 @@ class ArtistGroup:
     label: str = ""
     subplot_index: tuple[int, int] = (0, 0)
     metadata: dict[str, Any] = field(default_factory=dict)
+
+
+class LazyMetadata(dict):
+    """Metadata dict whose expensive entries are computed on first access.
+
+    *lazy* maps key -> zero-argument callable.  The callable runs the first
+    time its key is read and the result is stored like a normal entry, so
+    panels can keep using ``meta["key"]`` / ``meta.get("key")`` unchanged.
+    """
+
+    def __init__(self, *args,
+                 lazy: dict[str, Callable[[], Any]] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy = {k: fn for k, fn in (lazy or {}).items()
+                      if not dict.__contains__(self, k)}
+
+    def _resolve(self, key) -> None:
+        fn = self._lazy.pop(key, None)
+        if fn is not None:
+            super().__setitem__(key, fn())
+
+    def _resolve_all(self) -> None:
+        for key in list(self._lazy):
+            self._resolve(key)
+
+    def __getitem__(self, key):
+        if self._lazy:
+            self._resolve(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        if self._lazy:
+            self._resolve(key)
+        return super().get(key, default)
+
+    def __setitem__(self, key, value) -> None:
+        self._lazy.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        if self._lazy.pop(key, None) is None:
+            super().__delitem__(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._lazy or super().__contains__(key)
+
+    def __len__(self) -> int:
+        return super().__len__() + len(self._lazy)
+
+    def __iter__(self):
+        self._resolve_all()
+        return super().__iter__()
+
+    def __eq__(self, other) -> bool:
+        self._resolve_all()
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        self._resolve_all()
+        return super().__repr__()
+
+    def keys(self):
+        self._resolve_all()
+        return super().keys()
+
+    def values(self):
+        self._resolve_all()
+        return super().values()
+
+    def items(self):
+        self._resolve_all()
+        return super().items()
+
+    def pop(self, key, *default):
+        self._resolve(key)
+        return super().pop(key, *default)
+
+    def setdefault(self, key, default=None):
+        self._resolve(key)
+        return super().setdefault(key, default)
+
+    def copy(self) -> dict:
+        self._resolve_all()
+        return dict(super().items())
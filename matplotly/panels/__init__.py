@@ -1,37 +1,51 @@
 """Panel registry — maps PlotType to panel class, plus factory function."""
 from __future__ import annotations
 
+from functools import cache
+from importlib import import_module
+
 from .._commands import CommandStack
 from .._renderer import CanvasManager
 from .._types import ArtistGroup, PlotType
 from ._base import ArtistPanel
-from ._bar import BarPanel
-from ._distribution import DistributionPanel
-from ._errorbar import ErrorbarPanel
-from ._fill import FillPanel
-from ._heatmap import HeatmapPanel
-from ._histogram import HistogramPanel
-from ._line import LinePanel
-from ._scatter import ScatterPanel
-
-PANEL_REGISTRY: dict[PlotType, type[ArtistPanel]] = {
-    PlotType.LINE: LinePanel,
-    PlotType.BAR: BarPanel,
-    PlotType.GROUPED_BAR: BarPanel,
-    PlotType.SCATTER: ScatterPanel,
-    PlotType.HISTOGRAM: HistogramPanel,
-    PlotType.BOXPLOT: DistributionPanel,
-    PlotType.VIOLIN: DistributionPanel,
-    PlotType.ERRORBAR: ErrorbarPanel,
-    PlotType.FILL_BETWEEN: FillPanel,
-    PlotType.HEATMAP: HeatmapPanel,
+
+# PlotType -> (submodule, class name).  Panel modules are imported on
+# first use so a session only pays for the plot types it actually has.
+_PANEL_SPECS: dict[PlotType, tuple[str, str]] = {
+    PlotType.LINE: ("._line", "LinePanel"),
+    PlotType.BAR: ("._bar", "BarPanel"),
+    PlotType.GROUPED_BAR: ("._bar", "BarPanel"),
+    PlotType.SCATTER: ("._scatter", "ScatterPanel"),
+    PlotType.HISTOGRAM: ("._histogram", "HistogramPanel"),
+    PlotType.BOXPLOT: ("._distribution", "DistributionPanel"),
+    PlotType.VIOLIN: ("._distribution", "DistributionPanel"),
+    PlotType.ERRORBAR: ("._errorbar", "ErrorbarPanel"),
+    PlotType.FILL_BETWEEN: ("._fill", "FillPanel"),
+    PlotType.HEATMAP: ("._heatmap", "HeatmapPanel"),
 }
 
 
+@cache
+def _panel_cls(plot_type: PlotType) -> type[ArtistPanel] | None:
+    spec = _PANEL_SPECS.get(plot_type)
+    if spec is None:
+        return None
+    module, name = spec
+    return getattr(import_module(module, __name__), name)
+
+
+def __getattr__(name: str):
+    # PANEL_REGISTRY is kept for callers that want the full mapping; it
+    # imports every panel module, so it is only built on request.
+    if name == "PANEL_REGISTRY":
+        return {pt: _panel_cls(pt) for pt in _PANEL_SPECS}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def create_panel(group: ArtistGroup, stack: CommandStack,
                  canvas: CanvasManager) -> ArtistPanel | None:
     """Create the appropriate panel for an ArtistGroup, or None if unsupported."""
-    cls = PANEL_REGISTRY.get(group.plot_type)
+    cls = _panel_cls(group.plot_type)
     if cls is None:
         return None
     return cls(group, stack, canvas)
@@ -7,18 +7,70 @@ BarSharedPanel: structural controls shared across all bar groups on the same
 """
 from __future__ import annotations
 
+from functools import cache, partial
+
 import numpy as np
 import ipywidgets as widgets
-from matplotlib.colors import to_hex
+from matplotlib.container import BarContainer, ErrorbarContainer
+from matplotlib.ticker import AutoLocator, ScalarFormatter
 
 from .._commands import BatchCommand, Command
+from .._introspect import FigureIntrospector
 from .._types import ArtistGroup, PlotType
 from ._base import ArtistPanel
 from ._color_utils import (
-    _DW, _NW, _SN,
-    _get_palette_colors, _make_color_dot, _refresh_legend, _slider_num,
+    _DW, _HATCH_OPTIONS, _HATCH_VALUES, _LINESTYLE_CODES,
+    _LINESTYLE_OPTIONS, _NW, _SN,
+    _get_palette_colors, _make_color_dot, _refresh_legend, _rgba_hex,
+    _slider_num,
     cmap_color_btn,
 )
+from ._debounce import debounced, throttled
+
+
+# Above this many bars, style sliders apply on release instead of per step
+_LIVE_SLIDER_MAX_BARS = 200
+
+# Slider-driven patch property -> BarPanel attribute caching its value
+_SLIDER_STATE = {"linewidth": "_edge_width", "alpha": "_alpha"}
+
+
+@cache
+def _icon_css():
+    """The swatch-button ``<style>`` block, one widget shared by all panels."""
+    return widgets.HTML(
+        '<style>'
+        '.pb-swatch-btn button {'
+        '  padding:0 !important;'
+        '  min-width:0 !important;'
+        '  overflow:hidden !important;'
+        '}'
+        '.pb-swatch-btn .fa {'
+        '  font-size:9px !important;'
+        '  position:relative !important;'
+        '  top:-7px !important;'
+        '}'
+        '</style>')
+
+
+@cache
+def _shared_layout(**kwargs) -> widgets.Layout:
+    """One Layout model per distinct keyword set, shared by every panel.
+
+    Only for layouts nothing mutates afterwards; a shared model changes
+    for every widget using it.
+    """
+    return widgets.Layout(**kwargs)
+
+
+def _swatch_layout() -> widgets.Layout:
+    return _shared_layout(width="18px", height="16px", padding="0",
+                          margin="1px", min_width="18px")
+
+
+def _all_set(artists, getter: str, value) -> bool:
+    """True if every artist's *getter* already returns *value*."""
+    return all(getattr(a, getter)() == value for a in artists)
 
 
 class BarPanel(ArtistPanel):
@@ -26,6 +78,9 @@ class BarPanel(ArtistPanel):
 
     _plot_number: int = 0
     _on_label_changed = None
+    _palette_cmap = "tab10"
+    _current_eb = None  # ErrorbarContainer from the last _draw_bar_errorbars
+    _bar_info_ref = None  # this group's dict in ax._matplotly_bar_info
 
     def build(self) -> widgets.Widget:
         patches = self._group.artists
@@ -41,12 +96,12 @@ class BarPanel(ArtistPanel):
         self._zorder = meta.get("zorder", ref.get_zorder())
 
         try:
-            self._color = to_hex(ref.get_facecolor())
+            self._color = _rgba_hex(ref.get_facecolor())
         except Exception:
             self._color = "#1f77b4"
 
         try:
-            self._edgecolor = to_hex(ref.get_edgecolor())
+            self._edgecolor = _rgba_hex(ref.get_edgecolor())
         except Exception:
             self._edgecolor = "#000000"
 
@@ -92,23 +147,29 @@ class BarPanel(ArtistPanel):
             [self._color_indicator, toggle_btn],
             layout=widgets.Layout(align_items='center', gap='4px'))
 
-        # --- Controls (collapsed by default) ---
-        controls = self._build_controls()
+        # --- Controls (collapsed by default, built on first expand) ---
+        # Each group's controls are ~25 widgets plus swatch grids; most
+        # groups are never opened, so don't create and sync them up front
         controls_box = widgets.VBox(
-            controls,
-            layout=widgets.Layout(display='none', padding='2px 0 4px 12px'))
+            [], layout=widgets.Layout(display='none', padding='2px 0 4px 12px'))
         self._controls_box = controls_box
+        self._controls_built = False
         self._is_expanded = False
+        # Legend rebuilds from continuous scrubs run once, after the burst
+        self._legend_dirty = False
+        self._flush_legend = debounced(self._refresh_dirty_legend, wait=0.2)
 
         def _toggle(btn):
+            if not self._controls_built:
+                self._controls_built = True
+                controls_box.children = tuple(self._build_controls())
             self._is_expanded = not self._is_expanded
-            if self._is_expanded:
-                controls_box.layout.display = ''
-                toggle_btn.icon = "chevron-down"
-            else:
-                controls_box.layout.display = 'none'
-                toggle_btn.icon = "chevron-right"
-            toggle_btn.description = f"  {self._header_prefix}{self._label}"
+            controls_box.layout.display = '' if self._is_expanded else 'none'
+            # icon + description in one comm message to the frontend
+            with toggle_btn.hold_sync():
+                toggle_btn.icon = ("chevron-down" if self._is_expanded
+                                   else "chevron-right")
+                toggle_btn.description = f"  {self._header_prefix}{self._label}"
         toggle_btn.on_click(_toggle)
 
         return widgets.VBox(
@@ -125,7 +186,7 @@ class BarPanel(ArtistPanel):
         name_field = widgets.Text(
             value=self._label, description="Name:",
             style={"description_width": _DW},
-            layout=widgets.Layout(width="95%"))
+            layout=_shared_layout(width="95%"))
 
         def _on_name(change):
             self._label = change["new"]
@@ -139,98 +200,88 @@ class BarPanel(ArtistPanel):
             self._toggle_btn.icon = icon
             self._toggle_btn.description = f"  {pfx}{self._label}"
             _refresh_legend(self._group.axes)
-            self._update_bar_info()
+            self._update_bar_info(geometry=False)
             if self._on_label_changed is not None:
                 self._on_label_changed()
             self._canvas.force_redraw()
         name_field.observe(_on_name, names="value")
         controls.append(name_field)
 
-        # --- Face color ---
-        controls.append(self._build_color_section(
-            "Color:", self._color, is_face=True))
-
-        # --- Edge color ---
-        controls.append(self._build_color_section(
-            "Edge:", self._edgecolor, is_face=False))
+        # --- Face + edge color ---
+        controls.extend(self._build_color_sections())
+
+        # Both sliders feed one debounced flush, so a burst touching
+        # either (or both) costs a single pass over the patches + render
+        pending: dict[str, float] = {}
+
+        @debounced
+        def _flush_sliders():
+            updates = {}
+            for prop, value in pending.items():
+                setattr(self, _SLIDER_STATE[prop], value)
+                # A debounced drag can settle back where it started
+                if not _all_set(self._group.artists, f"get_{prop}", value):
+                    updates[prop] = value
+            pending.clear()
+            if updates:
+                self._apply_patch_style(**updates)
+
+        # Large groups only update on release (edge/alpha and error-bar
+        # sliders); live drags are too slow
+        live = len(self._group.artists) <= _LIVE_SLIDER_MAX_BARS
 
         # --- Edge width ---
         edge_w_sl = widgets.FloatSlider(
             value=round(self._edge_width, 2), min=0, max=5, step=0.1,
-            description="Edge w:", style=_SN)
+            description="Edge w:", style=_SN, continuous_update=live)
 
         def _ew_cb(change):
-            self._edge_width = change["new"]
-            for p in self._group.artists:
-                p.set_linewidth(self._edge_width)
-            self._update_bar_info()
-            _refresh_legend(self._group.axes)
-            self._canvas.force_redraw()
+            pending["linewidth"] = change["new"]
+            _flush_sliders()
         edge_w_sl.observe(_ew_cb, names="value")
         controls.append(_slider_num(edge_w_sl))
 
         # --- Alpha ---
         alpha_sl = widgets.FloatSlider(
             value=round(self._alpha, 2), min=0, max=1, step=0.05,
-            description="Alpha:", style=_SN)
+            description="Alpha:", style=_SN, continuous_update=live)
 
         def _alpha_cb(change):
-            self._alpha = change["new"]
-            for p in self._group.artists:
-                p.set_alpha(self._alpha)
-            self._update_bar_info()
-            _refresh_legend(self._group.axes)
-            self._canvas.force_redraw()
+            pending["alpha"] = change["new"]
+            _flush_sliders()
         alpha_sl.observe(_alpha_cb, names="value")
         controls.append(_slider_num(alpha_sl))
 
         # --- Hatch ---
-        hatches = [
-            ("none", ""), ("/ / /", "/"), ("\\ \\ \\", "\\"),
-            ("| | |", "|"), ("- - -", "-"), ("+ + +", "+"),
-            ("x x x", "x"), ("o o o", "o"), ("O O O", "O"),
-            (". . .", "."), ("* * *", "*"),
-            ("// //", "//"), ("xx xx", "xx"),
-        ]
         cur_hatch = self._hatch
-        if cur_hatch not in [v for _, v in hatches]:
+        if cur_hatch not in _HATCH_VALUES:
             cur_hatch = ""
         hatch_dd = widgets.Dropdown(
-            options=hatches, value=cur_hatch, description="Hatch:",
-            style=_SN, layout=widgets.Layout(width="180px"))
+            options=_HATCH_OPTIONS, value=cur_hatch, description="Hatch:",
+            style=_SN, layout=_shared_layout(width="180px"))
 
-        def _hatch_cb(change):
-            self._hatch = change["new"]
-            for p in self._group.artists:
-                p.set_hatch(self._hatch)
-            self._update_bar_info()
-            _refresh_legend(self._group.axes)
-            self._canvas.force_redraw()
-        hatch_dd.observe(_hatch_cb, names="value")
+        hatch_dd.observe(partial(self._on_style_dd, "hatch", "_hatch"),
+                         names="value")
         controls.append(hatch_dd)
 
         # --- Linestyle ---
-        linestyles = [("solid", "-"), ("dashed", "--"),
-                      ("dotted", ":"), ("dashdot", "-.")]
-        _ls_map = {"solid": "-", "dashed": "--", "dotted": ":", "dashdot": "-."}
-        cur_ls = _ls_map.get(self._linestyle, self._linestyle)
-        if cur_ls not in [v for _, v in linestyles]:
+        cur_ls = _LINESTYLE_CODES.get(self._linestyle, self._linestyle)
+        if cur_ls not in _LINESTYLE_CODES.values():
             cur_ls = "-"
         ls_dd = widgets.Dropdown(
-            options=linestyles, value=cur_ls, description="Style:",
-            style=_SN, layout=widgets.Layout(width="180px"))
+            options=_LINESTYLE_OPTIONS, value=cur_ls, description="Style:",
+            style=_SN, layout=_shared_layout(width="180px"))
 
-        def _ls_cb(change):
-            self._linestyle = change["new"]
-            for p in self._group.artists:
-                p.set_linestyle(self._linestyle)
-            self._update_bar_info()
-            _refresh_legend(self._group.axes)
-            self._canvas.force_redraw()
-        ls_dd.observe(_ls_cb, names="value")
+        ls_dd.observe(partial(self._on_style_dd, "linestyle", "_linestyle"),
+                      names="value")
         controls.append(ls_dd)
 
         # --- Error bars toggle + controls ---
+        # Each rebuild replaces the whole ErrorbarContainer (and renders);
+        # controls record state and rebuild at most every 150 ms, with a
+        # trailing rebuild so the last value always lands
+        _eb_redraw = throttled(self._draw_bar_errorbars, interval=0.15)
+
         eb_toggle = widgets.Checkbox(
             value=self._show_errorbars, description="Error Bars",
             style={"description_width": "auto"},
@@ -239,51 +290,46 @@ class BarPanel(ArtistPanel):
         def _on_eb_color(hex_val):
             self._errbar_color = hex_val
             self._errbar_color_auto = False
-            self._draw_bar_errorbars()
-            self._canvas.force_redraw()
+            _eb_redraw()
         eb_color_btn, eb_swatch_row = cmap_color_btn(
             self._errbar_color, _on_eb_color)
         eb_color_row = widgets.HBox(
-            [widgets.Label("Color:", layout=widgets.Layout(width='42px')),
+            [widgets.Label("Color:", layout=_shared_layout(width='42px')),
              eb_color_btn],
             layout=widgets.Layout(align_items='center', gap='4px'))
 
         eb_alpha_sl = widgets.FloatSlider(
             value=self._errbar_alpha, min=0, max=1, step=0.05,
-            description="Alpha:", style=_SN)
+            description="Alpha:", style=_SN, continuous_update=live)
         def _eb_alpha_cb(change):
             self._errbar_alpha = change["new"]
-            self._draw_bar_errorbars()
-            self._canvas.force_redraw()
+            _eb_redraw()
         eb_alpha_sl.observe(_eb_alpha_cb, names="value")
 
         eb_lw_sl = widgets.FloatSlider(
             value=self._errbar_linewidth, min=0.1, max=10, step=0.1,
-            description="Line w:", style=_SN)
+            description="Line w:", style=_SN, continuous_update=live)
         def _eb_lw_cb(change):
             self._errbar_linewidth = change["new"]
-            self._draw_bar_errorbars()
-            self._canvas.force_redraw()
+            _eb_redraw()
         eb_lw_sl.observe(_eb_lw_cb, names="value")
 
         eb_cap_sl = widgets.FloatSlider(
             value=self._errbar_capsize, min=0, max=15, step=0.5,
-            description="Cap size:", style=_SN)
+            description="Cap size:", style=_SN,
+            continuous_update=live)
         def _eb_cap_cb(change):
             self._errbar_capsize = change["new"]
-            self._draw_bar_errorbars()
-            self._canvas.force_redraw()
+            _eb_redraw()
         eb_cap_sl.observe(_eb_cap_cb, names="value")
 
         eb_ls_dd = widgets.Dropdown(
-            options=[("solid", "-"), ("dashed", "--"),
-                     ("dotted", ":"), ("dashdot", "-.")],
+            options=_LINESTYLE_OPTIONS,
             value=self._errbar_linestyle, description="Style:",
-            style=_SN, layout=widgets.Layout(width="180px"))
+            style=_SN, layout=_shared_layout(width="180px"))
         def _eb_ls_cb(change):
             self._errbar_linestyle = change["new"]
-            self._draw_bar_errorbars()
-            self._canvas.force_redraw()
+            _eb_redraw()
         eb_ls_dd.observe(_eb_ls_cb, names="value")
 
         eb_controls = widgets.VBox(
@@ -305,7 +351,7 @@ class BarPanel(ArtistPanel):
             else:
                 eb_controls.layout.display = 'none'
                 self._clear_bar_errorbars()
-                self._update_bar_info()
+                self._update_bar_info(geometry=False)
                 self._canvas.force_redraw()
         eb_toggle.observe(_eb_toggle_cb, names="value")
         controls.append(eb_toggle)
@@ -313,13 +359,93 @@ class BarPanel(ArtistPanel):
 
         return controls
 
+    # ColormapPanel hooks until the controls exist; _build_color_sections
+    # replaces both with versions that also sync the color widgets
+    def _update_color(self, hex_val) -> None:
+        self._color = hex_val
+        self._color_indicator.value = _make_color_dot(hex_val)
+
+    def _update_palette(self, cmap_name) -> None:
+        self._palette_cmap = cmap_name
+
+    def _apply_patch_style(self, *, defer_legend: bool = False,
+                           **updates) -> None:
+        """Set patch properties (``hatch=...``, ``alpha=...``) on every bar.
+
+        With *defer_legend* (continuous scrubs) the legend rebuild waits
+        for the burst to settle; see ``_flush_legend``.
+        """
+        # Direct set_* calls: Artist.set()/setp() normalise kwargs per
+        # call and are several times slower on large groups.  Don't write
+        # the private fields instead: set_linewidth rescales the dash
+        # pattern and set_alpha recomputes the face/edge RGBA.
+        for prop, value in updates.items():
+            name = f"set_{prop}"
+            for p in self._group.artists:
+                getattr(p, name)(value)
+        self._update_bar_info(geometry=False)
+        if defer_legend:
+            self._legend_dirty = True
+            self._flush_legend()
+        else:
+            self._legend_dirty = False
+            _refresh_legend(self._group.axes)
+        self._canvas.force_redraw(layout=False)
+
+    def _refresh_dirty_legend(self) -> None:
+        if self._legend_dirty:
+            self._legend_dirty = False
+            _refresh_legend(self._group.axes)
+            self._canvas.force_redraw(layout=False)
+
+    def _on_style_dd(self, prop: str, attr: str, change) -> None:
+        """Observer for the hatch/linestyle Dropdowns (bound via partial)."""
+        value = change["new"]
+        setattr(self, attr, value)
+        # Re-picking what every bar already has (e.g. after a style import
+        # left the Dropdown behind) needs no pass or render
+        if not _all_set(self._group.artists, f"get_{prop}", value):
+            self._apply_patch_style(**{prop: value})
+
     # --- Error bar drawing ---------------------------------------------------
 
     def _clear_bar_errorbars(self):
         """Remove all error bar artists for this panel (matplotly + original)."""
         ax = self._group.axes
+        eb = self._current_eb
+        if eb is not None:
+            # The container we drew last: remove it directly instead of
+            # scanning every line/collection/container on the axes
+            self._current_eb = None
+            for art in eb.get_children():
+                try:
+                    art.remove()
+                except (ValueError, AttributeError):
+                    pass
+            try:
+                ax.containers.remove(eb)
+            except ValueError:
+                pass
+        else:
+            self._clear_tagged_errorbars()
+        # Remove original error bar artists (from ax.bar(yerr=...))
+        for art in self._original_errbar_artists:
+            try:
+                art.remove()
+            except (ValueError, AttributeError):
+                pass
+        self._original_errbar_artists = []
+        # Remove original ErrorbarContainer
+        orig_eb = self._group.metadata.get("errbar_container")
+        if orig_eb is not None:
+            ax.containers[:] = [
+                c for c in ax.containers if c is not orig_eb]
+            self._group.metadata["errbar_container"] = None
+
+    def _clear_tagged_errorbars(self):
+        """Scan the axes for matplotly-tagged error bars of this group."""
+        ax = self._group.axes
         gid = id(self._group)
-        # Remove matplotly-tagged error bar artists
         for l in list(ax.lines):
             if (getattr(l, '_matplotly_bar_errorbar', False)
                     and getattr(l, '_matplotly_bar_eb_group', None) == gid):
@@ -328,26 +454,25 @@ class BarPanel(ArtistPanel):
             if (getattr(c, '_matplotly_bar_errorbar', False)
                     and getattr(c, '_matplotly_bar_eb_group', None) == gid):
                 c.remove()
-        from matplotlib.container import ErrorbarContainer
         ax.containers[:] = [
             c for c in ax.containers
             if not (isinstance(c, ErrorbarContainer)
                     and getattr(c, '_matplotly_bar_errorbar', False)
                     and getattr(c, '_matplotly_bar_eb_group', None) == gid)
         ]
-        # Remove original error bar artists (from ax.bar(yerr=...))
-        for art in self._original_errbar_artists:
-            try:
-                art.remove()
-            except (ValueError, AttributeError):
-                pass
-        self._original_errbar_artists = []
-        # Remove original ErrorbarContainer
-        orig_eb = self._group.metadata.get("errbar_container")
-        if orig_eb is not None:
-            ax.containers[:] = [
-                c for c in ax.containers if c is not orig_eb]
-            self._group.metadata["errbar_container"] = None
+
+    def _recolor_bar_errorbars(self):
+        """Apply ``_errbar_color`` to the drawn error bars in place.
+
+        Only a full ``_draw_bar_errorbars`` when there is no container of
+        ours to recolor (e.g. the originals from ``ax.bar(yerr=...)``).
+        """
+        eb = self._current_eb
+        if eb is None:
+            self._draw_bar_errorbars()
+            return
+        for art in eb.get_children():
+            art.set_color(self._errbar_color)
 
     def _draw_bar_errorbars(self):
         """Draw error bars on the bar chart using the bar values as errors."""
@@ -367,25 +492,18 @@ class BarPanel(ArtistPanel):
         else:
             errors = np.abs(values) * 0.1  # default: 10% of bar value
 
-        is_horiz = self._orientation == "horizontal"
-        if is_horiz:
-            eb = ax.errorbar(
-                values, positions, xerr=errors, fmt='none',
-                ecolor=self._errbar_color,
-                elinewidth=self._errbar_linewidth,
-                capsize=self._errbar_capsize,
-                alpha=self._errbar_alpha,
-                zorder=self._zorder + 1,
-            )
+        style = {
+            'fmt': 'none',
+            'ecolor': self._errbar_color,
+            'elinewidth': self._errbar_linewidth,
+            'capsize': self._errbar_capsize,
+            'alpha': self._errbar_alpha,
+            'zorder': self._zorder + 1,
+        }
+        if self._orientation == "horizontal":
+            eb = ax.errorbar(values, positions, xerr=errors, **style)
         else:
-            eb = ax.errorbar(
-                positions, values, yerr=errors, fmt='none',
-                ecolor=self._errbar_color,
-                elinewidth=self._errbar_linewidth,
-                capsize=self._errbar_capsize,
-                alpha=self._errbar_alpha,
-                zorder=self._zorder + 1,
-            )
+            eb = ax.errorbar(positions, values, yerr=errors, **style)
 
         # Apply linestyle to bar segments
         if self._errbar_linestyle != "-":
@@ -400,104 +518,75 @@ class BarPanel(ArtistPanel):
             artist.set_label("_nolegend_")
         eb._matplotly_bar_errorbar = True
         eb._matplotly_bar_eb_group = gid
+        self._current_eb = eb
 
         self._update_bar_info()
         self._canvas.force_redraw()
 
-    # --- Color section (reused for face + edge) ---
-
-    def _build_color_section(self, label_text, current_color, is_face):
-        """Color section with swatch palette, matching histogram pattern."""
-
-        color_btn = widgets.Button(
-            layout=widgets.Layout(width='28px', height='28px',
-                                  padding='0', min_width='28px'),
-            tooltip="Click to choose color")
-        color_btn.style.button_color = current_color
-
-        color_row = widgets.HBox(
-            [widgets.Label(label_text, layout=widgets.Layout(width='42px')),
-             color_btn],
-            layout=widgets.Layout(align_items='center', gap='4px'))
-
-        _cmap_name = ["tab10"]
+    # --- Color sections (face + edge share one swatch strip) ---
+
+    def _build_color_sections(self):
+        """Face + edge color rows and one swatch palette shared by both.
+
+        Clicking either color button opens the palette for that target;
+        swatches, the custom picker and the expand toggle all act on the
+        target that opened it.
+        """
+        _target = ["face"]
+        color_btns = {}
+        rows = []
+        for target, label_text, current_color in (
+                ("face", "Color:", self._color),
+                ("edge", "Edge:", self._edgecolor)):
+            color_btn = widgets.Button(
+                layout=_shared_layout(width='28px', height='28px',
+                                      padding='0', min_width='28px'),
+                tooltip="Click to choose color")
+            color_btn.style.button_color = current_color
+            color_btns[target] = color_btn
+            rows.append(widgets.HBox(
+                [widgets.Label(label_text,
+                               layout=_shared_layout(width='42px')),
+                 color_btn],
+                layout=widgets.Layout(align_items='center', gap='4px')))
+
+        _cmap_name = [self._palette_cmap]
 
         def _make_swatches(colors):
             btns = []
             for c in colors:
                 b = widgets.Button(
-                    layout=widgets.Layout(width="18px", height="16px",
-                                          padding="0", margin="1px",
-                                          min_width="18px"))
+                    layout=_swatch_layout())
                 b.style.button_color = c
                 btns.append(b)
             return btns
 
-        colors_10 = _get_palette_colors("tab10", 10)
+        colors_10 = _get_palette_colors(_cmap_name[0], 10)
         swatch_buttons = _make_swatches(colors_10)
-        colors_20 = _get_palette_colors("tab10", 20)
-        extra_buttons = _make_swatches(colors_20[10:])
-
-        _icon_css = widgets.HTML(
-            '<style>'
-            '.pb-swatch-btn button {'
-            '  padding:0 !important;'
-            '  min-width:0 !important;'
-            '  overflow:hidden !important;'
-            '}'
-            '.pb-swatch-btn .fa {'
-            '  font-size:9px !important;'
-            '  position:relative !important;'
-            '  top:-7px !important;'
-            '}'
-            '</style>')
+        # The second row of 10 stays hidden until "+" is clicked; most
+        # panels never show it, so its buttons are made on first expand
+        extra_buttons = []
 
         expand_btn = widgets.Button(
             icon="plus", tooltip="Show more colors",
-            layout=widgets.Layout(width="18px", height="16px",
-                                  padding="0", min_width="18px",
-                                  margin="1px"))
+            layout=_swatch_layout())
         expand_btn.style.button_color = "#e0e0e0"
         expand_btn.add_class("pb-swatch-btn")
 
-        palette_btn = widgets.Button(
-            icon="paint-brush", tooltip="Custom color...",
-            layout=widgets.Layout(width="18px", height="16px",
-                                  padding="0", min_width="18px",
-                                  margin="1px"))
-        palette_btn.style.button_color = "#e8e8e8"
-        palette_btn.add_class("pb-swatch-btn")
-
-        _picker_cls = f"pb-picker-bar-{id(self)}-{'face' if is_face else 'edge'}"
+        # The concise picker renders as a native color input, so clicking
+        # it opens the browser's picker directly; no hidden input or
+        # injected JS click (and its round trip) needed
         picker = widgets.ColorPicker(
-            value=current_color, concise=True,
-            layout=widgets.Layout(width="1px", height="1px",
-                                  overflow="hidden", padding="0",
-                                  margin="0", border="0"))
-        picker.add_class(_picker_cls)
-
-        _js_out = widgets.Output(
-            layout=widgets.Layout(height="0px", overflow="hidden"))
-
-        def _on_palette_btn(b):
-            with _js_out:
-                _js_out.clear_output()
-                from IPython.display import display as ipy_display, Javascript
-                ipy_display(Javascript(
-                    "setTimeout(function(){"
-                    "var el=document.querySelector('.%s input[type=\"color\"]');"
-                    "if(el)el.click();"
-                    "},150);" % _picker_cls))
-        palette_btn.on_click(_on_palette_btn)
+            value=self._color, concise=True, tooltip="Custom color...",
+            layout=_swatch_layout())
 
         extra_row = widgets.HBox(
-            extra_buttons,
+            [],
             layout=widgets.Layout(display='none', padding='1px 0 0 0',
                                   align_items='center', gap='1px'))
 
         main_row = widgets.HBox(
-            swatch_buttons + [expand_btn, palette_btn, picker, _icon_css,
-                              _js_out],
+            swatch_buttons + [expand_btn, picker, _icon_css()],
             layout=widgets.Layout(align_items='center', gap='1px'))
 
         palette_panel = widgets.VBox(
@@ -506,100 +595,119 @@ class BarPanel(ArtistPanel):
 
         _updating = [False]
 
-        def _sync_controls(hex_val):
+        # No hold_sync here or in _recolor_swatches: each write goes to a
+        # different widget model (button style, picker, header HTML, one
+        # style per swatch), and hold_sync only merges writes to a single
+        # model.  Rewriting an unchanged color sends no message at all.
+        def _sync_controls(target, hex_val):
             _updating[0] = True
             try:
-                color_btn.style.button_color = hex_val
-                picker.value = hex_val
-                if is_face:
+                color_btns[target].style.button_color = hex_val
+                if target == _target[0]:
+                    picker.value = hex_val
+                if target == "face":
                     self._color_indicator.value = _make_color_dot(hex_val)
             finally:
                 _updating[0] = False
 
-        def _apply_color(hex_val):
-            if is_face:
-                self._color = hex_val
-                for p in self._group.artists:
-                    p.set_facecolor(hex_val)
-                # Sync error bar color if auto-tracking
-                if self._errbar_color_auto:
-                    self._errbar_color = hex_val
-                    if hasattr(self, '_eb_color_btn'):
-                        self._eb_color_btn.style.button_color = hex_val
-                    if self._show_errorbars:
-                        self._draw_bar_errorbars()
-            else:
-                self._edgecolor = hex_val
-                for p in self._group.artists:
-                    p.set_edgecolor(hex_val)
-            self._update_bar_info()
-            _refresh_legend(self._group.axes)
-            self._canvas.force_redraw()
+        def _apply_color(target, hex_val, defer_legend=False):
+            # Redrawing auto-coloured error bars renders too; show one frame
+            with self._canvas.hold():
+                if target == "face":
+                    self._color = hex_val
+                    # Sync error bar color if auto-tracking (before the
+                    # bar_info update in _apply_patch_style)
+                    if self._errbar_color_auto:
+                        self._errbar_color = hex_val
+                        if hasattr(self, '_eb_color_btn'):
+                            self._eb_color_btn.style.button_color = hex_val
+                        if self._show_errorbars:
+                            self._recolor_bar_errorbars()
+                    self._apply_patch_style(facecolor=hex_val,
+                                            defer_legend=defer_legend)
+                else:
+                    self._edgecolor = hex_val
+                    self._apply_patch_style(edgecolor=hex_val,
+                                            defer_legend=defer_legend)
 
         def _wire_swatch(btn):
             def _on_swatch(b, _btn=btn):
                 c = _btn.style.button_color
-                _sync_controls(c)
-                _apply_color(c)
+                _sync_controls(_target[0], c)
+                _apply_color(_target[0], c)
             btn.on_click(_on_swatch)
-        for b in swatch_buttons + extra_buttons:
+        for b in swatch_buttons:
             _wire_swatch(b)
 
-        def _on_expand(b):
-            cname = _cmap_name[0]
-            if extra_row.layout.display == 'none':
+        def _recolor_swatches(cname):
+            if extra_row.layout.display != 'none':
                 c20 = _get_palette_colors(cname, 20)
                 for i, btn in enumerate(swatch_buttons):
                     btn.style.button_color = c20[i]
-                for i, btn in enumerate(extra_buttons):
-                    btn.style.button_color = c20[10 + i]
-                extra_row.layout.display = ''
-                expand_btn.icon = 'minus'
             else:
                 c10 = _get_palette_colors(cname, 10)
                 for i, btn in enumerate(swatch_buttons):
                     btn.style.button_color = c10[i]
+                c20 = _get_palette_colors(cname, 20)
+            for i, btn in enumerate(extra_buttons):
+                btn.style.button_color = c20[10 + i]
+
+        def _on_expand(b):
+            if extra_row.layout.display == 'none':
+                if not extra_buttons:
+                    extra_buttons.extend(_make_swatches(
+                        _get_palette_colors(_cmap_name[0], 20)[10:]))
+                    for btn in extra_buttons:
+                        _wire_swatch(btn)
+                    extra_row.children = tuple(extra_buttons)
+                extra_row.layout.display = ''
+                expand_btn.icon = 'minus'
+            else:
                 extra_row.layout.display = 'none'
                 expand_btn.icon = 'plus'
+            _recolor_swatches(_cmap_name[0])
         expand_btn.on_click(_on_expand)
 
+        # Scrubbing the picker emits a value per step; cap the re-renders
+        # and rebuild the legend once the scrub settles
+        _apply_picked = throttled(partial(_apply_color, defer_legend=True),
+                                  interval=0.033)
+
         def _from_picker(change):
             if _updating[0]:
                 return
-            _sync_controls(change["new"])
-            _apply_color(change["new"])
+            _sync_controls(_target[0], change["new"])
+            _apply_picked(_target[0], change["new"])
         picker.observe(_from_picker, names="value")
 
-        def _toggle_palette(btn):
-            if palette_panel.layout.display == 'none':
+        def _toggle_palette(target):
+            if (palette_panel.layout.display == 'none'
+                    or target != _target[0]):
+                _target[0] = target
+                _updating[0] = True
+                try:
+                    picker.value = (self._color if target == "face"
+                                    else self._edgecolor)
+                finally:
+                    _updating[0] = False
                 palette_panel.layout.display = ''
             else:
                 palette_panel.layout.display = 'none'
-        color_btn.on_click(_toggle_palette)
+        for target, btn in color_btns.items():
+            btn.on_click(lambda b, t=target: _toggle_palette(t))
 
         # External hooks for ColormapPanel
-        if is_face:
-            self._update_color = _sync_controls
-
-            def _ext_update_palette(cmap_name):
-                _cmap_name[0] = cmap_name
-                is_expanded = extra_row.layout.display != 'none'
-                if is_expanded:
-                    c20 = _get_palette_colors(cmap_name, 20)
-                    for i, btn in enumerate(swatch_buttons):
-                        btn.style.button_color = c20[i]
-                    for i, btn in enumerate(extra_buttons):
-                        btn.style.button_color = c20[10 + i]
-                else:
-                    c10 = _get_palette_colors(cmap_name, 10)
-                    for i, btn in enumerate(swatch_buttons):
-                        btn.style.button_color = c10[i]
-                    c20 = _get_palette_colors(cmap_name, 20)
-                    for i, btn in enumerate(extra_buttons):
-                        btn.style.button_color = c20[10 + i]
-            self._update_palette = _ext_update_palette
+        def _ext_update_color(hex_val):
+            self._color = hex_val
+            _sync_controls("face", hex_val)
+        self._update_color = _ext_update_color
 
-        return widgets.VBox([color_row, palette_panel])
+        def _ext_update_palette(cmap_name):
+            _cmap_name[0] = cmap_name
+            _recolor_swatches(cmap_name)
+        self._update_palette = _ext_update_palette
+
+        return rows + [palette_panel]
 
     # --- Bar info storage (for code gen) ---
 
@@ -652,37 +760,48 @@ class BarPanel(ArtistPanel):
         if not hasattr(ax, '_matplotly_bar_info'):
             ax._matplotly_bar_info = []
         ax._matplotly_bar_info.append(bar_info)
-
-    def _update_bar_info(self):
-        """Update the bar_info entry on axes after a visual change."""
-        ax = self._group.axes
-        if not hasattr(ax, '_matplotly_bar_info'):
-            return
-        for i, info in enumerate(ax._matplotly_bar_info):
-            if info.get("_group_id") == id(self._group):
-                info["values"] = list(self._values)
-                info["positions"] = list(self._positions)
-                info["bottoms"] = list(self._bottoms)
-                info["bar_width"] = self._bar_width
-                info["orientation"] = self._orientation
-                info["color"] = self._color
-                info["edgecolor"] = self._edgecolor
-                info["linewidth"] = self._edge_width
-                info["alpha"] = self._alpha
-                info["label"] = self._label
-                info["hatch"] = self._hatch
-                info["linestyle"] = self._linestyle
-                info["zorder"] = self._zorder
-                info["show_errorbars"] = self._show_errorbars
-                info["errbar_color"] = self._errbar_color
-                info["errbar_alpha"] = self._errbar_alpha
-                info["errbar_linewidth"] = self._errbar_linewidth
-                info["errbar_capsize"] = self._errbar_capsize
-                info["errbar_linestyle"] = self._errbar_linestyle
-                info["errbar_values"] = (self._errbar_values.tolist()
-                                         if self._errbar_values is not None
-                                         else None)
-                break
+        self._bar_info_ref = None
+
+    def _update_bar_info(self, geometry=True):
+        """Update the bar_info entry on axes after a visual change.
+
+        Style-only callbacks pass ``geometry=False`` to skip re-copying the
+        per-bar value/position/bottom/error lists, which they never change.
+        """
+        info = self._bar_info_ref
+        if info is None:
+            # Entries are only ever appended, so the dict found once stays
+            # this group's entry; later updates skip the linear search
+            gid = id(self._group)
+            info = next(
+                (d for d in getattr(self._group.axes, '_matplotly_bar_info', ())
+                 if d.get("_group_id") == gid), None)
+            if info is None:
+                return
+            self._bar_info_ref = info
+        if geometry:
+            info["values"] = list(self._values)
+            info["positions"] = list(self._positions)
+            info["bottoms"] = list(self._bottoms)
+            info["errbar_values"] = (
+                self._errbar_values.tolist()
+                if self._errbar_values is not None else None)
+        info["bar_width"] = self._bar_width
+        info["orientation"] = self._orientation
+        info["color"] = self._color
+        info["edgecolor"] = self._edgecolor
+        info["linewidth"] = self._edge_width
+        info["alpha"] = self._alpha
+        info["label"] = self._label
+        info["hatch"] = self._hatch
+        info["linestyle"] = self._linestyle
+        info["zorder"] = self._zorder
+        info["show_errorbars"] = self._show_errorbars
+        info["errbar_color"] = self._errbar_color
+        info["errbar_alpha"] = self._errbar_alpha
+        info["errbar_linewidth"] = self._errbar_linewidth
+        info["errbar_capsize"] = self._errbar_capsize
+        info["errbar_linestyle"] = self._errbar_linestyle
 
 
 class BarSharedPanel:
@@ -695,6 +814,9 @@ class BarSharedPanel:
         self._panels = panels
         self._canvas = canvas
         self._ax = panels[0]._group.axes
+        # Set once _redraw_bars has rebuilt the bars; from then on width
+        # and gap changes can move the patches in place
+        self._bars_built = False
         n_groups = len(panels)
 
         # Read initial values
@@ -705,8 +827,11 @@ class BarSharedPanel:
 
         # Compute tick centers (mean of all groups' positions per tick)
         if n_groups > 1 and self._n_ticks > 0:
-            all_pos = np.array([p._positions for p in panels])
-            self._tick_centers = np.mean(all_pos, axis=0).tolist()
+            # Geometry stays as plain float lists (it is copied verbatim
+            # into bar_info for code gen); one typed (groups, ticks) array
+            # here is the only conversion needed
+            all_pos = np.array([p._positions for p in panels], dtype=float)
+            self._tick_centers = all_pos.mean(axis=0).tolist()
             # Compute initial gap
             if len(panels[0]._positions) > 0 and len(panels[1]._positions) > 0:
                 self._bar_gap = abs(
@@ -742,6 +867,22 @@ class BarSharedPanel:
         controls = []
         n_groups = len(self._panels)
 
+        # Sliders store their value immediately but move bars / re-lay
+        # ticks at most every 50 ms (the trailing call lands the final
+        # value); tick-label typing applies once the user pauses
+        reposition = throttled(self._reposition_bars, interval=0.05)
+        relabel = throttled(self._apply_tick_labels, interval=0.05)
+        self._relabel_typed = debounced(self._apply_tick_labels, wait=0.3)
+        # State attribute -> what a change to it has to redo
+        self._param_actions = {
+            "_bar_width": reposition,
+            "_bar_gap": reposition,
+            "_orientation": self._redraw_bars,
+            "_tick_rotation": relabel,
+            "_tick_ha": self._apply_tick_labels,
+            "_tick_pad": relabel,
+        }
+
         # --- Bar width ---
         # Max width = 1/n_groups so bars from adjacent ticks don't overlap
         max_w = round(1.0 / n_groups, 2)
@@ -750,11 +891,8 @@ class BarSharedPanel:
             min=0.05, max=max_w, step=0.05,
             description="Width:", style=_SN,
             continuous_update=True)
-
-        def _width_cb(change):
-            self._bar_width = change["new"]
-            self._redraw_bars()
-        width_sl.observe(_width_cb, names="value")
+        width_sl.observe(partial(self._on_param, "_bar_width"),
+                         names="value")
         controls.append(_slider_num(width_sl))
 
         # --- Bar gap (only for grouped bars) ---
@@ -763,23 +901,17 @@ class BarSharedPanel:
                 value=round(self._bar_gap, 2), min=0.0, max=0.5, step=0.05,
                 description="Gap:", style=_SN,
                 continuous_update=True)
-
-            def _gap_cb(change):
-                self._bar_gap = change["new"]
-                self._redraw_bars()
-            gap_sl.observe(_gap_cb, names="value")
+            gap_sl.observe(partial(self._on_param, "_bar_gap"),
+                           names="value")
             controls.append(_slider_num(gap_sl))
 
         # --- Orientation ---
         orient_dd = widgets.Dropdown(
             options=[("vertical", "vertical"), ("horizontal", "horizontal")],
             value=self._orientation, description="Orient:",
-            style=_SN, layout=widgets.Layout(width="180px"))
-
-        def _orient_cb(change):
-            self._orientation = change["new"]
-            self._redraw_bars()
-        orient_dd.observe(_orient_cb, names="value")
+            style=_SN, layout=_shared_layout(width="180px"))
+        orient_dd.observe(partial(self._on_param, "_orientation"),
+                          names="value")
         controls.append(orient_dd)
 
         # --- Tick labels ---
@@ -790,20 +922,15 @@ class BarSharedPanel:
                 lbl = self._tick_labels[k] if k < len(self._tick_labels) else ""
                 tw = widgets.Text(
                     value=lbl,
-                    layout=widgets.Layout(width="70px"))
+                    layout=_shared_layout(width="70px"))
                 self._tick_fields.append(tw)
-
-                def _tick_cb(change, idx=k):
-                    if idx < len(self._tick_labels):
-                        self._tick_labels[idx] = change["new"]
-                    self._apply_tick_labels()
-                tw.observe(_tick_cb, names="value")
+                tw.observe(self._on_tick_labels, names="value")
                 tick_widgets.append(tw)
 
             ticks_row = widgets.HBox(
-                [widgets.Label("Ticks:", layout=widgets.Layout(width='42px'))]
+                [widgets.Label("Ticks:", layout=_shared_layout(width='42px'))]
                 + tick_widgets,
-                layout=widgets.Layout(flex_flow='row wrap', gap='2px'))
+                layout=_shared_layout(flex_flow='row wrap', gap='2px'))
             controls.append(ticks_row)
 
             # --- Tick rotation ---
@@ -811,11 +938,8 @@ class BarSharedPanel:
                 value=self._tick_rotation, min=-90, max=90, step=5,
                 description="Rot:", style=_SN,
                 continuous_update=True)
-
-            def _rot_cb(change):
-                self._tick_rotation = change["new"]
-                self._apply_tick_labels()
-            rot_sl.observe(_rot_cb, names="value")
+            rot_sl.observe(partial(self._on_param, "_tick_rotation"),
+                           names="value")
             controls.append(_slider_num(rot_sl))
 
             # --- Tick alignment ---
@@ -823,12 +947,9 @@ class BarSharedPanel:
                 options=[("center", "center"), ("right", "right"),
                          ("left", "left")],
                 value=self._tick_ha, description="Align:",
-                style=_SN, layout=widgets.Layout(width="180px"))
-
-            def _align_cb(change):
-                self._tick_ha = change["new"]
-                self._apply_tick_labels()
-            align_dd.observe(_align_cb, names="value")
+                style=_SN, layout=_shared_layout(width="180px"))
+            align_dd.observe(partial(self._on_param, "_tick_ha"),
+                             names="value")
             controls.append(align_dd)
 
             # --- Tick pad (distance from axis, in points) ---
@@ -836,50 +957,68 @@ class BarSharedPanel:
                 value=self._tick_pad, min=0.0, max=20.0, step=0.5,
                 description="Pad:", style=_SN,
                 continuous_update=True)
-
-            def _pad_cb(change):
-                self._tick_pad = change["new"]
-                self._apply_tick_labels()
-            pad_sl.observe(_pad_cb, names="value")
+            pad_sl.observe(partial(self._on_param, "_tick_pad"),
+                           names="value")
             controls.append(_slider_num(pad_sl))
 
         return widgets.VBox(
             controls,
-            layout=widgets.Layout(padding='4px 4px 4px 8px'))
+            layout=_shared_layout(padding='4px 4px 4px 8px'))
+
+    def _on_param(self, attr: str, change) -> None:
+        """Observer for the shared controls (bound via partial)."""
+        setattr(self, attr, change["new"])
+        self._param_actions[attr]()
+
+    def _on_tick_labels(self, change) -> None:
+        """Observer shared by all tick fields: re-read them, relabel once.
+
+        Edits across several fields within the debounce window (or a
+        programmatic fill of the whole grid) land as one relabel.
+        """
+        self._tick_labels = [tw.value for tw in self._tick_fields]
+        self._relabel_typed()
 
     def _apply_tick_labels(self):
         """Update tick labels, rotation, alignment, and pad on the axes."""
+        self._set_category_ticks(np.array(self._tick_centers))
+        # Update bar info with new tick labels/centers
+        self._write_bar_info(**self._tick_info())
+        self._canvas.force_redraw()
+
+    def _set_category_ticks(self, ticks) -> None:
+        """Place, label and style the category-axis ticks.
+
+        Locator and labels go in one ``Axis.set_ticks(..., labels=...)``
+        call rather than ``set_xticks`` followed by ``set_xticklabels``.
+        """
         ax = self._ax
-        tc = np.array(self._tick_centers)
+        vertical = self._orientation == "vertical"
         # Use rotation_mode='anchor' when ha is not center for clean rotated labels
         rot_mode = 'anchor' if self._tick_ha != 'center' else 'default'
-        if self._orientation == "vertical":
-            ax.set_xticks(tc)
-            ax.set_xticklabels(self._tick_labels,
-                               rotation=self._tick_rotation,
-                               ha=self._tick_ha,
-                               rotation_mode=rot_mode)
-            ax.tick_params(axis='x', pad=self._tick_pad)
-        else:
-            ax.set_yticks(tc)
-            ax.set_yticklabels(self._tick_labels,
-                               rotation=self._tick_rotation,
-                               ha=self._tick_ha,
-                               rotation_mode=rot_mode)
-            ax.tick_params(axis='y', pad=self._tick_pad)
-        # Update bar info with new tick labels/centers
-        for info in getattr(ax, '_matplotly_bar_info', []):
-            info['tick_labels'] = list(self._tick_labels)
-            info['tick_centers'] = list(self._tick_centers)
-            info['tick_rotation'] = self._tick_rotation
-            info['tick_ha'] = self._tick_ha
-            info['tick_pad'] = self._tick_pad
-        self._canvas.force_redraw()
+        (ax.xaxis if vertical else ax.yaxis).set_ticks(
+            ticks, labels=self._tick_labels,
+            rotation=self._tick_rotation, ha=self._tick_ha,
+            rotation_mode=rot_mode)
+        ax.tick_params(axis='x' if vertical else 'y', pad=self._tick_pad)
+
+    def _tick_info(self) -> dict:
+        """Tick settings as stored in each bar-info dict for code gen."""
+        return {
+            'tick_labels': list(self._tick_labels),
+            'tick_centers': list(self._tick_centers),
+            'tick_rotation': self._tick_rotation,
+            'tick_ha': self._tick_ha,
+            'tick_pad': self._tick_pad,
+        }
+
+    def _write_bar_info(self, **fields) -> None:
+        """Write axes-wide settings into every ``ax._matplotly_bar_info``."""
+        for info in getattr(self._ax, '_matplotly_bar_info', ()):
+            info.update(fields)
 
     def _clear_all_bar_patches(self):
         """Remove all bar-chart BarContainers and patches (skip histograms)."""
-        from matplotlib.container import BarContainer
-        from .._introspect import FigureIntrospector as _FI
         ax = self._ax
 
         # Clear error bars for all panels
@@ -887,20 +1026,33 @@ class BarSharedPanel:
             panel._clear_bar_errorbars()
 
         for c in list(ax.containers):
-            if isinstance(c, BarContainer) and not _FI._is_histogram_container(c):
-                for p in c:
-                    p.remove()
-        ax.containers[:] = [
-            c for c in ax.containers
-            if not isinstance(c, BarContainer)
-            or _FI._is_histogram_container(c)
-        ]
+            if not isinstance(c, BarContainer):
+                continue
+            # Histogram containers survive every rebuild; classify each
+            # one once instead of re-reading its bin geometry per redraw
+            is_hist = getattr(c, '_matplotly_is_hist', None)
+            if is_hist is None:
+                is_hist = c._matplotly_is_hist = (
+                    FigureIntrospector._is_histogram_container(c))
+            if not is_hist:
+                # Removes its patches and unregisters it from ax.containers
+                c.remove()
+
+    def _group_positions(self) -> np.ndarray:
+        """Bar centers for every group at once, shape (groups, ticks).
+
+        Ticks sit at 0..n_ticks-1 and group *j* is shifted by its slot,
+        ``(j - (n_groups - 1) / 2) * (width + gap)``.  Rows go to
+        ``panel._positions`` as lists (see ``__init__`` on why).
+        """
+        n_groups = len(self._panels)
+        offsets = ((np.arange(n_groups) - (n_groups - 1) / 2)
+                   * (self._bar_width + self._bar_gap))
+        return np.arange(self._n_ticks, dtype=float) + offsets[:, None]
 
     def _redraw_bars(self):
         """Recompute positions and recreate all bar groups."""
-        from matplotlib.container import BarContainer
         ax = self._ax
-        n_groups = len(self._panels)
         n_ticks = self._n_ticks
         bw = self._bar_width
         bg = self._bar_gap
@@ -911,13 +1063,12 @@ class BarSharedPanel:
         # Compute new positions
         tick_centers = np.arange(n_ticks, dtype=float)
         self._tick_centers = tick_centers.tolist()
+        all_positions = self._group_positions()
 
-        for j, panel in enumerate(self._panels):
-            offset = (j - (n_groups - 1) / 2) * (bw + bg)
-            positions = tick_centers + offset
-
+        for panel, positions, row in zip(self._panels, all_positions,
+                                         all_positions.tolist()):
             # Update panel state
-            panel._positions = positions.tolist()
+            panel._positions = row
             panel._bar_width = bw
             panel._orientation = self._orientation
 
@@ -954,15 +1105,8 @@ class BarSharedPanel:
             panel._update_bar_info()
 
         # Update tick labels/positions and reset the opposite axis
-        from matplotlib.ticker import AutoLocator, ScalarFormatter
-        rot_mode = 'anchor' if self._tick_ha != 'center' else 'default'
+        self._set_category_ticks(tick_centers)
         if self._orientation == "vertical":
-            ax.set_xticks(tick_centers)
-            ax.set_xticklabels(self._tick_labels,
-                               rotation=self._tick_rotation,
-                               ha=self._tick_ha,
-                               rotation_mode=rot_mode)
-            ax.tick_params(axis='x', pad=self._tick_pad)
             # Reset y-axis to automatic ticking + clear rotation
             ax.yaxis.set_major_locator(AutoLocator())
             ax.yaxis.set_major_formatter(ScalarFormatter())
@@ -971,12 +1115,6 @@ class BarSharedPanel:
                 t.set_ha('center')
                 t.set_rotation_mode('default')
         else:
-            ax.set_yticks(tick_centers)
-            ax.set_yticklabels(self._tick_labels,
-                               rotation=self._tick_rotation,
-                               ha=self._tick_ha,
-                               rotation_mode=rot_mode)
-            ax.tick_params(axis='y', pad=self._tick_pad)
             # Reset x-axis to automatic ticking + clear rotation
             ax.xaxis.set_major_locator(AutoLocator())
             ax.xaxis.set_major_formatter(ScalarFormatter())
@@ -986,22 +1124,69 @@ class BarSharedPanel:
                 t.set_rotation_mode('default')
 
         # Update bar info with tick centers
-        for info in getattr(ax, '_matplotly_bar_info', []):
-            info['tick_labels'] = list(self._tick_labels)
-            info['tick_centers'] = self._tick_centers
-            info['bar_width'] = bw
-            info['bar_gap'] = bg
-            info['orientation'] = self._orientation
-            info['tick_rotation'] = self._tick_rotation
-            info['tick_ha'] = self._tick_ha
-            info['tick_pad'] = self._tick_pad
-
-        # Redraw error bars for panels that have them enabled
-        for panel in self._panels:
-            if panel._show_errorbars:
-                panel._draw_bar_errorbars()
+        self._write_bar_info(bar_width=bw, bar_gap=bg,
+                             orientation=self._orientation,
+                             **self._tick_info())
+
+        # Redraw error bars for panels that have them enabled; each one
+        # asks for a render, so hold them to the single one below
+        with self._canvas.hold():
+            for panel in self._panels:
+                if panel._show_errorbars:
+                    panel._draw_bar_errorbars()
 
         ax.relim()
         ax.autoscale_view()
-        _refresh_legend(ax)
+        # The new patches carry the labels and style the legend was last
+        # built from (style callbacks refresh it themselves), so only the
+        # first rebuild, which normalises styles to panel state, needs one
+        if not self._bars_built:
+            _refresh_legend(ax)
+        self._bars_built = True
         self._canvas.force_redraw()
+
+    def _reposition_bars(self):
+        """Move and resize the existing patches for a width/gap change.
+
+        Only x/width (y/height when horizontal) change, so the patches,
+        containers, ticks and legend are kept.  Falls back to
+        ``_redraw_bars`` until that has built the bars once (it also
+        normalises ticks and axes), or if a group's bar count changed.
+        """
+        n_ticks = self._n_ticks
+        if not self._bars_built or any(
+                len(p._group.artists) != n_ticks for p in self._panels):
+            self._redraw_bars()
+            return
+        ax = self._ax
+        bw = self._bar_width
+        bg = self._bar_gap
+        vertical = self._orientation == "vertical"
+        all_positions = self._group_positions()
+
+        for panel, row, starts in zip(self._panels, all_positions.tolist(),
+                                      (all_positions - bw / 2).tolist()):
+            panel._positions = row
+            panel._bar_width = bw
+            for patch, start in zip(panel._group.artists, starts):
+                if vertical:
+                    patch.set_x(start)
+                    patch.set_width(bw)
+                else:
+                    patch.set_y(start)
+                    patch.set_height(bw)
+            panel._group.metadata["positions"] = panel._positions
+            panel._group.metadata["bar_width"] = bw
+            panel._update_bar_info()
+
+        self._write_bar_info(bar_width=bw, bar_gap=bg)
+
+        with self._canvas.hold():
+            for panel in self._panels:
+                if panel._show_errorbars:
+                    panel._draw_bar_errorbars()
+            # Bar values are unchanged, so only the category axis can need
+            # new limits; relim itself stays, as other artists may share it
+            ax.relim()
+            ax.autoscale_view(scalex=vertical, scaley=not vertical)
+            self._canvas.force_redraw()
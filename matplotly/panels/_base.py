@@ -32,7 +32,11 @@ class ArtistPanel(abc.ABC):
 
     # -- helpers -----------------------------------------------------------
 
-    def _execute_and_redraw(self, cmd) -> None:
-        """Execute a command and refresh the canvas."""
-        self._stack.execute(cmd)
+    def _execute_and_redraw(self, cmd, merge_key=None) -> None:
+        """Execute a command and refresh the canvas.
+
+        *merge_key* is passed to CommandStack.execute so slider drags
+        collapse into one undo step.
+        """
+        self._stack.execute(cmd, merge_key)
         self._canvas.redraw()
@@ -1,8 +1,12 @@
 """Shared color utilities used by LinePanel, ScatterPanel, and GlobalPanel."""
 from __future__ import annotations
 
+from functools import lru_cache
+from types import MappingProxyType
+
 import ipywidgets as widgets
 import matplotlib
+import numpy as np
 from matplotlib.colors import ListedColormap, to_hex
 
 _COLORMAPS = [
@@ -24,6 +28,24 @@ _DW = "48px"    # uniform description_width
 _NW = "50px"    # uniform number-edit width
 _SN = {"description_width": _DW}
 
+# (label, hatch) pairs for the hatch Dropdowns in the patch panels
+_HATCH_OPTIONS = (
+    ("none", ""), ("/ / /", "/"), ("\\ \\ \\", "\\"),
+    ("| | |", "|"), ("- - -", "-"), ("+ + +", "+"),
+    ("x x x", "x"), ("o o o", "o"), ("O O O", "O"),
+    (". . .", "."), ("* * *", "*"),
+    ("// //", "//"), ("xx xx", "xx"),
+)
+_HATCH_VALUES = frozenset(v for _, v in _HATCH_OPTIONS)
+
+# (label, linestyle) pairs for the linestyle Dropdowns, and the long
+# names matplotlib getters may return mapped to those short codes
+_LINESTYLE_OPTIONS = (
+    ("solid", "-"), ("dashed", "--"), ("dotted", ":"), ("dashdot", "-."),
+)
+_LINESTYLE_CODES = MappingProxyType(
+    {"solid": "-", "dashed": "--", "dotted": ":", "dashdot": "-."})
+
 
 def _slider_num(slider, desc_width=None):
     """Slider (no readout) + linked number edit box (2 dp)."""
@@ -56,13 +78,46 @@ def _cmap_color(cmap, i, n):
     return cmap(i / max(n - 1, 1))
 
 
-def _get_palette_colors(cmap_name, n=10):
-    """Get n hex colors from a colormap."""
+@lru_cache(maxsize=256)
+def _cached_hex(color) -> str:
+    return to_hex(color)
+
+
+def _rgba_hex(color) -> str:
+    """``to_hex`` memoised on the color value.
+
+    Artist getters return RGBA arrays; they are keyed as tuples so bars or
+    palette entries sharing a color only pay for one conversion.
+    """
+    if not isinstance(color, str):
+        color = tuple(color)
+    return _cached_hex(color)
+
+
+@lru_cache(maxsize=64)
+def _palette_colors(cmap_name, n):
     try:
         cmap = matplotlib.colormaps.get_cmap(cmap_name)
     except Exception:
         cmap = matplotlib.colormaps.get_cmap("tab10")
-    return [to_hex(_cmap_color(cmap, i, n)) for i in range(n)]
+    # _cmap_color for all n at once: one colormap call on an index array
+    idx = np.arange(n)
+    if isinstance(cmap, ListedColormap) and cmap.N <= 20:
+        rgba = cmap(idx % cmap.N)
+    else:
+        rgba = cmap(idx / max(n - 1, 1))
+    # Same rounding as to_hex (round half to even)
+    rgb = np.round(np.asarray(rgba)[:, :3] * 255).astype(int)
+    return tuple(f"#{r:02x}{g:02x}{b:02x}" for r, g, b in rgb.tolist())
+
+
+def _get_palette_colors(cmap_name, n=10):
+    """Get n hex colors from a colormap.
+
+    Sampling is memoised per ``(cmap_name, n)``; panels ask for the same
+    palettes on every build and swatch-row toggle.  Returns a fresh list.
+    """
+    return list(_palette_colors(cmap_name, n))
 
 
 def _make_color_dot(hex_color):
@@ -0,0 +1,74 @@
+"""Coalesce bursts of widget callbacks (e.g. slider drags) into fewer calls."""
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+
+
+def debounced(fn=None, *, wait: float = 0.1):
+    """Wrap *fn* so a burst of calls runs it once, *wait* s after the last.
+
+    Only the most recent arguments are used.  Scheduling goes through the
+    kernel's running asyncio loop; outside one (plain scripts, tests) calls
+    pass straight through.  Usable as ``debounced(cb)`` or
+    ``@debounced(wait=0.05)``.
+    """
+    if fn is None:
+        return functools.partial(debounced, wait=wait)
+
+    pending: list[asyncio.TimerHandle | None] = [None]
+
+    def _fire(args, kwargs):
+        pending[0] = None
+        fn(*args, **kwargs)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return fn(*args, **kwargs)
+        if pending[0] is not None:
+            pending[0].cancel()
+        pending[0] = loop.call_later(wait, _fire, args, kwargs)
+
+    return wrapper
+
+
+def throttled(fn=None, *, interval: float = 0.033):
+    """Wrap *fn* so it runs at most once per *interval* s during a burst.
+
+    The first call runs immediately; later calls inside the interval are
+    folded into one trailing call with the most recent arguments, so the
+    final state always lands.  Unlike ``debounced`` this keeps giving
+    feedback while the burst lasts (e.g. scrubbing a color picker).
+    Outside a running asyncio loop calls pass straight through.
+    """
+    if fn is None:
+        return functools.partial(throttled, interval=interval)
+
+    last = [float("-inf")]
+    pending: list[asyncio.TimerHandle | None] = [None]
+    latest: list[tuple] = [((), {})]
+
+    def _fire():
+        pending[0] = None
+        last[0] = time.monotonic()
+        args, kwargs = latest[0]
+        fn(*args, **kwargs)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return fn(*args, **kwargs)
+        latest[0] = (args, kwargs)
+        wait = interval - (time.monotonic() - last[0])
+        if wait <= 0 and pending[0] is None:
+            _fire()
+        elif pending[0] is None:
+            pending[0] = loop.call_later(max(wait, 0), _fire)
+
+    return wrapper
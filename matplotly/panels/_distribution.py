@@ -14,7 +14,7 @@ from .._commands import BatchCommand, Command
 from .._types import ArtistGroup, PlotType
 from ._base import ArtistPanel
 from ._color_utils import (
-    _DW, _NW, _SN,
+    _DW, _HATCH_OPTIONS, _LINESTYLE_OPTIONS, _NW, _SN,
     _get_palette_colors, _make_color_dot, _refresh_legend, _slider_num,
 )
 
@@ -144,13 +144,12 @@ class DistributionPanel(ArtistPanel):
 
         def _toggle(btn):
             self._is_expanded = not self._is_expanded
-            if self._is_expanded:
-                controls_box.layout.display = ''
-                toggle_btn.icon = "chevron-down"
-            else:
-                controls_box.layout.display = 'none'
-                toggle_btn.icon = "chevron-right"
-            toggle_btn.description = f"  {self._header_prefix}{self._label}"
+            controls_box.layout.display = '' if self._is_expanded else 'none'
+            # icon + description in one comm message to the frontend
+            with toggle_btn.hold_sync():
+                toggle_btn.icon = ("chevron-down" if self._is_expanded
+                                   else "chevron-right")
+                toggle_btn.description = f"  {self._header_prefix}{self._label}"
         toggle_btn.on_click(_toggle)
 
         return widgets.VBox(
@@ -316,13 +315,8 @@ class DistributionPanel(ArtistPanel):
         parts.append(sn)
 
         # Hatch
-        hatches = [
-            ("none", ""), ("/ / /", "/"), ("\\ \\ \\", "\\"),
-            ("| | |", "|"), ("- - -", "-"), ("+ + +", "+"),
-            ("x x x", "x"), ("o o o", "o"),
-        ]
         hatch_dd = widgets.Dropdown(
-            options=hatches, value="", description="Hatch:",
+            options=_HATCH_OPTIONS[:8], value="", description="Hatch:",
             style=_SN, layout=widgets.Layout(width="180px"))
         def _hatch_cb(change):
             self._box_hatch = change["new"]
@@ -1071,10 +1065,8 @@ class DistributionSharedPanel:
         box_opt_parts.append(_slider_num(med_lw_sl))
 
         # Whisker style
-        ws_styles = [("solid", "-"), ("dashed", "--"),
-                     ("dotted", ":"), ("dashdot", "-.")]
         whisk_dd = widgets.Dropdown(
-            options=ws_styles, value="-", description="Whisk:",
+            options=_LINESTYLE_OPTIONS, value="-", description="Whisk:",
             style=_SN, layout=widgets.Layout(width="150px"))
 
         def _ws_cb(change):
@@ -16,7 +16,7 @@ from .._commands import BatchCommand, Command
 from .._types import ArtistGroup, PlotType
 from ._base import ArtistPanel
 from ._color_utils import (
-    _DW, _NW, _SN,
+    _DW, _LINESTYLE_CODES, _NW, _SN,
     _make_color_dot, _refresh_legend, _slider_num,
     cmap_color_btn,
 )
@@ -81,9 +81,7 @@ class ErrorbarPanel(ArtistPanel):
         self._show_bars = True  # error bars on by default
         if data_line is not None:
             ls = data_line.get_linestyle()
-            _ls_map = {"solid": "-", "dashed": "--",
-                       "dotted": ":", "dashdot": "-."}
-            ls_norm = _ls_map.get(ls, ls)
+            ls_norm = _LINESTYLE_CODES.get(ls, ls)
             self._show_line = ls_norm not in ("none", "None")
             # If line was initially hidden, reset style to solid
             # so toggling line on actually draws a visible line.
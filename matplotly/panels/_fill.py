@@ -45,7 +45,8 @@ class FillPanel(ArtistPanel):
         def _alpha_cb(change):
             self._execute_and_redraw(
                 Command(coll, "alpha", coll.get_alpha(), change["new"],
-                        description="Fill alpha"))
+                        description="Fill alpha"),
+                merge_key=(id(coll), "alpha"))
         alpha_sl.observe(_alpha_cb, names="value")
 
         # Edge color
@@ -75,7 +76,10 @@ class FillPanel(ArtistPanel):
                                           description="Edge width:")
 
         def _ew_cb(change):
-            old = coll.get_linewidths().copy()
+            key = (id(coll), "linewidths")
+            # Mid-drag commands are folded and never undone: skip the copy
+            old = (None if self._stack.continues(key)
+                   else coll.get_linewidths().copy())
             def _apply():
                 coll.set_linewidths([change["new"]])
             def _revert():
@@ -83,7 +87,8 @@ class FillPanel(ArtistPanel):
             self._execute_and_redraw(
                 Command(coll, "linewidths", old, change["new"],
                         apply_fn=_apply, revert_fn=_revert,
-                        description="Fill edge width"))
+                        description="Fill edge width"),
+                merge_key=key)
         edge_width.observe(_ew_cb, names="value")
 
         controls.extend([fill_color, alpha_sl, edge_color, edge_width])
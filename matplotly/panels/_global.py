@@ -5,9 +5,12 @@ import ipywidgets as widgets
 from matplotlib.colors import to_hex
 from matplotlib.figure import Figure
 
-from .._commands import BatchCommand, Command, CommandStack
+from .._commands import Command, CommandStack, UniformBatchCommand
 from .._renderer import CanvasManager
-from ._color_utils import _DW, _NW, _slider_num, _get_palette_colors, cmap_color_btn
+from ._color_utils import (
+    _DW, _LINESTYLE_CODES, _NW, _slider_num, _get_palette_colors,
+    cmap_color_btn,
+)
 
 
 _DD_SHORT = widgets.Layout(width="150px")   # short dropdowns (direction, style)
@@ -16,6 +19,21 @@ _GDW = "70px"                               # wider description_width for global
 _STY = {"description_width": _GDW}
 
 
+def _font_texts(ax):
+    """Yield every Text on *ax* that the font-family control restyles."""
+    yield ax.title
+    yield ax.xaxis.label
+    yield ax.yaxis.label
+    yield from ax.get_xticklabels()
+    yield from ax.get_yticklabels()
+    leg = ax.get_legend()
+    if leg is not None:
+        yield from leg.get_texts()
+        ltitle = leg.get_title()
+        if ltitle and ltitle.get_text():
+            yield ltitle
+
+
 class GlobalPanel:
     """Controls that apply to the whole figure rather than individual artists."""
 
@@ -123,8 +141,8 @@ class GlobalPanel:
         For scatter plots: equal axes, equal figure size, equal ticks."""
         orig_redraw = self._canvas.redraw
         orig_force = self._canvas.force_redraw
-        self._canvas.redraw = lambda: None  # suppress
-        self._canvas.force_redraw = lambda: None  # suppress
+        self._canvas.redraw = lambda *a, **k: None  # suppress
+        self._canvas.force_redraw = lambda *a, **k: None  # suppress
         try:
             self._font_dd.value = "Arial"
             self._title_size_sl.value = 10.0
@@ -262,31 +280,21 @@ class GlobalPanel:
             description="Tick sz:", style=_STY)
 
         def _on_font(change):
-            cmds = []
-            for ax in self._main_axes():
-                for text in [ax.title, ax.xaxis.label, ax.yaxis.label]:
-                    cmds.append(Command(text, "fontfamily", text.get_fontfamily(), change["new"]))
-                for lbl in ax.get_xticklabels() + ax.get_yticklabels():
-                    cmds.append(Command(lbl, "fontfamily", lbl.get_fontfamily(), change["new"]))
-                leg = ax.get_legend()
-                if leg is not None:
-                    for text in leg.get_texts():
-                        cmds.append(Command(text, "fontfamily", text.get_fontfamily(), change["new"]))
-                    ltitle = leg.get_title()
-                    if ltitle and ltitle.get_text():
-                        cmds.append(Command(ltitle, "fontfamily", ltitle.get_fontfamily(), change["new"]))
-            if cmds:
-                self._stack.execute(BatchCommand(cmds, "Change font family"))
+            family = change["new"]
+            cmd = UniformBatchCommand.capture(
+                (t for ax in self._main_axes() for t in _font_texts(ax)),
+                "fontfamily", family, "Change font family")
+            if cmd.artists:
+                self._stack.execute(cmd)
                 self._canvas.force_redraw()
 
         def _make_size_cb(getter, desc):
             def _cb(change):
-                cmds = []
-                for ax in self._main_axes():
-                    for t in getter(ax):
-                        cmds.append(Command(t, "fontsize", t.get_fontsize(), change["new"]))
-                if cmds:
-                    self._stack.execute(BatchCommand(cmds, desc))
+                cmd = UniformBatchCommand.capture(
+                    (t for ax in self._main_axes() for t in getter(ax)),
+                    "fontsize", change["new"], desc)
+                if cmd.artists:
+                    self._stack.execute(cmd)
                     self._canvas.redraw()
             return _cb
 
@@ -411,12 +419,10 @@ class GlobalPanel:
         self._tick_width_sl.observe(_tick_cb, names="value")
 
         def _spine_width_cb(change):
-            cmds = []
-            for ax in self._main_axes():
-                for name in ("top", "right", "bottom", "left"):
-                    sp = ax.spines[name]
-                    cmds.append(Command(sp, "linewidth", sp.get_linewidth(), change["new"]))
-            self._stack.execute(BatchCommand(cmds, "Spine width"))
+            self._stack.execute(UniformBatchCommand.capture(
+                (ax.spines[name] for ax in self._main_axes()
+                 for name in ("top", "right", "bottom", "left")),
+                "linewidth", change["new"], "Spine width"))
             self._canvas.redraw()
         self._spine_width_sl.observe(_spine_width_cb, names="value")
 
@@ -497,14 +503,11 @@ class GlobalPanel:
             cur_i = (t0.get_fontstyle() == 'italic') if t0 else False
 
             def _on_c(hex_val):
-                cmds = []
-                for ax in self._main_axes():
-                    t = getter(ax)
-                    if t:
-                        cmds.append(Command(t, "color",
-                                            t.get_color(), hex_val))
-                if cmds:
-                    self._stack.execute(BatchCommand(cmds, f"{prefix} color"))
+                cmd = UniformBatchCommand.capture(
+                    filter(None, map(getter, self._main_axes())),
+                    "color", hex_val, f"{prefix} color")
+                if cmd.artists:
+                    self._stack.execute(cmd)
                     self._canvas.redraw()
 
             color_btn, swatch_row = self._cmap_color_btn(cur_c, _on_c)
@@ -522,26 +525,20 @@ class GlobalPanel:
 
             def _on_b(change):
                 w = 'bold' if change["new"] else 'normal'
-                cmds = []
-                for ax in self._main_axes():
-                    t = getter(ax)
-                    if t:
-                        cmds.append(Command(t, "fontweight",
-                                            t.get_fontweight(), w))
-                if cmds:
-                    self._stack.execute(BatchCommand(cmds, f"{prefix} weight"))
+                cmd = UniformBatchCommand.capture(
+                    filter(None, map(getter, self._main_axes())),
+                    "fontweight", w, f"{prefix} weight")
+                if cmd.artists:
+                    self._stack.execute(cmd)
                     self._canvas.redraw()
 
             def _on_i(change):
                 s = 'italic' if change["new"] else 'normal'
-                cmds = []
-                for ax in self._main_axes():
-                    t = getter(ax)
-                    if t:
-                        cmds.append(Command(t, "fontstyle",
-                                            t.get_fontstyle(), s))
-                if cmds:
-                    self._stack.execute(BatchCommand(cmds, f"{prefix} style"))
+                cmd = UniformBatchCommand.capture(
+                    filter(None, map(getter, self._main_axes())),
+                    "fontstyle", s, f"{prefix} style")
+                if cmd.artists:
+                    self._stack.execute(cmd)
                     self._canvas.redraw()
 
             bb.observe(_on_b, names="value")
@@ -633,31 +630,21 @@ class GlobalPanel:
             description="Tick sz:", style=_STY)
 
         def _on_font(change):
-            cmds = []
-            for ax in self._main_axes():
-                for text in [ax.title, ax.xaxis.label, ax.yaxis.label]:
-                    cmds.append(Command(text, "fontfamily", text.get_fontfamily(), change["new"]))
-                for lbl in ax.get_xticklabels() + ax.get_yticklabels():
-                    cmds.append(Command(lbl, "fontfamily", lbl.get_fontfamily(), change["new"]))
-                leg = ax.get_legend()
-                if leg is not None:
-                    for text in leg.get_texts():
-                        cmds.append(Command(text, "fontfamily", text.get_fontfamily(), change["new"]))
-                    ltitle = leg.get_title()
-                    if ltitle and ltitle.get_text():
-                        cmds.append(Command(ltitle, "fontfamily", ltitle.get_fontfamily(), change["new"]))
-            if cmds:
-                self._stack.execute(BatchCommand(cmds, "Change font family"))
+            family = change["new"]
+            cmd = UniformBatchCommand.capture(
+                (t for ax in self._main_axes() for t in _font_texts(ax)),
+                "fontfamily", family, "Change font family")
+            if cmd.artists:
+                self._stack.execute(cmd)
                 self._canvas.force_redraw()
 
         def _make_size_cb(getter, desc):
             def _cb(change):
-                cmds = []
-                for ax in self._main_axes():
-                    for t in getter(ax):
-                        cmds.append(Command(t, "fontsize", t.get_fontsize(), change["new"]))
-                if cmds:
-                    self._stack.execute(BatchCommand(cmds, desc))
+                cmd = UniformBatchCommand.capture(
+                    (t for ax in self._main_axes() for t in getter(ax)),
+                    "fontsize", change["new"], desc)
+                if cmd.artists:
+                    self._stack.execute(cmd)
                     self._canvas.redraw()
             return _cb
 
@@ -778,8 +765,8 @@ class GlobalPanel:
                 cur_grid_alpha = round(gridlines[0].get_alpha() or 0.5, 2)
                 cur_grid_width = round(gridlines[0].get_linewidth(), 1)
                 cur_grid_style = gridlines[0].get_linestyle()
-                _ls_map = {"solid": "-", "dashed": "--", "dotted": ":", "dashdot": "-."}
-                cur_grid_style = _ls_map.get(cur_grid_style, cur_grid_style)
+                cur_grid_style = _LINESTYLE_CODES.get(cur_grid_style,
+                                                      cur_grid_style)
 
         self._spine_top_cb = widgets.Checkbox(
             value=cur_spine_top, description="Top", indent=False,
@@ -938,11 +925,9 @@ class GlobalPanel:
 
         def _spine_cb(spine_name):
             def _cb(change):
-                cmds = []
-                for ax in self._main_axes():
-                    sp = ax.spines[spine_name]
-                    cmds.append(Command(sp, "visible", sp.get_visible(), change["new"]))
-                self._stack.execute(BatchCommand(cmds, f"Toggle {spine_name} spine"))
+                self._stack.execute(UniformBatchCommand.capture(
+                    (ax.spines[spine_name] for ax in self._main_axes()),
+                    "visible", change["new"], f"Toggle {spine_name} spine"))
                 self._canvas.redraw()
             return _cb
 
@@ -952,12 +937,10 @@ class GlobalPanel:
         self._spine_left_cb.observe(_spine_cb("left"), names="value")
 
         def _spine_width_cb(change):
-            cmds = []
-            for ax in self._main_axes():
-                for name in ("top", "right", "bottom", "left"):
-                    sp = ax.spines[name]
-                    cmds.append(Command(sp, "linewidth", sp.get_linewidth(), change["new"]))
-            self._stack.execute(BatchCommand(cmds, "Spine width"))
+            self._stack.execute(UniformBatchCommand.capture(
+                (ax.spines[name] for ax in self._main_axes()
+                 for name in ("top", "right", "bottom", "left")),
+                "linewidth", change["new"], "Spine width"))
             self._canvas.redraw()
         self._spine_width_sl.observe(_spine_width_cb, names="value")
 
@@ -8,14 +8,15 @@ from __future__ import annotations
 
 import numpy as np
 import ipywidgets as widgets
-from matplotlib.colors import to_hex
 
 from .._commands import BatchCommand, Command
 from .._types import ArtistGroup
 from ._base import ArtistPanel
 from ._color_utils import (
-    _DW, _NW, _SN,
-    _get_palette_colors, _make_color_dot, _refresh_legend, _slider_num,
+    _DW, _HATCH_OPTIONS, _HATCH_VALUES, _LINESTYLE_CODES,
+    _LINESTYLE_OPTIONS, _NW, _SN,
+    _get_palette_colors, _make_color_dot, _refresh_legend, _rgba_hex,
+    _slider_num,
 )
 
 
@@ -40,12 +41,12 @@ class HistogramPanel(ArtistPanel):
         self._zorder = meta.get("zorder", ref.get_zorder())
 
         try:
-            self._color = to_hex(ref.get_facecolor())
+            self._color = _rgba_hex(ref.get_facecolor())
         except Exception:
             self._color = "#1f77b4"
 
         try:
-            self._edgecolor = to_hex(ref.get_edgecolor())
+            self._edgecolor = _rgba_hex(ref.get_edgecolor())
         except Exception:
             self._edgecolor = self._color
 
@@ -90,13 +91,12 @@ class HistogramPanel(ArtistPanel):
 
         def _toggle(btn):
             self._is_expanded = not self._is_expanded
-            if self._is_expanded:
-                controls_box.layout.display = ''
-                toggle_btn.icon = "chevron-down"
-            else:
-                controls_box.layout.display = 'none'
-                toggle_btn.icon = "chevron-right"
-            toggle_btn.description = f"  {self._header_prefix}{self._label}"
+            controls_box.layout.display = '' if self._is_expanded else 'none'
+            # icon + description in one comm message to the frontend
+            with toggle_btn.hold_sync():
+                toggle_btn.icon = ("chevron-down" if self._is_expanded
+                                   else "chevron-right")
+                toggle_btn.description = f"  {self._header_prefix}{self._label}"
         toggle_btn.on_click(_toggle)
 
         return widgets.VBox(
@@ -170,18 +170,11 @@ class HistogramPanel(ArtistPanel):
         controls.append(_slider_num(alpha_sl))
 
         # --- Hatch ---
-        hatches = [
-            ("none", ""), ("/ / /", "/"), ("\\ \\ \\", "\\"),
-            ("| | |", "|"), ("- - -", "-"), ("+ + +", "+"),
-            ("x x x", "x"), ("o o o", "o"), ("O O O", "O"),
-            (". . .", "."), ("* * *", "*"),
-            ("// //", "//"), ("xx xx", "xx"),
-        ]
         cur_hatch = self._hatch
-        if cur_hatch not in [v for _, v in hatches]:
+        if cur_hatch not in _HATCH_VALUES:
             cur_hatch = ""
         hatch_dd = widgets.Dropdown(
-            options=hatches, value=cur_hatch, description="Hatch:",
+            options=_HATCH_OPTIONS, value=cur_hatch, description="Hatch:",
             style=_SN, layout=widgets.Layout(width="180px"))
 
         def _hatch_cb(change):
@@ -194,14 +187,11 @@ class HistogramPanel(ArtistPanel):
         controls.append(hatch_dd)
 
         # --- Linestyle ---
-        linestyles = [("solid", "-"), ("dashed", "--"),
-                      ("dotted", ":"), ("dashdot", "-.")]
-        _ls_map = {"solid": "-", "dashed": "--", "dotted": ":", "dashdot": "-."}
-        cur_ls = _ls_map.get(self._linestyle, self._linestyle)
-        if cur_ls not in [v for _, v in linestyles]:
+        cur_ls = _LINESTYLE_CODES.get(self._linestyle, self._linestyle)
+        if cur_ls not in _LINESTYLE_CODES.values():
             cur_ls = "-"
         ls_dd = widgets.Dropdown(
-            options=linestyles, value=cur_ls, description="Style:",
+            options=_LINESTYLE_OPTIONS, value=cur_ls, description="Style:",
             style=_SN, layout=widgets.Layout(width="180px"))
 
         def _ls_cb(change):
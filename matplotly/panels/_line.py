@@ -9,8 +9,8 @@ from .._commands import BatchCommand, Command
 from .._types import ArtistGroup, PlotType
 from ._base import ArtistPanel
 from ._color_utils import (
-    _COLORMAPS, _DW, _NW, _SN,
-    _cmap_color, _get_palette_colors, _make_color_dot,
+    _COLORMAPS, _DW, _LINESTYLE_CODES, _LINESTYLE_OPTIONS, _NW, _SN,
+    _cmap_color, _get_palette_colors, _make_color_dot, _rgba_hex,
     _refresh_legend, _slider_num,
 )
 
@@ -112,21 +112,20 @@ class LinePanel(ArtistPanel):
         def _width_cb(change, l=line):
             self._stack.execute(
                 Command(l, "linewidth", l.get_linewidth(), change["new"],
-                        description=f"{self._group.label} width"))
+                        description=f"{self._group.label} width"),
+                merge_key=(id(l), "linewidth"))
             _refresh_legend(l.axes)
             self._canvas.force_redraw()
         width.observe(_width_cb, names="value")
         controls.append(_slider_num(width))
 
         # --- Style ---
-        styles = [("solid", "-"), ("dashed", "--"),
-                  ("dotted", ":"), ("dashdot", "-.")]
-        _ls_map = {"solid": "-", "dashed": "--", "dotted": ":", "dashdot": "-."}
-        current_ls = _ls_map.get(line.get_linestyle(), line.get_linestyle())
-        if current_ls not in [v for _, v in styles]:
+        current_ls = _LINESTYLE_CODES.get(line.get_linestyle(),
+                                          line.get_linestyle())
+        if current_ls not in _LINESTYLE_CODES.values():
             current_ls = "-"
         style = widgets.Dropdown(
-            options=styles, value=current_ls, description="Style:",
+            options=_LINESTYLE_OPTIONS, value=current_ls, description="Style:",
             style=_SN, layout=widgets.Layout(width="150px"))
 
         def _style_cb(change, l=line):
@@ -147,7 +146,8 @@ class LinePanel(ArtistPanel):
         def _alpha_cb(change, l=line):
             self._stack.execute(
                 Command(l, "alpha", l.get_alpha(), change["new"],
-                        description=f"{self._group.label} alpha"))
+                        description=f"{self._group.label} alpha"),
+                merge_key=(id(l), "alpha"))
             _refresh_legend(l.axes)
             self._canvas.force_redraw()
         alpha_sl.observe(_alpha_cb, names="value")
@@ -181,7 +181,8 @@ class LinePanel(ArtistPanel):
         def _ms_cb(change, l=line):
             self._stack.execute(
                 Command(l, "markersize", l.get_markersize(), change["new"],
-                        description=f"{self._group.label} marker size"))
+                        description=f"{self._group.label} marker size"),
+                merge_key=(id(l), "markersize"))
             _refresh_legend(l.axes)
             self._canvas.force_redraw()
         marker_size.observe(_ms_cb, names="value")
@@ -511,7 +512,7 @@ class ColormapPanel:
         n = len(self._color_groups)
         cmds = []
         for i, group in enumerate(self._color_groups):
-            new_color = to_hex(_cmap_color(cmap, i, n))
+            new_color = _rgba_hex(_cmap_color(cmap, i, n))
             if group.plot_type == PlotType.LINE:
                 artist = group.artists[0] if group.artists else None
                 if artist is None:
@@ -553,7 +554,7 @@ class ColormapPanel:
                 artist = group.artists[0]
                 _patches = group.artists
                 _new = new_color
-                _old_colors = [to_hex(p.get_facecolor()) for p in _patches]
+                _old_colors = [_rgba_hex(p.get_facecolor()) for p in _patches]
                 def _apply_hist(_ps=_patches, _c=_new):
                     for p in _ps:
                         p.set_facecolor(_c)
@@ -576,7 +577,7 @@ class ColormapPanel:
                 artist = group.artists[0]
                 _patches = group.artists
                 _new = new_color
-                _old_colors = [to_hex(p.get_facecolor()) for p in _patches]
+                _old_colors = [_rgba_hex(p.get_facecolor()) for p in _patches]
                 def _apply_bar(_ps=_patches, _c=_new):
                     for p in _ps:
                         p.set_facecolor(_c)
@@ -648,7 +649,7 @@ class ColormapPanel:
             self._canvas.redraw()
             for i, panel in enumerate(self._line_panels):
                 if hasattr(panel, "_update_color") and i < n:
-                    color = to_hex(_cmap_color(cmap, i, n))
+                    color = _rgba_hex(_cmap_color(cmap, i, n))
                     panel._update_color(color)
                     # Sync edge color UI if not manually overridden
                     if (hasattr(panel, '_edge_manual')
@@ -690,7 +691,7 @@ class ColormapPanel:
             # Build a banded CSS gradient that fills full width
             stops = []
             for i in range(n):
-                c = to_hex(_cmap_color(cmap, i, n))
+                c = _rgba_hex(_cmap_color(cmap, i, n))
                 pct0 = round(i / n * 100, 2)
                 pct1 = round((i + 1) / n * 100, 2)
                 stops.append(f"{c} {pct0}%, {c} {pct1}%")
@@ -701,7 +702,7 @@ class ColormapPanel:
         # Fixed-width squares
         spans = []
         for i in range(n):
-            c = to_hex(_cmap_color(cmap, i, n))
+            c = _rgba_hex(_cmap_color(cmap, i, n))
             spans.append(
                 f'<span style="display:inline-block;width:{size}px;'
                 f'height:{size}px;background:{c};margin:0;border-right:'
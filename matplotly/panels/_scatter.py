@@ -130,7 +130,9 @@ class ScatterPanel(ArtistPanel):
             description="Size:", style=_SN)
 
         def _size_cb(change, c=coll):
-            old = c.get_sizes().copy()
+            key = (id(c), "sizes")
+            # Mid-drag commands are folded and never undone: skip the copy
+            old = None if self._stack.continues(key) else c.get_sizes().copy()
             new_val = change["new"]
             n_pts = len(c.get_offsets())
             def _apply():
@@ -140,7 +142,8 @@ class ScatterPanel(ArtistPanel):
             self._stack.execute(
                 Command(c, "sizes", old, new_val,
                         apply_fn=_apply, revert_fn=_revert,
-                        description=f"{self._group.label} size"))
+                        description=f"{self._group.label} size"),
+                merge_key=key)
             _refresh_legend(c.axes)
             self._canvas.force_redraw()
         size_sl.observe(_size_cb, names="value")
@@ -155,7 +158,8 @@ class ScatterPanel(ArtistPanel):
         def _alpha_cb(change, c=coll):
             self._stack.execute(
                 Command(c, "alpha", c.get_alpha(), change["new"],
-                        description=f"{self._group.label} alpha"))
+                        description=f"{self._group.label} alpha"),
+                merge_key=(id(c), "alpha"))
             _refresh_legend(c.axes)
             self._canvas.force_redraw()
         alpha_sl.observe(_alpha_cb, names="value")
@@ -194,7 +198,9 @@ class ScatterPanel(ArtistPanel):
             min=0, max=5, step=0.1, description="Edge w:", style=_SN)
 
         def _ew_cb(change, c=coll):
-            old = c.get_linewidths().copy()
+            key = (id(c), "linewidths")
+            old = (None if self._stack.continues(key)
+                   else c.get_linewidths().copy())
             new_val = change["new"]
             def _apply():
                 c.set_linewidths([new_val])
@@ -203,7 +209,8 @@ class ScatterPanel(ArtistPanel):
             self._stack.execute(
                 Command(c, "linewidths", old, new_val,
                         apply_fn=_apply, revert_fn=_revert,
-                        description=f"{self._group.label} edge width"))
+                        description=f"{self._group.label} edge width"),
+                merge_key=key)
             _refresh_legend(c.axes)
             self._canvas.force_redraw()
         edge_w_sl.observe(_ew_cb, names="value")
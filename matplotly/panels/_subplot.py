@@ -5,9 +5,12 @@ import ipywidgets as widgets
 from matplotlib.colors import to_hex
 from matplotlib.figure import Figure
 
-from .._commands import BatchCommand, Command, CommandStack
+from .._commands import Command, CommandStack, UniformBatchCommand
 from .._renderer import CanvasManager
-from ._color_utils import _DW, _NW, _slider_num, _get_palette_colors, cmap_color_btn
+from ._color_utils import (
+    _DW, _LINESTYLE_CODES, _NW, _slider_num, _get_palette_colors,
+    cmap_color_btn,
+)
 
 
 _DD_SHORT = widgets.Layout(width="150px")
@@ -316,12 +319,9 @@ class PerSubplotPanel:
         self._spine_left_cb.observe(_spine_cb("left"), names="value")
 
         def _spine_width_cb(change):
-            cmds = []
-            for name in ("top", "right", "bottom", "left"):
-                sp = ax.spines[name]
-                cmds.append(Command(sp, "linewidth", sp.get_linewidth(),
-                                    change["new"]))
-            self._stack.execute(BatchCommand(cmds, "Spine width"))
+            self._stack.execute(UniformBatchCommand.capture(
+                (ax.spines[name] for name in ("top", "right", "bottom", "left")),
+                "linewidth", change["new"], "Spine width"))
             self._canvas.redraw()
         spine_width_sl.observe(_spine_width_cb, names="value")
 
@@ -507,8 +507,8 @@ class PerSubplotPanel:
             cur_grid_alpha = round(gridlines[0].get_alpha() or 0.5, 2)
             cur_grid_width = round(gridlines[0].get_linewidth(), 1)
             cur_grid_style = gridlines[0].get_linestyle()
-            _ls_map = {"solid": "-", "dashed": "--", "dotted": ":", "dashdot": "-."}
-            cur_grid_style = _ls_map.get(cur_grid_style, cur_grid_style)
+            cur_grid_style = _LINESTYLE_CODES.get(cur_grid_style,
+                                                  cur_grid_style)
 
         grid_toggle = widgets.Checkbox(
             value=cur_grid_on, description="Show grid", indent=False)
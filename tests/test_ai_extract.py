@@ -5,7 +5,6 @@ Run:  python -m pytest tests/test_ai_extract.py -v
 from __future__ import annotations
 
 import base64
-import json
 import sys
 import tempfile
 from pathlib import Path
@@ -19,7 +18,6 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from matplotly._ai_extract import (
     _encode_image,
     _load_config,
-    _parse_json_response,
     _save_config,
     apply_ai_style,
     extract_style,
@@ -179,33 +177,6 @@ class TestEncodeImage:
             _encode_image(b"data", ".bmp")
 
 
-# ---------------------------------------------------------------------------
-# JSON parsing tests
-# ---------------------------------------------------------------------------
-
-class TestParseResponse:
-    def test_plain_json(self, sample_ai_result):
-        text = json.dumps(sample_ai_result)
-        parsed = _parse_json_response(text)
-        assert parsed["plot_type"] == "line"
-        assert parsed["num_series"] == 2
-
-    def test_markdown_fence_stripping(self, sample_ai_result):
-        text = "```json\n" + json.dumps(sample_ai_result) + "\n```"
-        parsed = _parse_json_response(text)
-        assert parsed["plot_type"] == "line"
-
-    def test_bare_fence_stripping(self, sample_ai_result):
-        text = "```\n" + json.dumps(sample_ai_result) + "\n```"
-        parsed = _parse_json_response(text)
-        assert parsed["plot_type"] == "line"
-
-    def test_whitespace_handling(self, sample_ai_result):
-        text = "  \n```json\n" + json.dumps(sample_ai_result) + "\n```\n  "
-        parsed = _parse_json_response(text)
-        assert parsed["plot_type"] == "line"
-
-
 # ---------------------------------------------------------------------------
 # Style application tests
 # ---------------------------------------------------------------------------
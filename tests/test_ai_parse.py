@@ -0,0 +1,72 @@
+"""Tests for LLM reply parsing in matplotly._ai_extract.
+
+Kept apart from test_ai_extract.py, which still imports the on-disk
+config helpers (_load_config/_save_config) that _ai_extract no longer
+has, and so cannot be collected.
+
+Run:  python -m pytest tests/test_ai_parse.py -v
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from matplotly._ai_extract import _parse_json_response
+
+
+@pytest.fixture
+def sample_ai_result():
+    return {
+        "plot_type": "line",
+        "num_series": 2,
+        "global": {"font_family": "Arial", "grid_on": False},
+        "series": [{"type": "line", "color": "#1f77b4"}],
+    }
+
+
+class TestParseResponse:
+    def test_plain_json(self, sample_ai_result):
+        text = json.dumps(sample_ai_result)
+        parsed = _parse_json_response(text)
+        assert parsed["plot_type"] == "line"
+        assert parsed["num_series"] == 2
+
+    def test_markdown_fence_stripping(self, sample_ai_result):
+        text = "```json\n" + json.dumps(sample_ai_result) + "\n```"
+        assert _parse_json_response(text) == sample_ai_result
+
+    def test_bare_fence_stripping(self, sample_ai_result):
+        text = "```\n" + json.dumps(sample_ai_result) + "\n```"
+        assert _parse_json_response(text) == sample_ai_result
+
+    def test_whitespace_handling(self, sample_ai_result):
+        text = "  \n```json\n" + json.dumps(sample_ai_result) + "\n```\n  "
+        assert _parse_json_response(text) == sample_ai_result
+
+    def test_surrounding_prose_ignored(self, sample_ai_result):
+        text = ("Here is the style:\n```json\n" + json.dumps(sample_ai_result)
+                + "\n```\nLet me know if you need more.")
+        assert _parse_json_response(text) == sample_ai_result
+
+    def test_trailing_prose_with_braces_ignored(self, sample_ai_result):
+        text = (json.dumps(sample_ai_result)
+                + "\nNote: use {'alpha': 0.5} for lighter fills.")
+        assert _parse_json_response(text) == sample_ai_result
+
+    def test_leading_prose_with_braces_ignored(self, sample_ai_result):
+        text = ("Use {braces} like this:\n```json\n"
+                + json.dumps(sample_ai_result) + "\n```")
+        assert _parse_json_response(text) == sample_ai_result
+
+    def test_no_object_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            _parse_json_response("I could not read the figure.")
+
+    def test_only_broken_objects_raise(self):
+        with pytest.raises(json.JSONDecodeError):
+            _parse_json_response('Use {braces} and {"a": }')
@@ -9,6 +9,7 @@ Run:  python -m pytest tests/test_code_gen.py -v
 """
 from __future__ import annotations
 
+import contextlib
 import sys
 import textwrap
 from pathlib import Path
@@ -26,8 +27,9 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from matplotly._introspect import FigureIntrospector
 from matplotly._code_gen import generate_code
-from matplotly._commands import CommandStack
+from matplotly._commands import CommandStack, UniformBatchCommand
 from matplotly._types import PlotType
+from matplotly.panels._color_utils import _rgba_hex
 
 
 # ---------------------------------------------------------------------------
@@ -40,12 +42,15 @@ class MockCanvas:
     def __init__(self, fig):
         self._fig = fig
 
-    def redraw(self):
+    def redraw(self, layout=True):
         pass
 
-    def force_redraw(self):
+    def force_redraw(self, layout=True):
         pass
 
+    def hold(self):
+        return contextlib.nullcontext()
+
 
 def _make_panels(groups, fig, canvas, stack):
     """Build DistributionPanel + DistributionSharedPanel for boxplot/violin groups.
@@ -375,6 +380,20 @@ class TestMultiSubplot:
         assert box_group.subplot_index == (0, 0)
         assert violin_group.subplot_index == (0, 1)
 
+    def test_empty_subplot_keeps_grid_indices(self):
+        fig, axes = plt.subplots(1, 3)
+        axes[2].plot([1, 2, 3], label="line")
+        groups = FigureIntrospector(fig).introspect()
+        plt.close(fig)
+        assert [g.subplot_index for g in groups] == [(0, 2)]
+
+    def test_introspect_leaves_no_claim_tags(self):
+        FigureIntrospector(self.fig).introspect()
+        for ax in self.fig.get_axes():
+            for artist in ax.get_children():
+                assert not any(k.startswith("_matplotly_claim_")
+                               for k in vars(artist))
+
     def test_multi_subplot_code_gen(self):
         stack = CommandStack()
         code = generate_code(self.fig, stack)
@@ -916,6 +935,30 @@ class TestHistogramCodeGen:
             pytest.fail(f"Non-merged histogram code has syntax error: {e}")
 
 
+class TestHistBinsCheck:
+    """The scalar loop (numba-compiled when installed) matches NumPy."""
+
+    @pytest.mark.parametrize("xs, widths", [
+        ([0, 1, 2, 3], [1, 1, 1, 1]),            # contiguous
+        ([0, 1, 2.5, 3.5], [1, 1, 1, 1]),        # gapped
+        ([0, 1, 3, 4], [1, 2, 1, 1]),            # two widths
+        ([0, 1, 3, 4.5], [1, 2, 1.5, 1]),        # three widths
+        ([0, 1, 2, 3, np.nan], [1, 1, 1, 1, 1]),  # NaN position
+        ([0, 1, 2], [1, np.nan, 1]),             # NaN width
+        ([0], [1]),                              # single bin
+    ])
+    def test_loop_matches_numpy(self, xs, widths):
+        from matplotly._introspect import _hist_bins_loop, _hist_bins_numpy
+        xs = np.array(xs, dtype=float)
+        widths = np.array(widths, dtype=float)
+        assert _hist_bins_loop(xs, widths) == _hist_bins_numpy(xs, widths)
+
+    def test_nan_gap_rejected(self):
+        from matplotly._introspect import _hist_bins_loop
+        assert not _hist_bins_loop(np.array([0, 1, 2, 3, np.nan]),
+                                   np.ones(5))
+
+
 class TestHistogramMerged:
     """Merged histogram code gen: should emit ax.hist() recreation."""
 
@@ -1937,6 +1980,20 @@ class TestErrorbarIntrospection:
         assert meta["cap_size"] > 0
         plt.close(fig)
 
+    def test_errorbar_error_values_are_lazy(self):
+        """yerr is only extracted when first read, then cached."""
+        fig, ax = plt.subplots()
+        ax.errorbar([1, 2, 3], [10, 20, 30], yerr=[1, 2, 3], label="lazy")
+        groups = FigureIntrospector(fig).introspect()
+        meta = [g for g in groups if g.plot_type == PlotType.ERRORBAR][0].metadata
+        assert "yerr" in meta
+        assert "yerr" in meta._lazy
+        np.testing.assert_allclose(meta["yerr"], [1, 2, 3])
+        assert "yerr" not in meta._lazy
+        np.testing.assert_allclose(meta.get("yerr"), [1, 2, 3])
+        assert set(meta) >= {"line_width", "bar_lw", "cap_size"}
+        plt.close(fig)
+
     def test_errorbar_label(self):
         """Errorbar label should be 'Errorbar: <label>'."""
         fig, ax = plt.subplots()
@@ -2191,7 +2248,8 @@ def _make_bar_panels(groups, fig, canvas, stack):
     """
     from matplotly.panels._bar import BarPanel, BarSharedPanel
 
-    bar_groups = [g for g in groups if g.plot_type == PlotType.BAR]
+    bar_groups = [g for g in groups
+                  if g.plot_type in (PlotType.BAR, PlotType.GROUPED_BAR)]
     if not bar_groups:
         return [], None
 
@@ -2301,6 +2359,18 @@ class TestBarErrorBarsWithYerr:
                    if getattr(c, '_matplotly_bar_errorbar', False)]
         assert len(tagged) > 0
 
+    def test_repeated_redraw_replaces_container(self):
+        """Each rebuild removes the previous container's artists."""
+        panel = self.panels[0]
+        for _ in range(3):
+            panel._draw_bar_errorbars()
+        assert len(self.ax.containers) == 2  # bars + one errorbar
+        assert len(self.ax.collections) == 1
+        panel._show_errorbars = False
+        panel._clear_bar_errorbars()
+        assert len(self.ax.containers) == 1
+        assert not self.ax.lines and not self.ax.collections
+
     def test_errorbars_in_code_gen(self):
         """Bars with yerr should produce errorbar code with stored values."""
         code = generate_code(self.fig, self.stack)
@@ -2324,4 +2394,354 @@ class TestBarErrorBarsWithYerr:
                   if getattr(l, '_matplotly_bar_errorbar', False)]
         tagged += [c for c in self.ax.collections
                    if getattr(c, '_matplotly_bar_errorbar', False)]
-        assert len(tagged) > 0
\ No newline at end of file
+        assert len(tagged) > 0
+
+
+class TestBarReposition:
+    """Width/gap changes move existing patches to the full-rebuild geometry."""
+
+    @staticmethod
+    def _shared(orientation):
+        fig, ax = plt.subplots()
+        x = np.arange(3)
+        bar = ax.bar if orientation == "vertical" else ax.barh
+        bar(x - 0.2, [1, 2, 3], 0.4, label="a")
+        bar(x + 0.2, [3, 2, 1], 0.4, label="b")
+        groups = FigureIntrospector(fig).introspect()
+        _, shared = _make_bar_panels(groups, fig, MockCanvas(fig),
+                                     CommandStack())
+        return fig, shared
+
+    @staticmethod
+    def _extents(shared):
+        return np.array([[p.get_bbox().bounds for p in panel._group.artists]
+                         for panel in shared._panels])
+
+    @pytest.mark.parametrize("orientation", ["vertical", "horizontal"])
+    def test_matches_full_rebuild(self, orientation):
+        fig, shared = self._shared(orientation)
+        shared._redraw_bars()
+        patches = [list(p._group.artists) for p in shared._panels]
+        shared._bar_width, shared._bar_gap = 0.3, 0.1
+        shared._reposition_bars()
+        assert [list(p._group.artists) for p in shared._panels] == patches
+        moved = self._extents(shared)
+        positions = [p._positions for p in shared._panels]
+        shared._redraw_bars()
+        np.testing.assert_allclose(self._extents(shared), moved)
+        assert [p._positions for p in shared._panels] == positions
+        plt.close(fig)
+
+    @pytest.mark.parametrize("orientation", ["vertical", "horizontal"])
+    def test_limits_follow_category_axis_only(self, orientation):
+        fig, shared = self._shared(orientation)
+        shared._redraw_bars()
+        ax = shared._ax
+        vertical = orientation == "vertical"
+        value_lim = ax.get_ylim() if vertical else ax.get_xlim()
+        shared._bar_width, shared._bar_gap = 0.45, 0.05
+        shared._reposition_bars()
+        cat_lim = ax.get_xlim() if vertical else ax.get_ylim()
+        outer = (0 - 0.25 - 0.225, 2 + 0.25 + 0.225)
+        assert cat_lim[0] < outer[0] and cat_lim[1] > outer[1]
+        assert (ax.get_ylim() if vertical else ax.get_xlim()) == value_lim
+        plt.close(fig)
+
+    def test_width_drag_is_throttled(self):
+        import asyncio
+        import ipywidgets as widgets
+        fig, shared = self._shared("vertical")
+        calls = []
+        shared._reposition_bars = lambda: calls.append(shared._bar_width)
+        width = next(w for w in shared.build().children
+                     if isinstance(w, widgets.HBox)).children[0]
+
+        async def drag():
+            for v in (0.1, 0.15, 0.2, 0.25):
+                width.value = v
+            await asyncio.sleep(0.1)
+
+        asyncio.run(drag())
+        assert calls == [0.1, 0.25]
+        plt.close(fig)
+
+    def test_rebuild_keeps_histogram_container(self):
+        fig, shared = self._shared("vertical")
+        ax = shared._ax
+        _, _, hist = ax.hist(np.random.default_rng(0).normal(size=200),
+                             bins=8)
+        for _ in range(2):
+            shared._redraw_bars()
+        assert hist in ax.containers
+        assert all(p.axes is ax for p in hist)
+        assert len(ax.containers) == 3  # histogram + two bar groups
+        assert len(ax.patches) == 8 + 2 * 3
+        plt.close(fig)
+
+    def test_rebuild_keeps_legend(self):
+        fig, shared = self._shared("vertical")
+        ax = shared._ax
+        ax.legend()
+        shared._redraw_bars()
+        legend = ax.get_legend()
+        assert legend is not None
+        shared._orientation = "horizontal"
+        shared._redraw_bars()
+        assert ax.get_legend() is legend
+        assert [t.get_text() for t in legend.get_texts()] == ["a", "b"]
+        plt.close(fig)
+
+    def test_editing_several_tick_fields_relabels_once(self):
+        import asyncio
+        fig, shared = self._shared("vertical")
+        calls = []
+        shared._apply_tick_labels = lambda: calls.append(
+            list(shared._tick_labels))
+        shared.build()
+
+        async def type_labels():
+            for tw, text in zip(shared._tick_fields, "xyz"):
+                tw.value = text
+            await asyncio.sleep(0.4)
+
+        asyncio.run(type_labels())
+        assert calls == [["x", "y", "z"]]
+        plt.close(fig)
+
+    def test_tick_fields_share_one_layout(self):
+        fig, shared = self._shared("vertical")
+        shared.build()
+        layouts = {id(tw.layout) for tw in shared._tick_fields}
+        assert len(shared._tick_fields) == 3 and len(layouts) == 1
+        plt.close(fig)
+
+    @pytest.mark.parametrize("expanded", [False, True])
+    def test_colormap_color_survives_rebuild(self, expanded):
+        fig, shared = self._shared("vertical")
+        panel = shared._panels[0]
+        panel.build()
+        if expanded:
+            panel._toggle_btn.click()
+        panel._update_color("#ff0000")  # as ColormapPanel applies it
+        shared._orientation = "horizontal"
+        shared._redraw_bars()
+        assert _rgba_hex(panel._group.artists[0].get_facecolor()) == "#ff0000"
+        assert shared._ax._matplotly_bar_info[0]["color"] == "#ff0000"
+        plt.close(fig)
+
+    def test_first_change_rebuilds(self):
+        fig, shared = self._shared("vertical")
+        before = list(shared._panels[0]._group.artists)
+        shared._bar_width = 0.3
+        shared._reposition_bars()
+        assert shared._panels[0]._group.artists[0] is not before[0]
+        plt.close(fig)
+
+
+class TestBarStyleCallbacks:
+
+    def setup_method(self):
+        self.fig, self.ax = plt.subplots()
+        self.ax.bar(['A', 'B', 'C'], [10, 20, 15], alpha=0.5)
+        self.canvas = MagicMock()
+        groups = FigureIntrospector(self.fig).introspect()
+        self.panels, _ = _make_bar_panels(
+            groups, self.fig, self.canvas, CommandStack())
+        self.panels[0]._toggle_btn.click()  # controls are built on expand
+
+    def teardown_method(self):
+        plt.close(self.fig)
+
+    def _slider(self, description):
+        boxes = list(self.panels[0]._controls_box.children)
+        while boxes:
+            w = boxes.pop(0)
+            if getattr(w, "description", None) == description:
+                return w
+            boxes.extend(getattr(w, "children", ()))
+        raise LookupError(description)
+
+    def test_controls_built_on_first_expand(self):
+        groups = FigureIntrospector(self.fig).introspect()
+        panels, _ = _make_bar_panels(groups, self.fig, MagicMock(),
+                                     CommandStack())
+        bp = panels[0]
+        assert bp._controls_box.children == ()
+        bp._update_color("#ff0000")  # colormap hook before any expand
+        bp._toggle_btn.click()
+        children = bp._controls_box.children
+        assert children
+        bp._toggle_btn.click()
+        bp._toggle_btn.click()
+        assert bp._controls_box.children is children
+        assert "#ff0000" in bp._color_indicator.value
+
+    def test_shared_swatches_follow_opening_button(self):
+        """One swatch strip serves both colors: whichever button opened it."""
+        children = self.panels[0]._controls_box.children
+        face_btn = children[1].children[1]
+        edge_btn = children[2].children[1]
+        swatch = children[3].children[0].children[0]
+        bars = self.panels[0]._group.artists
+        edge_btn.click()
+        swatch.click()
+        assert edge_btn.style.button_color == swatch.style.button_color
+        assert _rgba_hex(bars[0].get_edgecolor()) == swatch.style.button_color
+        face_btn.click()
+        children[3].children[0].children[3].click()
+        assert _rgba_hex(bars[0].get_facecolor()) == \
+            children[3].children[0].children[3].style.button_color
+
+    def test_picker_scrub_rebuilds_legend_once(self, monkeypatch):
+        import asyncio
+        import ipywidgets as widgets
+        from matplotly.panels import _bar
+        calls = []
+        monkeypatch.setattr(_bar, "_refresh_legend", calls.append)
+        strip = self.panels[0]._controls_box.children[3].children[0]
+        picker = next(w for w in strip.children
+                      if isinstance(w, widgets.ColorPicker))
+
+        async def scrub():
+            for c in ("#110000", "#220000", "#330000"):
+                picker.value = c
+            await asyncio.sleep(0.3)
+
+        asyncio.run(scrub())
+        assert len(calls) == 1
+        assert _rgba_hex(self.panels[0]._group.artists[0].get_facecolor()) \
+            == "#330000"
+
+    def test_extra_swatches_built_on_first_expand(self):
+        strip = self.panels[0]._controls_box.children[3]
+        main_row, extra_row = strip.children
+        expand = main_row.children[10]
+        assert extra_row.children == ()
+        expand.click()
+        extras = extra_row.children
+        assert len(extras) == 10
+        expand.click()
+        expand.click()
+        assert extra_row.children == extras
+        extras[0].click()
+        assert self.panels[0]._color == extras[0].style.button_color
+
+    def test_face_color_recolors_errorbars_in_place(self):
+        bp = self.panels[0]
+        bp._show_errorbars = True
+        bp._draw_bar_errorbars()
+        eb = bp._current_eb
+        children = bp._controls_box.children
+        children[1].children[1].click()  # open the palette for face
+        swatch = children[3].children[0].children[2]
+        swatch.click()
+        assert bp._current_eb is eb
+        assert _rgba_hex(eb[2][0].get_color()[0]) == swatch.style.button_color
+        info = self.ax._matplotly_bar_info[0]
+        assert info["errbar_color"] == swatch.style.button_color
+
+    def test_value_already_on_bars_skips_redraw(self):
+        """Moving a slider to what every bar already has changes nothing."""
+        bars = self.panels[0]._group.artists
+        for p in bars:
+            p.set_alpha(0.8)
+        self.canvas.reset_mock()
+        alpha = self._slider("Alpha:")
+        alpha.value = 0.8
+        self.canvas.force_redraw.assert_not_called()
+        alpha.value = 0.3
+        assert all(p.get_alpha() == 0.3 for p in bars)
+        self.canvas.force_redraw.assert_called_once()
+
+    def test_hatch_already_on_bars_skips_redraw(self):
+        for p in self.panels[0]._group.artists:
+            p.set_hatch("x")
+        self.canvas.reset_mock()
+        self._slider("Hatch:").value = "x"
+        self.canvas.force_redraw.assert_not_called()
+
+    def test_slider_burst_renders_once(self):
+        """Edge width and alpha moved together flush as one update."""
+        import asyncio
+        bars = self.panels[0]._group.artists
+        edge, alpha = self._slider("Edge w:"), self._slider("Alpha:")
+        self.canvas.reset_mock()
+
+        async def drag():
+            for v in (0.5, 1.0, 1.5):
+                edge.value = v
+                alpha.value = v / 2
+            await asyncio.sleep(0.2)
+
+        asyncio.run(drag())
+        assert all(p.get_linewidth() == 1.5 for p in bars)
+        assert all(p.get_alpha() == 0.75 for p in bars)
+        self.canvas.force_redraw.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# UniformBatchCommand
+# ---------------------------------------------------------------------------
+
+class TestUniformBatchCommand:
+
+    def test_execute_undo_redo(self):
+        fig, ax = plt.subplots()
+        bars = list(ax.bar([0, 1, 2], [1, 2, 3], linewidth=1.0))
+        bars[1].set_linewidth(2.0)
+        stack = CommandStack()
+        cmd = UniformBatchCommand.capture(bars, "linewidth", 4.0, "Edge width")
+        assert cmd.old_values == [1.0, 2.0, 1.0]
+        stack.execute(cmd)
+        assert [b.get_linewidth() for b in bars] == [4.0, 4.0, 4.0]
+        stack.undo()
+        assert [b.get_linewidth() for b in bars] == [1.0, 2.0, 1.0]
+        stack.redo()
+        assert [b.get_linewidth() for b in bars] == [4.0, 4.0, 4.0]
+        plt.close(fig)
+
+
+class TestCommandStack:
+
+    def test_max_depth_drops_oldest(self):
+        fig, ax = plt.subplots()
+        line, = ax.plot([0, 1])
+        stack = CommandStack(max_depth=3)
+        for lw in (1.0, 2.0, 3.0, 4.0, 5.0):
+            stack.execute(UniformBatchCommand.capture([line], "linewidth", lw))
+        assert len(stack.history) == 3
+        while stack.can_undo:
+            stack.undo()
+        assert line.get_linewidth() == 2.0
+        plt.close(fig)
+
+    def test_drag_collapses_to_one_undo_step(self):
+        fig, ax = plt.subplots()
+        line, = ax.plot([0, 1], linewidth=1.0)
+        stack = CommandStack()
+        for lw in (1.5, 2.0, 2.5):
+            stack.execute(UniformBatchCommand.capture([line], "linewidth", lw),
+                          merge_key=(id(line), "linewidth"))
+        stack.execute(UniformBatchCommand.capture([line], "alpha", 0.5),
+                      merge_key=(id(line), "alpha"))
+        assert len(stack.history) == 2
+        stack.undo()
+        stack.undo()
+        assert line.get_linewidth() == 1.0
+        stack.redo()
+        assert line.get_linewidth() == 2.5
+        plt.close(fig)
+
+    def test_continues_only_for_matching_key(self):
+        fig, ax = plt.subplots()
+        line, = ax.plot([0, 1])
+        stack = CommandStack()
+        key = (id(line), "linewidth")
+        assert not stack.continues(key)
+        stack.execute(UniformBatchCommand.capture([line], "linewidth", 2.0),
+                      merge_key=key)
+        assert stack.continues(key)
+        assert not stack.continues((id(line), "alpha"))
+        stack.undo()
+        assert not stack.continues(key)
+        plt.close(fig)
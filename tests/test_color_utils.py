@@ -0,0 +1,45 @@
+"""Tests for palette helpers in matplotly.panels._color_utils.
+
+Run:  python -m pytest tests/test_color_utils.py -v
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")  # headless backend
+
+import pytest
+from matplotlib.colors import to_hex
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from matplotly.panels import _color_utils as cu
+
+
+class TestPaletteColors:
+
+    @pytest.mark.parametrize("name", ["tab10", "Set1", "viridis", "bwr"])
+    @pytest.mark.parametrize("n", [1, 10, 20])
+    def test_matches_per_color_sampling(self, name, n):
+        cmap = matplotlib.colormaps.get_cmap(name)
+        expected = [to_hex(cu._cmap_color(cmap, i, n)) for i in range(n)]
+        assert cu._get_palette_colors(name, n) == expected
+
+    def test_unknown_name_falls_back_to_tab10(self):
+        assert (cu._get_palette_colors("no-such-cmap", 10)
+                == cu._get_palette_colors("tab10", 10))
+
+    def test_cached_per_name_and_size(self):
+        cu._palette_colors.cache_clear()
+        cu._get_palette_colors("viridis", 10)
+        cu._get_palette_colors("viridis", 10)
+        cu._get_palette_colors("viridis", 20)
+        info = cu._palette_colors.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+    def test_returned_list_is_a_copy(self):
+        colors = cu._get_palette_colors("tab10", 10)
+        colors[0] = "#000000"
+        assert cu._get_palette_colors("tab10", 10)[0] == "#1f77b4"
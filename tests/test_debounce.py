@@ -0,0 +1,78 @@
+"""Tests for matplotly.panels._debounce.
+
+Run:  python -m pytest tests/test_debounce.py -v
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from matplotly.panels._debounce import debounced, throttled
+
+
+class TestDebounced:
+
+    def test_burst_runs_once_with_last_value(self):
+        calls = []
+        cb = debounced(calls.append, wait=0.02)
+
+        async def drag():
+            for v in range(10):
+                cb(v)
+                await asyncio.sleep(0.001)
+            await asyncio.sleep(0.05)
+
+        asyncio.run(drag())
+        assert calls == [9]
+
+    def test_separate_bursts_each_fire(self):
+        calls = []
+        cb = debounced(calls.append, wait=0.01)
+
+        async def two_bursts():
+            cb(1)
+            await asyncio.sleep(0.03)
+            cb(2)
+            await asyncio.sleep(0.03)
+
+        asyncio.run(two_bursts())
+        assert calls == [1, 2]
+
+    def test_without_event_loop_calls_through(self):
+        calls = []
+
+        @debounced(wait=10)
+        def cb(v):
+            calls.append(v)
+
+        cb(1)
+        cb(2)
+        assert calls == [1, 2]
+
+
+class TestThrottled:
+
+    def test_burst_runs_first_and_last(self):
+        calls = []
+        cb = throttled(calls.append, interval=0.05)
+
+        async def scrub():
+            for v in range(10):
+                cb(v)
+                await asyncio.sleep(0.001)
+            await asyncio.sleep(0.1)
+
+        asyncio.run(scrub())
+        assert calls[0] == 0
+        assert calls[-1] == 9
+        assert len(calls) < 10
+
+    def test_without_event_loop_calls_through(self):
+        calls = []
+        cb = throttled(calls.append, interval=10)
+        cb(1)
+        cb(2)
+        assert calls == [1, 2]
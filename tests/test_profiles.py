@@ -0,0 +1,253 @@
+"""Tests for profile storage helpers in matplotly._profiles.
+
+Run:  python -m pytest tests/test_profiles.py -v
+"""
+from __future__ import annotations
+
+import contextlib
+import os
+import sys
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")  # headless backend
+
+import matplotlib.pyplot as plt
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from matplotly import _profiles
+
+
+@pytest.fixture
+def profiles_dir(tmp_path, monkeypatch):
+    """Point PROFILES_DIR at a temp dir and reset module-level caches."""
+    d = tmp_path / "profiles"
+    monkeypatch.setattr(_profiles, "PROFILES_DIR", d)
+    monkeypatch.setattr(_profiles, "_LIST_CACHE", None)
+    return d
+
+
+class TestSaveProfile:
+
+    def test_round_trip(self, profiles_dir):
+        data = {"font_family": "Arial", "title_size": 12.0}
+        path = _profiles._save_profile("paper", data)
+        assert path == profiles_dir / "paper.json"
+        assert _profiles._read_profile("paper") == data
+        assert not list(profiles_dir.glob("*.tmp"))
+
+    def test_non_ascii_round_trips_as_utf8(self, profiles_dir):
+        data = {"font_family": "Hélvetica"}
+        path = _profiles._save_profile("p", data)
+        assert "Hélvetica".encode("utf-8") in path.read_bytes()
+        assert _profiles._read_profile("p") == data
+
+    def test_failed_write_leaves_no_temp_file(self, profiles_dir,
+                                              monkeypatch):
+        _profiles._save_profile("p", {"grid_on": True})
+
+        def fail(src, dst):
+            raise OSError("disk full")
+        monkeypatch.setattr(_profiles.os, "replace", fail)
+        with pytest.raises(OSError):
+            _profiles._save_profile("p", {"grid_on": False})
+        assert _profiles._read_profile("p") == {"grid_on": True}
+        assert sorted(p.name for p in profiles_dir.iterdir()) == ["p.json"]
+
+    def test_unchanged_snapshot_skips_write(self, profiles_dir):
+        data = {"grid_on": True}
+        path = _profiles._save_profile("p", data)
+        os.utime(path, ns=(0, 0))
+        _profiles._save_profile("p", data)
+        assert path.stat().st_mtime_ns == 0
+
+    def test_save_overwrites_external_edit(self, profiles_dir):
+        data = {"grid_on": True}
+        path = _profiles._save_profile("p", data)
+        path.write_text('{"grid_on": false}')  # another kernel / editor
+        _profiles._save_profile("p", data)
+        assert _profiles._read_profile("p") == data
+
+    def test_changed_snapshot_is_written(self, profiles_dir):
+        _profiles._save_profile("p", {"grid_on": True})
+        _profiles._save_profile("p", {"grid_on": False})
+        assert _profiles._read_profile("p") == {"grid_on": False}
+
+    def test_delete_then_save_rewrites(self, profiles_dir):
+        data = {"grid_on": True}
+        _profiles._save_profile("p", data)
+        _profiles._delete_profile("p")
+        assert "p" not in _profiles._list_profiles()
+        _profiles._save_profile("p", data)
+        assert _profiles._list_profiles() == ["p"]
+
+
+class TestListProfiles:
+
+    def test_sorted_names(self, profiles_dir):
+        for name in ("b", "a", "c"):
+            _profiles._save_profile(name, {})
+        assert _profiles._list_profiles() == ["a", "b", "c"]
+
+    def test_cached_until_directory_changes(self, profiles_dir, monkeypatch):
+        _profiles._save_profile("a", {})
+        assert _profiles._list_profiles() == ["a"]
+        calls = []
+        orig_scandir = os.scandir
+        monkeypatch.setattr(
+            _profiles.os, "scandir", lambda p: calls.append(p) or orig_scandir(p))
+        assert _profiles._list_profiles() == ["a"]
+        assert calls == []
+
+    def test_external_file_is_picked_up(self, profiles_dir):
+        _profiles._save_profile("a", {})
+        assert _profiles._list_profiles() == ["a"]
+        (profiles_dir / "z.json").write_text("{}")
+        # Pin a distinct directory mtime so the check in _list_profiles,
+        # not filesystem timestamp granularity, decides the rescan
+        mtime = os.stat(profiles_dir).st_mtime_ns + 1_000_000_000
+        os.utime(profiles_dir, ns=(mtime, mtime))
+        assert _profiles._list_profiles() == ["a", "z"]
+
+    def test_missing_directory_is_created(self, profiles_dir):
+        assert not profiles_dir.exists()
+        assert _profiles._list_profiles() == []
+        assert profiles_dir.is_dir()
+
+    def test_returned_list_is_a_copy(self, profiles_dir):
+        _profiles._save_profile("a", {})
+        _profiles._list_profiles().append("bogus")
+        assert _profiles._list_profiles() == ["a"]
+
+
+class _W:
+    """Stand-in for an ipywidget: just a settable ``value``."""
+
+    def __init__(self, value, options=None):
+        self.value = value
+        if options is not None:
+            self.options = options
+
+    def hold_trait_notifications(self):
+        return contextlib.nullcontext()
+
+
+class _Canvas:
+
+    def __init__(self):
+        self.forced = 0
+
+    def redraw(self):
+        raise AssertionError("redraw should be suppressed during apply")
+
+    def force_redraw(self):
+        self.forced += 1
+
+
+def _fake_global_panel():
+    class GP:
+        pass
+    gp = GP()
+    gp._font_dd = _W("Arial", options=["Arial", "Helvetica"])
+    gp._title_size_sl = _W(12.04)
+    gp._grid_alpha_sl = _W(0.333)
+    gp._x_step = _W(0.123456)
+    gp._xscale_dd = _W("linear")
+    gp._legend_pos_dd = _W("best", options=[("Best", "best"), ("Upper right", "upper right")])
+    gp._legend_ncol = _W(1)
+    gp._cmap_panel = None
+    return gp
+
+
+class TestSnapshotApply:
+
+    def test_snapshot_rounds_and_skips_missing_widgets(self):
+        data = _profiles.snapshot_from_global(_fake_global_panel())
+        assert data == {
+            "font_family": "Arial", "title_size": 12.0, "grid_alpha": 0.33,
+            "x_tick_step": 0.1235, "x_scale": "linear",
+            "legend_position": "best", "legend_columns": 1,
+        }
+
+    def test_snapshot_includes_background_color(self):
+        gp = _fake_global_panel()
+        gp._fig = plt.figure()
+        gp._fig.set_facecolor("#eeeeee")
+        assert _profiles.snapshot_from_global(gp)["background_color"] == "#eeeeee"
+        gp._fig.set_facecolor("none")
+        assert _profiles.snapshot_from_global(gp)["background_color"] == "none"
+        plt.close(gp._fig)
+
+    def test_snapshot_bold_round_trips(self):
+        gp, canvas = _fake_global_panel(), _Canvas()
+        gp._fig, ax = plt.subplots()
+        ax.set_title("t")
+        _profiles.apply_profile({"title_bold": True, "label_bold": False},
+                                gp, canvas)
+        data = _profiles.snapshot_from_global(gp)
+        plt.close(gp._fig)
+        assert data["title_bold"] is True
+        assert data["label_bold"] is False
+
+    def test_apply_sets_values_and_validates(self):
+        gp, canvas = _fake_global_panel(), _Canvas()
+        gp._fig = plt.figure()
+        _profiles.apply_profile({
+            "font_family": "Comic Sans", "title_size": 16.0,
+            "x_scale": "bogus", "legend_position": "upper right",
+            "legend_columns": 9, "spine_top": False,
+        }, gp, canvas)
+        plt.close(gp._fig)
+        assert gp._font_dd.value == "Comic Sans"
+        assert gp._font_dd.options[0] == "Comic Sans"
+        assert gp._title_size_sl.value == 16.0
+        assert gp._xscale_dd.value == "linear"
+        assert gp._legend_pos_dd.value == "upper right"
+        assert gp._legend_ncol.value == 1
+        assert canvas.forced == 1
+
+    def test_observers_fire_once_after_all_assignments(self):
+        import ipywidgets as widgets
+        gp, canvas = _fake_global_panel(), _Canvas()
+        gp._fig = plt.figure()
+        gp._title_size_sl = widgets.FloatSlider(value=12.0, max=40.0)
+        gp._label_size_sl = widgets.FloatSlider(value=10.0, max=40.0)
+        seen = []
+
+        def record(change):
+            seen.append((change["owner"].description,
+                         gp._title_size_sl.value, gp._label_size_sl.value))
+        gp._title_size_sl.description = "title"
+        gp._label_size_sl.description = "label"
+        gp._title_size_sl.observe(record, names="value")
+        gp._label_size_sl.observe(record, names="value")
+
+        _profiles.apply_profile({"title_size": 18.0, "label_size": 14.0},
+                                gp, canvas)
+        plt.close(gp._fig)
+        assert sorted(seen) == [("label", 18.0, 14.0), ("title", 18.0, 14.0)]
+
+    def test_every_field_round_trips(self):
+        def full_panel(seed):
+            class GP:
+                pass
+            gp = GP()
+            for i, (key, attr, _) in enumerate(_profiles._FIELDS):
+                setattr(gp, attr, _W(seed + i))
+            gp._font_dd = _W(f"font{seed}", options=["font1", "font2"])
+            gp._xscale_dd = gp._yscale_dd = _W("linear")
+            gp._legend_pos_dd = _W("best", options=[("Best", "best")])
+            gp._legend_ncol = _W(1 + seed)
+            gp._cmap_panel = None
+            gp._fig = plt.figure()
+            return gp
+
+        src, dst = full_panel(1), full_panel(2)
+        data = _profiles.snapshot_from_global(src)
+        assert {k for k, _, _ in _profiles._FIELDS} <= set(data)
+        _profiles.apply_profile(data, dst, _Canvas())
+        assert _profiles.snapshot_from_global(dst) == data
+        plt.close(src._fig)
+        plt.close(dst._fig)
@@ -0,0 +1,103 @@
+"""Tests for matplotly._renderer.CanvasManager.
+
+Run:  python -m pytest tests/test_renderer.py -v
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")  # headless backend
+
+import io
+
+import matplotlib.pyplot as plt
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from matplotly._renderer import CanvasManager
+
+
+@pytest.fixture
+def canvas(monkeypatch):
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    cm = CanvasManager(fig)
+    renders = []
+    monkeypatch.setattr(cm, "_render", lambda: renders.append(cm._layout_dirty))
+    yield cm, renders
+    plt.close(fig)
+
+
+class TestHold:
+
+    def test_collapses_forced_redraws_into_one(self, canvas):
+        cm, renders = canvas
+        with cm.hold():
+            cm.force_redraw(layout=False)
+            with cm.hold():
+                cm.force_redraw(layout=False)
+            cm.redraw(layout=False)
+            assert renders == []
+        assert renders == [False]
+
+    def test_layout_request_survives_hold(self, canvas):
+        cm, renders = canvas
+        cm._layout_dirty = False
+        with cm.hold():
+            cm.redraw(layout=True)
+        assert renders == [True]
+
+    def test_no_request_no_render(self, canvas):
+        cm, renders = canvas
+        with cm.hold():
+            pass
+        assert renders == []
+
+
+class TestViewGating:
+
+    def test_skips_render_once_views_close(self):
+        fig, ax = plt.subplots()
+        cm = CanvasManager(fig)
+        cm._output._view_count = 1
+        cm._output._view_count = 0
+        png = cm._last_png
+        ax.set_facecolor("red")
+        cm.force_redraw()
+        assert cm._last_png is png
+        cm._output._view_count = 1  # view reopened: skipped render runs
+        assert cm._last_png is not png
+        plt.close(fig)
+
+    def test_renders_if_views_never_reported(self):
+        fig, ax = plt.subplots()
+        cm = CanvasManager(fig)
+        png = cm._last_png
+        ax.set_facecolor("red")
+        cm.force_redraw()
+        assert cm._last_png != png
+        plt.close(fig)
+
+
+class TestCachedBbox:
+
+    @pytest.mark.parametrize("dpi", [72, 100, 150, 200])
+    def test_matches_savefig_tight_at_any_figure_dpi(self, dpi):
+        fig, ax = plt.subplots(dpi=dpi)
+        ax.plot([0, 1], [0, 1], label="a long legend label")
+        ax.legend(loc="upper left", bbox_to_anchor=(1.02, 1))
+        ax.set_title("Title")
+        cm = CanvasManager(fig)
+        cm._bbox = None
+        cm.force_redraw()
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", bbox_inches="tight",
+                    bbox_extra_artists=[ax.get_legend()], pad_inches=0.15,
+                    facecolor=fig.get_facecolor(), edgecolor="none",
+                    dpi=cm._RENDER_DPI, pil_kwargs=dict(cm._PNG_OPTIONS))
+        assert cm._last_png == buf.getvalue()
+        assert fig.dpi == dpi
+        plt.close(fig)